@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Command and Database Benchmarks for CyberBot
+
+Drives the slash command callbacks with fake interactions against a local
+storage backend (no Discord or MongoDB needed) and reports latency
+percentiles and throughput per command at several collection sizes.
+
+    python -m benchmarks.bench_commands --sizes 10 1000 100000 --output bench.json
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+
+# Keep stdout clean for the JSON report if anything prints on import
+with contextlib.redirect_stdout(sys.stderr):
+    from bot.utils import db, Config
+    from bot.utils.dates import start_of_today
+    from bot.utils.storage import StorageBackend, create_backend
+    from bot.cogs.events import Events
+    from bot.cogs.facts import Facts
+    from bot.cogs.help import Help
+    from benchmarks.fakes import FakeBot, FakeGuild, FakeInteraction
+
+DEFAULT_SIZES = [10, 1000, 100000]
+# Every seeded event and benchmarked command belongs to this one server
+BENCH_GUILD = FakeGuild()
+
+
+def make_backend(name: str) -> StorageBackend:
+    if name == "sqlite":
+        # In-memory SQLite keeps fsync out of the numbers
+        Config.SQLITE_PATH = ":memory:"
+    return create_backend(name)
+
+
+async def seed(size: int) -> None:
+    """Fill the current backend with ``size`` upcoming events and ``size`` facts."""
+    today = start_of_today()
+    for i in range(size):
+        await db.backend.add_event({
+            "title": f"Benchmark Event {i}",
+            "date": today + timedelta(days=i % 365, minutes=i),
+            "description": f"Seeded event number {i} for benchmarking",
+            "guild_id": BENCH_GUILD.id,
+            "created_by": 0,
+            "created_at": today.isoformat(),
+        })
+    await db.backend.add_facts([f"Benchmark fact #{i}: rotate your credentials." for i in range(size)])
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def measure(fn: Callable[[], Awaitable[Any]], iterations: int, warmup: int) -> Dict[str, float]:
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "mean_ms": sum(samples) / len(samples),
+        "p50_ms": percentile(samples, 50),
+        "p90_ms": percentile(samples, 90),
+        "p99_ms": percentile(samples, 99),
+        "max_ms": samples[-1],
+        "throughput_ops": iterations / elapsed if elapsed else 0.0,
+    }
+
+
+def build_cases(events: Events, facts: Facts, help_cog: Help) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    """Map case names to zero-argument coroutines that run one operation."""
+
+    def command(cog, cmd):
+        async def run():
+            await cmd.callback(cog, FakeInteraction(guild=BENCH_GUILD))
+        return run
+
+    async def uncached(fn):
+        ttl = db.events_cache.ttl
+        db.events_cache.ttl = 0
+        try:
+            await fn()
+        finally:
+            db.events_cache.ttl = ttl
+
+    sm_events = command(events, events.list_events)
+    return {
+        "sm_events": sm_events,
+        "sm_events_uncached": lambda: uncached(sm_events),
+        "sm_fact": command(facts, facts.cyberfact),
+        "sm_listfacts": command(facts, facts.listfacts),
+        "sm_help": command(help_cog, help_cog.help_command),
+        "db.get_events_uncached": lambda: uncached(lambda: db.get_events(BENCH_GUILD.id)),
+        "db.get_random_fact": db.get_random_fact,
+        "db.get_all_facts": db.get_all_facts,
+        "db.search_facts": lambda: db.search_facts("rotate credentials"),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    bot = FakeBot()
+    events, facts, help_cog = Events(bot), Facts(bot), Help(bot)
+    cases = build_cases(events, facts, help_cog)
+    selected = args.cases or list(cases)
+
+    results = []
+    try:
+        for size in args.sizes:
+            await db.connect(make_backend(args.backend))
+            await db.ensure_indexes()
+            t0 = time.perf_counter()
+            await seed(size)
+            print(f"Seeded {size} events and facts in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+            for name in selected:
+                stats = await measure(cases[name], args.iterations, args.warmup)
+                results.append({"case": name, "size": size, **stats})
+                print(
+                    f"  {name:<24} size={size:<7} p50={stats['p50_ms']:.3f}ms "
+                    f"p99={stats['p99_ms']:.3f}ms {stats['throughput_ops']:.0f} ops/s",
+                    file=sys.stderr
+                )
+    finally:
+        facts.cog_unload()
+        await db.close()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "backend": args.backend,
+            "iterations": args.iterations,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark CyberBot command handlers and the database layer")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Collection sizes to seed")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed iterations per case")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed iterations per case")
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory", help="Storage backend to run against")
+    parser.add_argument("--cases", nargs="+", help="Only run these cases")
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    # ...or while cogs and backends are set up
+    with contextlib.redirect_stdout(sys.stderr):
+        report = asyncio.run(run_benchmarks(args))
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Memory Benchmark for CyberBot
+
+Loads simulated guilds into discord.py's cache the way the gateway would
+deliver them under each MEMORY_PROFILE, and reports the process RSS. Each
+profile and guild count runs in a fresh subprocess so results don't bleed
+into each other.
+
+    python -m benchmarks.bench_memory --guilds 100 1000 --output memory.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+
+DEFAULT_GUILDS = [100, 1000]
+BOT_ID = 1 << 40
+MB = 1024 * 1024
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size, or None if this platform can't report it."""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current RSS; kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def user_payload(user_id: int) -> Dict[str, Any]:
+    return {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0", "avatar": None, "global_name": None}
+
+
+def member_payload(user_id: int) -> Dict[str, Any]:
+    return {"user": user_payload(user_id), "roles": [], "joined_at": "2024-01-01T00:00:00+00:00",
+            "deaf": False, "mute": False, "flags": 0}
+
+
+def guild_payload(guild_id: int, members: int, channels: int, with_members: bool) -> Dict[str, Any]:
+    """A GUILD_CREATE payload. Without the members intent Discord only sends the bot's own member."""
+    member_ids = range(guild_id * 10_000, guild_id * 10_000 + members) if with_members else []
+    return {
+        "id": str(guild_id),
+        "name": f"Guild {guild_id}",
+        "owner_id": str(guild_id * 10_000),
+        "member_count": members,
+        "large": members > 250,
+        "roles": [{"id": str(guild_id), "name": "@everyone", "permissions": "104324673", "position": 0,
+                   "color": 0, "hoist": False, "managed": False, "mentionable": False}],
+        "channels": [{"id": str(guild_id * 1000 + c), "type": 0, "name": f"channel-{c}", "position": c,
+                      "permission_overwrites": []} for c in range(channels)],
+        "members": [member_payload(BOT_ID)] + [member_payload(uid) for uid in member_ids],
+    }
+
+
+def message_payload(message_id: int, guild_id: int, channel_id: int) -> Dict[str, Any]:
+    return {
+        "id": str(message_id), "channel_id": str(channel_id), "guild_id": str(guild_id),
+        "author": user_payload(guild_id * 10_000), "content": "gg, well played " * 4,
+        "timestamp": "2024-01-01T00:00:00+00:00", "edited_timestamp": None, "tts": False,
+        "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [],
+        "embeds": [], "pinned": False, "type": 0,
+    }
+
+
+async def measure(profile: str, guilds: int, members: int, channels: int, messages: int) -> Dict[str, Any]:
+    import discord
+    from bot.utils import Config
+
+    Config.MEMORY_PROFILE = profile
+    from bot.bot import CyberBot
+
+    bot = CyberBot()
+    state = bot._connection
+    state.user = discord.ClientUser(state=state, data=user_payload(BOT_ID))
+    intents = bot.intents
+
+    gc.collect()
+    before = rss_bytes()
+    for g in range(1, guilds + 1):
+        guild = state._add_guild_from_data(guild_payload(g, members, channels, intents.members))
+        # Only delivered with the guild messages intent, and kept only if there is a message cache
+        if intents.guild_messages and state._messages is not None:
+            channel = guild.text_channels[0]
+            for m in range(messages):
+                state._messages.append(discord.Message(
+                    state=state, channel=channel, data=message_payload(g * 100_000 + m, g, channel.id)
+                ))
+    gc.collect()
+    after = rss_bytes()
+
+    await bot.close()
+    return {
+        "profile": profile,
+        "guilds": guilds,
+        "members_per_guild": members,
+        "cached_members": sum(len(guild.members) for guild in bot.guilds),
+        "cached_messages": len(bot.cached_messages),
+        "rss_before_mb": round(before / MB, 1) if before is not None else None,
+        "rss_after_mb": round(after / MB, 1) if after is not None else None,
+        "rss_delta_mb": round((after - before) / MB, 1) if before is not None and after is not None else None,
+    }
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    with contextlib.redirect_stdout(sys.stderr):
+        result = asyncio.run(measure(args.profile, args.guilds[0], args.members, args.channels, args.messages))
+    print(json.dumps(result))
+
+
+def run_all(args: argparse.Namespace) -> Dict[str, Any]:
+    from bot.utils.config import MEMORY_PROFILES
+
+    results: List[Dict[str, Any]] = []
+    for profile in args.profiles or MEMORY_PROFILES:
+        for guilds in args.guilds:
+            cmd = [
+                sys.executable, "-m", "benchmarks.bench_memory", "--worker",
+                "--profile", profile, "--guilds", str(guilds),
+                "--members", str(args.members), "--channels", str(args.channels), "--messages", str(args.messages),
+            ]
+            output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            results.append(result)
+            print(
+                f"  {profile:<9} guilds={guilds:<6} members={result['cached_members']:<8} "
+                f"messages={result['cached_messages']:<5} rss={result['rss_after_mb']}MB (+{result['rss_delta_mb']}MB)",
+                file=sys.stderr
+            )
+
+    from benchmarks.bench_commands import git_commit
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "members_per_guild": args.members,
+            "channels_per_guild": args.channels,
+            "messages_per_guild": args.messages,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure CyberBot's cache memory under each MEMORY_PROFILE")
+    parser.add_argument("--guilds", type=int, nargs="+", default=DEFAULT_GUILDS, help="Simulated guild counts")
+    parser.add_argument("--members", type=int, default=100, help="Members per guild")
+    parser.add_argument("--channels", type=int, default=10, help="Text channels per guild")
+    parser.add_argument("--messages", type=int, default=20, help="Messages received per guild")
+    parser.add_argument("--profiles", nargs="+", help="Only run these memory profiles")
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--profile", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    if args.worker:
+        run_worker(args)
+        return
+    payload = json.dumps(run_all(args), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
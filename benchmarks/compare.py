@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files produced by ``benchmarks.bench_commands``.
+
+    python -m benchmarks.compare before.json after.json --threshold 10
+
+Exits with status 1 if any case's p50 regressed by more than ``--threshold``
+percent, so it can gate a CI job.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Tuple
+
+
+def load(path: str) -> Tuple[dict, Dict[Tuple[str, int], dict]]:
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return report["meta"], {(r["case"], r["size"]): r for r in report["results"]}
+
+
+def change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two CyberBot benchmark runs")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed p50 regression in percent")
+    args = parser.parse_args(argv)
+
+    old_meta, old = load(args.baseline)
+    new_meta, new = load(args.candidate)
+    print(f"{old_meta['commit']} -> {new_meta['commit']}")
+    print(f"{'case':<24} {'size':>7} {'p50 ms':>18} {'p99 ms':>18} {'ops/s':>8}")
+
+    regressions = 0
+    for key in sorted(old.keys() & new.keys()):
+        a, b = old[key], new[key]
+        p50 = change(a["p50_ms"], b["p50_ms"])
+        p99 = change(a["p99_ms"], b["p99_ms"])
+        ops = change(a["throughput_ops"], b["throughput_ops"])
+        flag = ""
+        if p50 > args.threshold:
+            regressions += 1
+            flag = "  <-- regression"
+        print(
+            f"{key[0]:<24} {key[1]:>7} "
+            f"{b['p50_ms']:>9.3f} ({p50:+6.1f}%) {b['p99_ms']:>9.3f} ({p99:+6.1f}%) {ops:+7.1f}%{flag}"
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Minimal stand-ins for the discord objects the cogs touch.
+
+Only the attributes the command handlers read are implemented. Sent embeds
+are serialized with ``to_dict()`` so the cost of building the payload is
+part of every measurement, as it would be against the real gateway.
+"""
+
+import asyncio
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import discord
+
+_ids = itertools.count(1_000_000)
+
+
+class FakeUser:
+    def __init__(self, name: str = "bench-user"):
+        self.id = next(_ids)
+        self.name = name
+        self.display_name = name
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class FakeGuild:
+    def __init__(self, name: str = "bench-guild"):
+        self.id = next(_ids)
+        self.name = name
+
+
+class FakeResponse:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def send_message(self, content: Optional[str] = None, *, embed=None, ephemeral: bool = False, **kwargs: Any) -> None:
+        if self._done:
+            raise RuntimeError("Interaction has already been responded to")
+        self._done = True
+        self._interaction.sent.append(embed.to_dict() if embed is not None else content)
+
+    async def defer(self, **kwargs: Any) -> None:
+        self._done = True
+
+    async def edit_message(self, *, embed=None, **kwargs: Any) -> None:
+        self._done = True
+        self._interaction.sent.append(embed.to_dict() if embed is not None else None)
+
+
+class FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, content: Optional[str] = None, *, embed=None, **kwargs: Any) -> None:
+        self._interaction.sent.append(embed.to_dict() if embed is not None else content)
+
+
+class FakeInteraction:
+    def __init__(self, user: Optional[FakeUser] = None, guild: Optional[FakeGuild] = None):
+        self.user = user or FakeUser()
+        self.guild = guild or FakeGuild()
+        self.guild_id = self.guild.id
+        self.created_at = datetime.now(timezone.utc)
+        self.command = None
+        self.type = discord.InteractionType.application_command
+        self.extras: Dict[Any, Any] = {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.sent: List[Any] = []
+        self.deleted = False
+
+    async def original_response(self) -> "FakeInteraction":
+        return self
+
+    async def edit(self, **kwargs: Any) -> None:
+        pass
+
+    async def edit_original_response(self, *, embed=None, **kwargs: Any) -> None:
+        self.sent.append(embed.to_dict() if embed is not None else None)
+
+    async def delete_original_response(self) -> None:
+        self.deleted = True
+
+
+class FakeBot:
+    """Enough of commands.Bot for cogs to be constructed outside a gateway session."""
+
+    def __init__(self):
+        self.guilds: List[FakeGuild] = []
+        self._ready = asyncio.Event()
+
+    def owns_guild(self, guild: FakeGuild) -> bool:
+        return True
+
+    async def wait_until_ready(self) -> None:
+        await self._ready.wait()
@@ -7,4 +7,4 @@ submodules such as bot.utils.database.
 
 # Export name for ease of discovery; consumers should import directly from
 # bot.bot (e.g., `from bot.bot import CyberBot`).
-__all__ = ['CyberBot']
+__all__ = ['CyberBot', 'ShardedCyberBot', 'create_bot']
@@ -1,86 +1,298 @@
-import os
-import sys
-import asyncio
-import discord
-from discord.ext import commands, tasks
-from discord import app_commands
-from dotenv import load_dotenv
-
-# Load environment variables from the project root and override shell values
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-load_dotenv(os.path.join(PROJECT_ROOT, ".env"), override=True)
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from bot.utils import Config
-from bot.utils.database import db
-
-class CyberBot(commands.Bot):
-    def __init__(self):
-        intents = discord.Intents.default()
-        # Enable privileged intents (must be enabled in Discord Developer Portal)
-        intents.message_content = True
-        intents.members = True
-        
-        super().__init__(
-            command_prefix=Config.DEFAULT_PREFIX,
-            intents=intents,
-            activity=discord.Activity(
-                type=discord.ActivityType.watching,
-                name="for /sm_help"
-            )
-        )
-        
-        self.initial_extensions = [
-            'bot.cogs.events',
-            'bot.cogs.facts',
-            'bot.cogs.help'
-        ]
-        
-        # Track whether commands have been synced to avoid duplicate syncs
-        self._synced = False
-    
-    async def on_ready(self):
-        print(f'Logged in as {self.user} (ID: {self.user.id})')
-        print(f'Bot is in {len(self.guilds)} server(s)')
-        print('Available commands:')
-        for command in self.tree.get_commands():
-            print(f'  /{command.name} - {command.description}')
-        print('------')
-        print('Bot is ready! Slash commands may take a few minutes to appear in Discord.')
-        
-        # Sync application commands once when the bot becomes ready
-        if not self._synced:
-            synced = await self.tree.sync()
-            print(f"Commands synced! Total: {len(synced)} commands")
-            for cmd in synced:
-                print(f'  - Synced: /{cmd.name}')
-            self._synced = True
-    
-    async def on_app_command_completion(self, interaction: discord.Interaction, command: app_commands.Command):
-        print(f'Command used: /{command.name} by {interaction.user} in {interaction.guild.name if interaction.guild else "DM"}')
-
-async def main():
-    # Verify configuration
-    Config.verify_config()
-    
-    # Create bot instance
-    bot = CyberBot()
-    
-    # Initialize database and load extensions before starting the bot
-    await db.client.admin.command('ping')
-    print("Connected to MongoDB!")
-    for ext in bot.initial_extensions:
-        try:
-            await bot.load_extension(ext)
-            print(f"Loaded extension: {ext}")
-        except Exception as e:
-            print(f"Failed to load extension {ext}: {e}")
-    
-    # Start the bot
-    await bot.start(Config.TOKEN)
-
-if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+import time
+# Taken before the imports below so the startup report includes them
+PROCESS_STARTED = time.perf_counter()
+
+import os
+import sys
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+import discord
+from discord.ext import commands
+from discord import app_commands
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Config loads .env itself
+from bot.utils import Config
+from bot.utils.database import db
+from bot.utils.command_sync import sync_commands
+from bot.utils.embeds import rate_limited_embed, starting_up_embed, storage_unavailable_embed
+from bot.utils.startup import StartupTimer
+from bot.utils.metrics import COMMAND_LATENCY, COMMAND_ERRORS, COMMAND_THROTTLED, count_discord_rate_limits, start_metrics_server
+from bot.utils.logs import COMMAND_LOGGER, parse_levels, setup_logging
+from bot.utils.ratelimit import get_rate_limiter
+from bot.utils.responses import has_replied, interaction_age, respond
+from bot.utils.storage import StorageUnavailable
+
+log = logging.getLogger(__name__)
+command_log = logging.getLogger(COMMAND_LOGGER)
+
+startup = StartupTimer(PROCESS_STARTED)
+startup.record("imports", PROCESS_STARTED)
+
+class CyberCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        is_command = interaction.type is discord.InteractionType.application_command
+        # The gateway connects while the database bootstrap (index builds,
+        # migrations) is still running. Waiting for it could outlast Discord's
+        # reply window, so early commands are turned away at once instead
+        if not db.ready:
+            if is_command:
+                await respond(interaction, embed=starting_up_embed(), ephemeral=True)
+            return False
+        # Throttled commands get a single ephemeral notice and never run
+        # (autocomplete requests are not counted)
+        if is_command and interaction.command is not None:
+            name = interaction.command.qualified_name
+            retry_after, scope = get_rate_limiter().acquire(name, interaction.user.id, interaction.guild_id)
+            if retry_after:
+                COMMAND_THROTTLED.inc(name, scope)
+                await respond(interaction, embed=rate_limited_embed(retry_after), ephemeral=True)
+                return False
+        return True
+    
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        # Runs after the command's own error handler, so only count here
+        name = interaction.command.qualified_name if interaction.command else "unknown"
+        COMMAND_LATENCY.observe(interaction_age(interaction), name, "error")
+        original = getattr(error, "original", error)
+        COMMAND_ERRORS.inc(name, type(original).__name__)
+        # Commands without their own handler (/sm_events, /sm_fact) still get
+        # the read-only notice when even their snapshot can't serve them
+        if isinstance(original, StorageUnavailable) and not has_replied(interaction):
+            await respond(interaction, embed=storage_unavailable_embed(), ephemeral=True)
+            return
+        await super().on_error(interaction, error)
+
+def client_options(profile: str) -> Dict[str, Any]:
+    """Gateway intents and cache settings for a MEMORY_PROFILE.
+    
+    "standard" keeps the privileged member and message content intents with
+    discord.py's default caches. "low" subscribes to guild events only (no
+    cog reads member lists or message content), caches no members besides
+    the bot's own, skips member chunking at startup and keeps no message
+    cache; slash commands, channel permissions and daily facts still work.
+    """
+    if profile == "low":
+        intents = discord.Intents.none()
+        intents.guilds = True
+        return {
+            "intents": intents,
+            "member_cache_flags": discord.MemberCacheFlags.none(),
+            "chunk_guilds_at_startup": False,
+            "max_messages": None
+        }
+    intents = discord.Intents.default()
+    # Enable privileged intents (must be enabled in Discord Developer Portal)
+    intents.message_content = True
+    intents.members = True
+    return {"intents": intents}
+
+class CyberBotMixin:
+    """Setup shared by the single-connection and sharded bots."""
+    
+    def __init__(self, **kwargs):
+        super().__init__(
+            command_prefix=Config.DEFAULT_PREFIX,
+            **client_options(Config.MEMORY_PROFILE),
+            activity=discord.Activity(
+                type=discord.ActivityType.watching,
+                name="for /sm_help"
+            ),
+            tree_cls=CyberCommandTree,
+            **kwargs
+        )
+        
+        self.initial_extensions = [
+            'bot.cogs.events',
+            'bot.cogs.facts',
+            'bot.cogs.settings',
+            'bot.cogs.help'
+        ]
+        
+        # Track whether commands have been synced to avoid duplicate syncs
+        self._synced = False
+        # Cold-start timing, reported once after the first READY
+        self.startup: Optional[StartupTimer] = None
+        self.connect_started: Optional[float] = None
+    
+    async def load_extensions(self) -> None:
+        """Load every initial extension concurrently; one failing doesn't stop the rest."""
+        results = await asyncio.gather(
+            *(self.load_extension(ext) for ext in self.initial_extensions),
+            return_exceptions=True
+        )
+        for ext, result in zip(self.initial_extensions, results):
+            if isinstance(result, Exception):
+                log.error("Failed to load extension %s: %s", ext, result, extra={"extension": ext})
+            else:
+                log.info("Loaded extension: %s", ext, extra={"extension": ext})
+    
+    @property
+    def is_primary(self) -> bool:
+        """True for the one process that owns shard 0 (or an unsharded bot).
+        
+        Global work such as syncing the command tree happens only here, so a
+        cluster of processes doesn't repeat it once per process.
+        """
+        shard_ids = getattr(self, "shard_ids", None)
+        return not shard_ids or 0 in shard_ids
+    
+    def owns_guild(self, guild: discord.Guild) -> bool:
+        """True if one of this process's shards serves ``guild``."""
+        shard_ids = getattr(self, "shard_ids", None)
+        if not shard_ids or not self.shard_count or self.shard_count <= 1:
+            return True
+        return (guild.id >> 22) % self.shard_count in shard_ids
+    
+    async def on_ready(self):
+        log.info(
+            "Logged in as %s (ID: %s), in %d server(s)", self.user, self.user.id, len(self.guilds),
+            extra={"guilds": len(self.guilds), "commands": [c.name for c in self.tree.get_commands()]}
+        )
+        if self.startup is not None and self.connect_started is not None:
+            self.startup.record("gateway ready", self.connect_started)
+        
+        # The sync state lives in storage, which may still be bootstrapping
+        await db.wait_ready()
+        
+        # Sync application commands once when the bot becomes ready, and only
+        # if they changed since the last sync
+        if not self._synced and self.is_primary:
+            sync_started = time.perf_counter()
+            result = await sync_commands(self.tree, self.application_id, force=Config.FORCE_COMMAND_SYNC)
+            if result.synced:
+                log.info(
+                    "Commands synced! Total: %d commands in %.2fs", result.count, result.duration,
+                    extra={"tree_hash": result.tree_hash}
+                )
+            else:
+                saved = f", saved ~{result.saved:.2f}s" if result.saved is not None else ""
+                log.info(
+                    "Command tree unchanged (%s); skipped sync%s", result.tree_hash[:12], saved,
+                    extra={"tree_hash": result.tree_hash, "saved_seconds": result.saved}
+                )
+            self._synced = True
+            if self.startup is not None:
+                self.startup.record("command sync", sync_started)
+        
+        if self.startup is not None:
+            log.info(self.startup.report(), extra={"startup": self.startup.as_dict()})
+            self.startup = None
+    
+    async def on_shard_ready(self, shard_id: int):
+        log.info("Shard %d ready", shard_id, extra={"shard_id": shard_id})
+    
+    async def on_app_command_completion(self, interaction: discord.Interaction, command: app_commands.Command):
+        COMMAND_LATENCY.observe(interaction_age(interaction), command.qualified_name, "ok")
+        command_log.info(
+            "Command used: /%s", command.qualified_name,
+            extra={"command": command.qualified_name, "user_id": interaction.user.id, "guild_id": interaction.guild_id}
+        )
+
+class CyberBot(CyberBotMixin, commands.Bot):
+    """Single gateway connection; fine until Discord requires sharding."""
+
+class ShardedCyberBot(CyberBotMixin, commands.AutoShardedBot):
+    """Runs several shards over one process's event loop."""
+
+def create_bot() -> commands.Bot:
+    """Build the bot described by SHARD_COUNT / SHARD_IDS."""
+    sharded, shard_count, shard_ids = Config.sharding()
+    if not sharded:
+        return CyberBot()
+    return ShardedCyberBot(shard_count=shard_count, shard_ids=shard_ids)
+
+async def prepare_storage():
+    """Build indexes and run data migrations; needs a connected db."""
+    created = await db.ensure_indexes()
+    if created:
+        log.info("Created indexes: %s", ", ".join(created))
+    else:
+        log.info("Indexes up to date")
+    migrated = await db.migrate_event_dates()
+    if migrated["converted"] or migrated["failed"]:
+        log.warning("Migrated event dates: %d converted, %d unparseable", migrated["converted"], migrated["failed"])
+    scoped = await db.migrate_event_guilds(Config.LEGACY_EVENTS_GUILD_ID)
+    if scoped["moved"]:
+        log.info("Moved %d legacy event(s) to guild %s", scoped["moved"], Config.LEGACY_EVENTS_GUILD_ID)
+    if scoped["unscoped"]:
+        log.warning(
+            "%d event(s) predate per-guild boards and belong to no server; "
+            "set LEGACY_EVENTS_GUILD_ID to move them (titles the server already uses stay behind)",
+            scoped["unscoped"]
+        )
+
+async def bootstrap_database(prepare: bool = True):
+    """Connect to storage and bring it up to date, then open it to commands.
+    
+    A cluster launcher prepares storage once for every worker, so its
+    workers pass ``prepare=False``.
+    """
+    await db.connect()
+    log.info("Connected to %s storage!", db.backend.name)
+    if prepare:
+        await prepare_storage()
+    configured = await db.load_guild_settings()
+    log.info("Loaded settings for %d guild(s)", configured)
+    db.mark_ready()
+
+async def run_gateway(bot: commands.Bot):
+    """Log in, load extensions and hold the gateway connection until shutdown."""
+    await asyncio.gather(
+        startup.track("login", bot.login(Config.TOKEN)),
+        startup.track("extensions", bot.load_extensions())
+    )
+    bot.connect_started = time.perf_counter()
+    await bot.connect()
+
+async def main(prepare: bool = True):
+    log_listener = setup_logging(
+        Config.LOG_LEVEL, parse_levels(Config.LOG_LEVELS), Config.LOG_FORMAT, Config.COMMAND_LOG_SAMPLE_RATE
+    )
+    try:
+        await run_bot(prepare)
+    finally:
+        log_listener.stop()
+
+async def run_bot(prepare: bool = True):
+    # Verify configuration
+    Config.verify_config()
+    
+    # Create bot instance
+    bot = create_bot()
+    bot.startup = startup
+    if bot.shard_count:
+        shards = bot.shard_ids or range(bot.shard_count)
+        log.info("Running shards %s of %d", ", ".join(map(str, shards)), bot.shard_count)
+    log.info("Memory profile: %s", Config.MEMORY_PROFILE)
+    
+    # The database bootstrap runs alongside login and the gateway handshake;
+    # commands and on_ready wait for it through db.wait_ready()
+    metrics_server = None
+    if Config.metrics_port():
+        count_discord_rate_limits()
+        metrics_server = await start_metrics_server(Config.METRICS_HOST, Config.metrics_port())
+    
+    async with bot:
+        tasks = [
+            asyncio.ensure_future(startup.track("database", bootstrap_database(prepare))),
+            asyncio.ensure_future(run_gateway(bot))
+        ]
+        try:
+            # Runs until shutdown, or until either side fails
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await db.close()
+            if metrics_server is not None:
+                await metrics_server.cleanup()
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(main())
@@ -0,0 +1,192 @@
+"""Run the bot's shards across several processes.
+
+    python -m bot.cluster
+
+Splits SHARD_COUNT shards (or Discord's recommended count when it is
+"auto" or unset) into CLUSTER_PROCESSES contiguous ranges and runs each
+range as its own worker process with an AutoShardedBot. Every worker has
+its own database connection and caches; the caches' TTLs bound how long a
+change made through one worker takes to show up in another. Crashed
+workers are restarted with exponential backoff.
+
+Indexes and data migrations run once, in the launcher, before any worker
+starts. Workers are started one identify window apart per batch of
+shards Discord lets the bot identify at once (max_concurrency), so they
+don't all hit the identify rate limit together.
+"""
+import argparse
+import asyncio
+import logging
+import math
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import aiohttp
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot.utils import Config
+from bot.utils.logs import parse_levels, setup_logging
+
+log = logging.getLogger(__name__)
+
+GATEWAY_BOT_URL = "https://discord.com/api/v10/gateway/bot"
+# Restart delays for a crashed worker: 1s, 2s, 4s ... capped at a minute
+RESTART_BACKOFF = 1.0
+MAX_RESTART_BACKOFF = 60.0
+# A worker that stays up this long has its backoff reset
+STABLE_AFTER = 300.0
+# Discord allows max_concurrency IDENTIFYs per this many seconds
+IDENTIFY_WINDOW = 5.0
+
+
+def split_shards(shard_count: int, processes: int) -> List[List[int]]:
+    """Split shards 0..shard_count-1 into at most ``processes`` contiguous ranges."""
+    processes = max(1, min(processes, shard_count))
+    base, extra = divmod(shard_count, processes)
+    ranges, start = [], 0
+    for i in range(processes):
+        size = base + (1 if i < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+async def gateway_limits(token: str) -> Tuple[int, int]:
+    """Ask Discord how many shards this bot should run, and how many may identify at once."""
+    headers = {"Authorization": f"Bot {token}"}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(GATEWAY_BOT_URL, headers=headers) as resp:
+            resp.raise_for_status()
+            data = await resp.json()
+    return int(data["shards"]), int(data["session_start_limit"]["max_concurrency"])
+
+
+def identify_time(shards: int, max_concurrency: int) -> float:
+    """Seconds ``shards`` shards take to identify, ``max_concurrency`` per window."""
+    return math.ceil(shards / max_concurrency) * IDENTIFY_WINDOW
+
+
+async def prepare_storage() -> None:
+    """Build indexes and run migrations once, so workers don't each repeat them."""
+    from bot.bot import db, prepare_storage as prepare
+
+    await db.connect()
+    try:
+        await prepare()
+    finally:
+        await db.close()
+
+
+def _format_ids(shard_ids: List[int]) -> str:
+    return f"{shard_ids[0]}-{shard_ids[-1]}"
+
+
+def _spawn(index: int, shard_count: int, shard_ids: List[int]) -> subprocess.Popen:
+    # Shard settings go on the command line, not the environment, because
+    # the worker reloads .env with override=True
+    metrics_port = Config.metrics_port() + index if Config.metrics_port() else 0
+    return subprocess.Popen([
+        sys.executable, "-m", "bot.cluster", "--worker",
+        "--shard-count", str(shard_count),
+        "--shard-ids", _format_ids(shard_ids),
+        "--metrics-port", str(metrics_port)
+    ])
+
+
+def run_launcher() -> None:
+    Config.verify_config()
+    _, shard_count, _ = Config.sharding()
+    recommended, max_concurrency = asyncio.run(gateway_limits(Config.TOKEN))
+    if shard_count is None:
+        shard_count = recommended
+        log.info("Discord recommends %d shard(s)", shard_count)
+    processes = Config.CLUSTER_PROCESSES or os.cpu_count() or 1
+    ranges = split_shards(shard_count, processes)
+
+    asyncio.run(prepare_storage())
+    log.info(
+        "Starting %d worker(s) for %d shard(s), %d identify at a time",
+        len(ranges), shard_count, max_concurrency
+    )
+
+    workers: Dict[int, subprocess.Popen] = {}
+    started: Dict[int, float] = {}
+    backoff: Dict[int, float] = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    try:
+        for i, shard_ids in enumerate(ranges):
+            if stopping:
+                break
+            workers[i] = _spawn(i, shard_count, shard_ids)
+            started[i] = time.monotonic()
+            backoff[i] = RESTART_BACKOFF
+            log.info("Worker %d (pid %d): shards %s", i, workers[i].pid, _format_ids(shard_ids))
+            # Let this worker's shards identify before the next one starts on its own
+            if i < len(ranges) - 1:
+                time.sleep(identify_time(len(shard_ids), max_concurrency))
+        while not stopping:
+            time.sleep(1)
+            for i, proc in workers.items():
+                code = proc.poll()
+                if code is None or stopping:
+                    continue
+                if time.monotonic() - started[i] >= STABLE_AFTER:
+                    backoff[i] = RESTART_BACKOFF
+                log.warning("Worker %d exited with code %s; restarting in %.0fs", i, code, backoff[i])
+                time.sleep(backoff[i])
+                backoff[i] = min(backoff[i] * 2, MAX_RESTART_BACKOFF)
+                workers[i] = _spawn(i, shard_count, ranges[i])
+                started[i] = time.monotonic()
+    finally:
+        log.info("Stopping workers...")
+        for proc in workers.values():
+            if proc.poll() is None:
+                proc.terminate()
+        for proc in workers.values():
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+def run_worker(shard_count: int, shard_ids: str, metrics_port: int) -> None:
+    from bot.bot import main
+
+    Config.SHARD_COUNT = str(shard_count)
+    Config.SHARD_IDS = shard_ids
+    Config.METRICS_PORT = str(metrics_port)
+    # The launcher handles Ctrl+C; let it terminate us instead of both reacting
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # The launcher already built indexes and ran migrations
+    asyncio.run(main(prepare=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the bot as a cluster of shard processes")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--shard-count", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--shard-ids", help=argparse.SUPPRESS)
+    parser.add_argument("--metrics-port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(args.shard_count, args.shard_ids, args.metrics_port)
+    else:
+        listener = setup_logging(Config.LOG_LEVEL, parse_levels(Config.LOG_LEVELS), Config.LOG_FORMAT)
+        try:
+            run_launcher()
+        finally:
+            listener.stop()
@@ -1,282 +1,495 @@
-import discord
-from discord.ext import commands
-from discord import app_commands
-from bot.utils import db
-
-CHESS_GREEN = discord.Color.from_rgb(29, 185, 84)
-CHESS_SYMBOLS = ["♟️", "♙", "♜", "♖", "♞", "♘", "♝", "♗", "♛", "♕", "♚", "♔"]
-CHESS_BOARD_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Chess_board_opening_staunton.png/320px-Chess_board_opening_staunton.png"
-
-class Events(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-
-    @app_commands.command(name="sm_events", description="List all upcoming Shellmates events")
-    async def list_events(self, interaction: discord.Interaction):
-        """Display the chessboard of upcoming events"""
-        events = await db.get_events()
-        if not events:
-            embed = discord.Embed(
-                title="♚ Empty events board ♚",
-                description="*The board is clear... No events are scheduled yet.*\n\nUse `/sm_addevent` to plan the first event!",
-                color=CHESS_GREEN
-            )
-            embed.set_thumbnail(url=CHESS_BOARD_URL)
-            embed.set_footer(text="♟️ The pieces await your command ♟️")
-            await interaction.response.send_message(embed=embed)
-            return
-        
-        embed = discord.Embed(
-            title="♛ events board: Upcoming Shellmates Events ♛",
-            description="*Strategic planning ahead! Schedule your participation wisely.*\n\u200b",
-            color=CHESS_GREEN
-        )
-        embed.set_thumbnail(url=CHESS_BOARD_URL)
-        embed.set_footer(text="♜ Check your schedule and join the events! ♜")
-        
-        toggle_index = 0
-        for event in events:
-            symbol = CHESS_SYMBOLS[toggle_index % len(CHESS_SYMBOLS)]
-            toggle_index += 1
-            
-            field_value = (
-                f"🏁 **Event Date:** {event['date']}\n"
-                f"📜 **Event Description:** {event['description']}\n"
-                f"⬆️ **Position:** {toggle_index} on the event list"
-            )
-            
-            embed.add_field(
-                name=f"{symbol} Event Title: {event['title']}",  # Changed this line
-                value=field_value,
-                inline=False
-            )
-        
-        await interaction.response.send_message(embed=embed)
-
-    @app_commands.command(name="sm_addevent", description="Add a new Shellmates event (Admin only)")
-    @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(
-        title="Title of the event",
-        day="Day of the event (1-31)",
-        month="Month of the event (1-12)", 
-        year="Year of the event (2024 or later)",
-        description="Description of the event"
-    )
-    async def add_event(self, interaction: discord.Interaction, title: str, day: int, month: int, year: int, description: str):
-        """Place a new event on the chessboard"""
-        # Validate date inputs
-        if day < 1 or day > 31:
-            embed = discord.Embed(
-                title="❌ Invalid Day ❌",
-                description="*Day must be between 1 and 31!*\n\nPlease enter a valid day.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Check your date format ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        if month < 1 or month > 12:
-            embed = discord.Embed(
-                title="❌ Invalid Month ❌",
-                description="*Month must be between 1 and 12!*\n\nPlease enter a valid month.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Check your date format ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        if year < 2024:
-            embed = discord.Embed(
-                title="❌ Invalid Year ❌",
-                description="*Year must be 2024 or later!*\n\nPlease enter a valid year.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Check your date format ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        # Additional validation for day-month combinations
-        if month in [4, 6, 9, 11] and day > 30:  # Months with 30 days
-            embed = discord.Embed(
-                title="❌ Invalid Date ❌",
-                description=f"*Month {month} only has 30 days!*\n\nPlease enter a valid day.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Check your date format ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        if month == 2:  # February
-            # Simple leap year check
-            is_leap_year = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-            max_feb_days = 29 if is_leap_year else 28
-            
-            if day > max_feb_days:
-                embed = discord.Embed(
-                    title="❌ Invalid Date ❌",
-                    description=f"*February {year} only has {max_feb_days} days!*\n\nPlease enter a valid day.",
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text="♜ Check your date format ♜")
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-        
-        # Format the date as DD/MM/YYYY
-        formatted_date = f"{day:02d}/{month:02d}/{year}"
-        
-        event_data = {
-            'title': title,
-            'date': formatted_date,  # Now using the formatted date
-            'description': description,
-            'created_by': interaction.user.id,
-            'created_at': interaction.created_at.isoformat()
-        }
-        await db.add_event(event_data)
-        
-        embed = discord.Embed(
-            title=f"🎯♞ New Event Added: {title} ♞🎯",
-            description="*A new event appears on the chessboard!*",
-            color=CHESS_GREEN
-        )
-        embed.add_field(name="📅 Event Date", value=f"🗓️ {formatted_date}", inline=True)
-        embed.add_field(name="📋 Event Details", value=f"📝 {description}", inline=True)
-        embed.add_field(name="👑 Organizer", value=f"🎖️ {interaction.user.display_name}", inline=True)
-        embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Chess_klt45.svg/800px-Chess_klt45.svg.png")
-        embed.set_footer(text="♛ Prepare for the event! ♛")
-        await interaction.response.send_message(embed=embed)
-
-    @app_commands.command(name="sm_removeevent", description="Remove a Shellmates event (Admin only)")
-    @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(title="Title of the event to remove")
-    async def remove_event(self, interaction: discord.Interaction, title: str):
-        """Remove an event from the sevents board"""
-        removed = await db.remove_event(title)
-        if removed:
-            embed = discord.Embed(
-                title="♟️ Event Removed ♟️",
-                description=f"*The event **'{title}'** has been removed from the board.*",
-                color=CHESS_GREEN
-            )
-            embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Chess_piece_-_White_king.jpg/320px-Chess_piece_-_White_king.jpg")
-            embed.set_footer(text="♚ The board evolves with each move ♚")
-            await interaction.response.send_message(embed=embed)
-        else:
-            embed = discord.Embed(
-                title="❌ Event Not Found ❌",
-                description=f"*No event found with the title: **{title}***\n\nCheck the event name and try again.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Verify the event title ♜")
-            await interaction.response.send_message(embed=embed)
-
-    @app_commands.command(name="sm_clearevents", description="Clear all Shellmates events (Admin only)")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def clear_events(self, interaction: discord.Interaction):
-        """Clear all events from the chessboard"""
-        await db.clear_events()
-        embed = discord.Embed(
-            title="♛ Board Cleared ♛",
-            description="*All events have been cleared from the board...*\n\nThe chessboard now awaits new event planning.",
-            color=CHESS_GREEN
-        )
-        embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Chess_board.svg/320px-Chess_board.svg.png")
-        embed.set_footer(text="♞ A fresh start for new events ♞")
-        await interaction.response.send_message(embed=embed)
-
-    @app_commands.command(
-        name="sm_modifyevent", 
-        description="Modify an existing Shellmates event (Admin only)"
-    )
-    @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(
-        title="Title of the event you want to modify",
-        new_title="New title for the event (leave empty to keep current)",
-        new_date="New date for the event (leave empty to keep current)", 
-        new_description="New description for the event (leave empty to keep current)"
-    )
-    async def modify_event(self, interaction: discord.Interaction, title: str, 
-                         new_title: str = None, new_date: str = None, new_description: str = None):
-        """Modify an event on the chessboard"""
-        # Check if at least one field is being modified
-        if new_title is None and new_date is None and new_description is None:
-            embed = discord.Embed(
-                title="❌ Modification Error ❌",
-                description="*You must adjust at least one aspect of the event!*\n\nModify the title, date, or description to make your changes.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♝ A true planner always adapts ♝")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-        
-        # Call the database function to modify the event
-        updated_event = await db.modify_event(
-            title,
-            new_title=new_title,
-            new_date=new_date, 
-            new_description=new_description
-        )
-        
-        if updated_event:
-            embed = discord.Embed(
-                title=f"♚ Event Updated: {updated_event['title']} ♚",
-                description="*Your event has been successfully modified!*",
-                color=CHESS_GREEN
-            )
-            
-            # Show what was changed
-            changes = []
-            if new_title is not None:
-                changes.append(f"**🏷️ Event Title:** {title} → {new_title}")
-            if new_date is not None:
-                changes.append(f"**⏰ Event Date:** Schedule adjusted")
-            if new_description is not None:
-                changes.append(f"**📋 Event Details:** Description updated")
-            
-            if changes:
-                embed.add_field(
-                    name="📊 Modifications Made",
-                    value="\n".join(changes),
-                    inline=False
-                )
-            
-            embed.add_field(name="🗓️ Current Date", value=f"📅 {updated_event['date']}", inline=True)
-            embed.add_field(name="📜 Current Description", value=f"📝 {updated_event['description']}", inline=True)
-            embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/f/f0/Chess_kdl45.svg/800px-Chess_kdl45.svg.png")
-            embed.set_footer(text="♛ Adaptability is the mark of a great organizer ♛")
-            
-            await interaction.response.send_message(embed=embed)
-        else:
-            embed = discord.Embed(
-                title="❌ Event Not Found ❌",
-                description=f"*No event found with the name: **{title}***\n\nCheck the event list and try again.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Verify the event name ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    @add_event.error
-    @remove_event.error
-    @modify_event.error
-    @clear_events.error
-    async def event_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
-        """Error handler for event commands with chess theme"""
-        if isinstance(error, app_commands.MissingPermissions):
-            embed = discord.Embed(
-                title="🚫 Access Denied 🚫",
-                description="*You lack the permissions to manage events!*\n\nOnly administrators may organize these events.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♚ Admin privileges required ♚")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        else:
-            embed = discord.Embed(
-                title="💥 Operation Failed 💥",
-                description=f"*An unexpected error occurred:*\n\n`{str(error)}`",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Try again later ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
-async def setup(bot):
-    """Setup the Events Command Center"""
+import asyncio
+import functools
+import logging
+import discord
+from typing import Literal
+from discord.ext import commands
+from discord import app_commands
+from bot.utils import db, Config
+from bot.utils import bulk
+from bot.utils.database import EVENTS_PAGE_SIZE, event_cursor
+from bot.utils.dates import DATE_FORMAT, EventDateError, event_date_from_text, format_event_date, make_event_date, utcnow
+from bot.utils.embeds import import_report_embed, import_too_large_embed, render_cache, storage_unavailable_embed
+from bot.utils.fanout import announcement_channels, fan_out
+from bot.utils.pagination import KeysetPaginator
+from bot.utils.responses import auto_defer, respond
+from bot.utils.storage import DuplicateError, StorageUnavailable
+
+CHESS_GREEN = discord.Color.from_rgb(29, 185, 84)
+CHESS_SYMBOLS = ["♟️", "♙", "♜", "♖", "♞", "♘", "♝", "♗", "♛", "♕", "♚", "♔"]
+CHESS_BOARD_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Chess_board_opening_staunton.png/320px-Chess_board_opening_staunton.png"
+log = logging.getLogger(__name__)
+
+# EventDateError.field -> (embed title, what to re-enter)
+DATE_ERRORS = {
+    "day": ("Invalid Day", "day"),
+    "month": ("Invalid Month", "month"),
+    "year": ("Invalid Year", "year"),
+    "date": ("Invalid Date", "day"),
+}
+
+class Events(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        # Static embeds are built once and reused for every send
+        self.empty_board_embed = self._build_empty_board()
+        self._reminder_task = None
+
+    async def cog_load(self):
+        if Config.EVENT_REMINDER_HOURS:
+            self._reminder_task = asyncio.create_task(self.run_reminders())
+
+    async def cog_unload(self):
+        """Stop the reminder task when the cog is unloaded"""
+        if self._reminder_task is not None:
+            self._reminder_task.cancel()
+
+    @app_commands.command(name="sm_events", description="List all upcoming Shellmates events")
+    @app_commands.guild_only()
+    @auto_defer()
+    async def list_events(self, interaction: discord.Interaction):
+        """Display the chessboard of upcoming events"""
+        paginator = KeysetPaginator(
+            fetch=functools.partial(db.get_events_page, interaction.guild_id),
+            cursor_of=event_cursor,
+            render=self._render_board,
+            page_size=EVENTS_PAGE_SIZE,
+            owner_id=interaction.user.id,
+            cache=render_cache,
+            namespace=f"events_board:{interaction.guild_id}",
+            version=functools.partial(db.events_version, interaction.guild_id)
+        )
+        if not await paginator.load_first_page():
+            await respond(interaction, embed=self.empty_board_embed)
+            return
+        
+        await paginator.send(interaction)
+
+    def _build_empty_board(self):
+        embed = discord.Embed(
+            title="♚ Empty events board ♚",
+            description="*The board is clear... No events are scheduled yet.*\n\nUse `/sm_addevent` to plan the first event!",
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        embed.set_footer(text="♟️ The pieces await your command ♟️")
+        return embed
+
+    def _render_board(self, events, page):
+        """Build the embed for one page of the events board"""
+        embed = discord.Embed(
+            title="♛ events board: Upcoming Shellmates Events ♛",
+            description="*Strategic planning ahead! Schedule your participation wisely.*\n\u200b",
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        embed.set_footer(text=f"♜ Check your schedule and join the events! ♜ • Page {page + 1}")
+        
+        toggle_index = page * EVENTS_PAGE_SIZE
+        for event in events:
+            symbol = CHESS_SYMBOLS[toggle_index % len(CHESS_SYMBOLS)]
+            toggle_index += 1
+            
+            field_value = (
+                f"🏁 **Event Date:** {format_event_date(event['date'])}\n"
+                f"📜 **Event Description:** {event['description']}\n"
+                f"⬆️ **Position:** {toggle_index} on the event list"
+            )
+            
+            embed.add_field(
+                name=f"{symbol} Event Title: {event['title']}",  # Changed this line
+                value=field_value,
+                inline=False
+            )
+        
+        return embed
+
+    def _date_error_embed(self, error: EventDateError) -> discord.Embed:
+        title_text, hint = DATE_ERRORS[error.field]
+        embed = discord.Embed(
+            title=f"❌ {title_text} ❌",
+            description=f"*{error}*\n\nPlease enter a valid {hint}.",
+            color=discord.Color.red()
+        )
+        embed.set_footer(text="♜ Check your date format ♜")
+        return embed
+
+    @app_commands.command(name="sm_addevent", description="Add a new Shellmates event (Admin only)")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        title="Title of the event",
+        day="Day of the event (1-31)",
+        month="Month of the event (1-12)", 
+        year="Year of the event (2024 or later)",
+        description="Description of the event"
+    )
+    @auto_defer()
+    async def add_event(self, interaction: discord.Interaction, title: str, day: int, month: int, year: int, description: str):
+        """Place a new event on the chessboard"""
+        # Validate date inputs (the same rules apply to /sm_modifyevent and /sm_importevents)
+        try:
+            # Store a real datetime so the board sorts and range-queries correctly
+            event_date = make_event_date(day, month, year)
+        except EventDateError as e:
+            await respond(interaction, embed=self._date_error_embed(e), ephemeral=True)
+            return
+        
+        formatted_date = event_date.strftime(DATE_FORMAT)
+        
+        event_data = {
+            'title': title,
+            'date': event_date,
+            'description': description,
+            'guild_id': interaction.guild_id,
+            'created_by': interaction.user.id,
+            'created_at': interaction.created_at.isoformat()
+        }
+        try:
+            await db.add_event(event_data)
+        except DuplicateError:
+            embed = discord.Embed(
+                title="❌ Event Already Exists ❌",
+                description=f"*An event titled **{title}** is already on the board!*\n\nChoose a different title or modify the existing event.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Each event needs a unique title ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title=f"🎯♞ New Event Added: {title} ♞🎯",
+            description="*A new event appears on the chessboard!*",
+            color=CHESS_GREEN
+        )
+        embed.add_field(name="📅 Event Date", value=f"🗓️ {formatted_date}", inline=True)
+        embed.add_field(name="📋 Event Details", value=f"📝 {description}", inline=True)
+        embed.add_field(name="👑 Organizer", value=f"🎖️ {interaction.user.display_name}", inline=True)
+        embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Chess_klt45.svg/800px-Chess_klt45.svg.png")
+        embed.set_footer(text="♛ Prepare for the event! ♛")
+        await respond(interaction, embed=embed)
+
+    @app_commands.command(name="sm_removeevent", description="Remove a Shellmates event (Admin only)")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(title="Title of the event to remove")
+    @auto_defer()
+    async def remove_event(self, interaction: discord.Interaction, title: str):
+        """Remove an event from the sevents board"""
+        removed = await db.remove_event(interaction.guild_id, title)
+        if removed:
+            embed = discord.Embed(
+                title="♟️ Event Removed ♟️",
+                description=f"*The event **'{title}'** has been removed from the board.*",
+                color=CHESS_GREEN
+            )
+            embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Chess_piece_-_White_king.jpg/320px-Chess_piece_-_White_king.jpg")
+            embed.set_footer(text="♚ The board evolves with each move ♚")
+            await respond(interaction, embed=embed)
+        else:
+            embed = discord.Embed(
+                title="❌ Event Not Found ❌",
+                description=f"*No event found with the title: **{title}***\n\nCheck the event name and try again.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Verify the event title ♜")
+            await respond(interaction, embed=embed)
+
+    @app_commands.command(name="sm_clearevents", description="Clear all Shellmates events (Admin only)")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer()
+    async def clear_events(self, interaction: discord.Interaction):
+        """Clear all events from the chessboard"""
+        await db.clear_events(interaction.guild_id)
+        embed = discord.Embed(
+            title="♛ Board Cleared ♛",
+            description="*All events have been cleared from the board...*\n\nThe chessboard now awaits new event planning.",
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/d/da/Chess_board.svg/320px-Chess_board.svg.png")
+        embed.set_footer(text="♞ A fresh start for new events ♞")
+        await respond(interaction, embed=embed)
+
+    @app_commands.command(
+        name="sm_modifyevent", 
+        description="Modify an existing Shellmates event (Admin only)"
+    )
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        title="Title of the event you want to modify",
+        new_title="New title for the event (leave empty to keep current)",
+        new_date="New date for the event (leave empty to keep current)", 
+        new_description="New description for the event (leave empty to keep current)"
+    )
+    @auto_defer()
+    async def modify_event(self, interaction: discord.Interaction, title: str, 
+                         new_title: str = None, new_date: str = None, new_description: str = None):
+        """Modify an event on the chessboard"""
+        # Check if at least one field is being modified
+        if new_title is None and new_date is None and new_description is None:
+            embed = discord.Embed(
+                title="❌ Modification Error ❌",
+                description="*You must adjust at least one aspect of the event!*\n\nModify the title, date, or description to make your changes.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♝ A true planner always adapts ♝")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+        
+        # Parse the free-form date into the same type, checked by the same rules, as add_event
+        parsed_date = None
+        if new_date is not None:
+            try:
+                parsed_date = event_date_from_text(new_date)
+            except EventDateError as e:
+                await respond(interaction, embed=self._date_error_embed(e), ephemeral=True)
+                return
+            except ValueError:
+                embed = discord.Embed(
+                    title="❌ Invalid Date ❌",
+                    description=f"*Could not understand the date **{new_date}**!*\n\nGive the day, month and year, like DD/MM/YYYY.",
+                    color=discord.Color.red()
+                )
+                embed.set_footer(text="♜ Check your date format ♜")
+                await respond(interaction, embed=embed, ephemeral=True)
+                return
+        
+        # Call the database function to modify the event
+        try:
+            updated_event = await db.modify_event(
+                interaction.guild_id,
+                title,
+                new_title=new_title,
+                new_date=parsed_date, 
+                new_description=new_description
+            )
+        except DuplicateError:
+            embed = discord.Embed(
+                title="❌ Event Already Exists ❌",
+                description=f"*An event titled **{new_title}** is already on the board!*\n\nChoose a different title.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Each event needs a unique title ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+        
+        if updated_event:
+            embed = discord.Embed(
+                title=f"♚ Event Updated: {updated_event['title']} ♚",
+                description="*Your event has been successfully modified!*",
+                color=CHESS_GREEN
+            )
+            
+            # Show what was changed
+            changes = []
+            if new_title is not None:
+                changes.append(f"**🏷️ Event Title:** {title} → {new_title}")
+            if new_date is not None:
+                changes.append(f"**⏰ Event Date:** Schedule adjusted")
+            if new_description is not None:
+                changes.append(f"**📋 Event Details:** Description updated")
+            
+            if changes:
+                embed.add_field(
+                    name="📊 Modifications Made",
+                    value="\n".join(changes),
+                    inline=False
+                )
+            
+            embed.add_field(name="🗓️ Current Date", value=f"📅 {format_event_date(updated_event['date'])}", inline=True)
+            embed.add_field(name="📜 Current Description", value=f"📝 {updated_event['description']}", inline=True)
+            embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/f/f0/Chess_kdl45.svg/800px-Chess_kdl45.svg.png")
+            embed.set_footer(text="♛ Adaptability is the mark of a great organizer ♛")
+            
+            await respond(interaction, embed=embed)
+        else:
+            embed = discord.Embed(
+                title="❌ Event Not Found ❌",
+                description=f"*No event found with the name: **{title}***\n\nCheck the event list and try again.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Verify the event name ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+
+    @app_commands.command(name="sm_importevents", description="Import events from an NDJSON or CSV file (Admin only)")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(file="NDJSON or CSV file with title, date (DD/MM/YYYY) and description")
+    @auto_defer(ephemeral=True)
+    async def import_events(self, interaction: discord.Interaction, file: discord.Attachment):
+        """Set up a whole season of events in one move"""
+        fmt = bulk.detect_format(file.filename)
+        if fmt is None:
+            embed = discord.Embed(
+                title="❌ Unsupported File ❌",
+                description="*Upload a `.ndjson`/`.jsonl` or `.csv` file.*",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Check your file format ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        # Checked before anything is downloaded
+        if file.size > Config.IMPORT_MAX_BYTES:
+            await respond(interaction, embed=import_too_large_embed(file.size, Config.IMPORT_MAX_BYTES), ephemeral=True)
+            return
+
+        records = bulk.read_records(bulk.stream_url_lines(file.url), fmt)
+        report = await bulk.import_events(records, interaction.guild_id, created_by=interaction.user.id)
+        await respond(interaction, embed=import_report_embed(report, "events"), ephemeral=True)
+
+    @app_commands.command(name="sm_exportevents", description="Export every event as an NDJSON or CSV file (Admin only)")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(format="File format (default: ndjson)")
+    @auto_defer(ephemeral=True)
+    async def export_events(self, interaction: discord.Interaction, format: Literal["ndjson", "csv"] = "ndjson"):
+        """Record every move on the board"""
+        export = functools.partial(bulk.export_events, guild_id=interaction.guild_id)
+        buffer, count = await bulk.export_to_buffer(export, format)
+        with buffer:
+            await respond(
+                interaction,
+                content=f"♜ Exported {count} events ♜",
+                file=discord.File(buffer, filename=f"events.{format}"),
+                ephemeral=True
+            )
+
+    @remove_event.autocomplete("title")
+    @modify_event.autocomplete("title")
+    async def title_autocomplete(self, interaction: discord.Interaction, current: str):
+        """Suggest event titles from the in-memory index as the admin types"""
+        if interaction.guild_id is None:
+            return []
+        titles = await db.search_event_titles(interaction.guild_id, current)
+        # Discord caps choice names and values at 100 characters. A cut title
+        # would match no event, so longer ones are left for the admin to type
+        return [app_commands.Choice(name=t, value=t) for t in titles if len(t) <= 100]
+
+    # ------------------------------
+    # Event Reminders
+    # ------------------------------
+    async def run_reminders(self):
+        """Post each event's reminders as they come due.
+
+        Sleeps until the earliest reminder in db.reminders; adding or
+        editing an event with an earlier one wakes it early. Storage is
+        read in full only at startup; due events are then checked by ID.
+        """
+        await self.bot.wait_until_ready()
+        await db.wait_ready()
+        # In a cluster, each worker schedules only its own guilds' reminders
+        await db.load_reminders(keep=lambda event: self._owned_guild(event) is not None)
+        log.info("Event reminders scheduled: %d", len(db.reminders))
+        while True:
+            due_at = db.reminders.next_due()
+            timeout = None if due_at is None else max(0.0, (due_at - utcnow()).total_seconds())
+            await db.reminders.wait(timeout)
+            due = db.reminders.pop_due()
+            if not due:
+                continue
+            try:
+                await self._send_reminders(due)
+            except Exception:
+                log.exception("Event reminder run failed")
+                # Reminders put back by a failed check are due already; don't spin on them
+                await asyncio.sleep(Config.DB_BREAKER_RESET_SECONDS)
+
+    def _owned_guild(self, event):
+        """The event's guild if this process posts its reminders, else None."""
+        guild = self.bot.get_guild(event.get("guild_id") or 0)
+        return guild if guild is not None and self.bot.owns_guild(guild) else None
+
+    async def _send_reminders(self, due):
+        # Each event is announced in its own server only, by the process that owns it
+        due = [r for r in due if self._owned_guild(r.event) is not None]
+        if not due:
+            return
+        try:
+            # Another process may have moved or removed an event since it was scheduled
+            current = await db.get_events_by_ids(list({r.event["_id"] for r in due}))
+        except Exception:
+            db.reminders.restore(due)
+            raise
+        reminders = []
+        for reminder in due:
+            event_id = reminder.event["_id"]
+            event = current.get(event_id)
+            if event is None:
+                db.reminders.cancel(event_id)
+            elif event["date"] != reminder.event["date"]:
+                # Moved elsewhere: its reminders now follow the new date
+                db.reminders.schedule(event)
+            else:
+                reminders.append((reminder, event))
+
+        def make_job(reminder, event):
+            guild = self._owned_guild(event)
+            channel = announcement_channels.get(guild) if guild is not None else None
+            if channel is None:
+                return None
+            embed = self._render_reminder(event, reminder.hours_before)
+            return lambda: channel.send(embed=embed)
+
+        stats = await fan_out(
+            (make_job(reminder, event) for reminder, event in reminders),
+            concurrency=Config.DAILY_FACT_CONCURRENCY,
+            max_retries=Config.DAILY_FACT_MAX_RETRIES
+        )
+        log.info(
+            "Event reminders: %s", stats,
+            extra={"reminders": len(reminders), "sent": stats.sent, "failed": stats.failed,
+                   "duration": round(stats.duration, 3)}
+        )
+
+    def _render_reminder(self, event, hours_before):
+        """Build the reminder embed for one event"""
+        if hours_before >= 24 and hours_before % 24 == 0:
+            days = int(hours_before // 24)
+            lead = f"{days} day{'s' if days != 1 else ''}"
+        else:
+            lead = f"{hours_before:g} hour{'s' if hours_before != 1 else ''}"
+        embed = discord.Embed(
+            title=f"⏰♞ Event Reminder: {event['title']} ♞⏰",
+            description=f"*This event starts in {lead}. Get your pieces ready!*",
+            color=CHESS_GREEN
+        )
+        embed.add_field(name="📅 Event Date", value=f"🗓️ {format_event_date(event['date'])}", inline=True)
+        embed.add_field(name="📋 Event Details", value=f"📝 {event['description']}", inline=True)
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        embed.set_footer(text="♛ Don't miss your move ♛")
+        return embed
+
+    @add_event.error
+    @remove_event.error
+    @modify_event.error
+    @clear_events.error
+    @import_events.error
+    @export_events.error
+    async def event_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Error handler for event commands with chess theme"""
+        if isinstance(error, app_commands.MissingPermissions):
+            embed = discord.Embed(
+                title="🚫 Access Denied 🚫",
+                description="*You lack the permissions to manage events!*\n\nOnly administrators may organize these events.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♚ Admin privileges required ♚")
+            await respond(interaction, embed=embed, ephemeral=True)
+        elif isinstance(getattr(error, "original", error), StorageUnavailable):
+            embed = storage_unavailable_embed()
+            await respond(interaction, embed=embed, ephemeral=True)
+        else:
+            embed = discord.Embed(
+                title="💥 Operation Failed 💥",
+                description=f"*An unexpected error occurred:*\n\n`{str(error)}`",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Try again later ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+
+async def setup(bot):
+    """Setup the Events Command Center"""
     await bot.add_cog(Events(bot))
\ No newline at end of file
@@ -1,221 +1,381 @@
-import random
-import discord
-from discord.ext import commands, tasks
-from discord import app_commands
-from bot.utils import db
-
-CHESS_GREEN = discord.Color.from_rgb(29, 185, 84)
-CHESS_SYMBOLS = ["♟️", "♙", "♜", "♖", "♞", "♘", "♝", "♗", "♛", "♕", "♚", "♔"]
-CHESS_BOARD_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Chess_board_opening_staunton.png/320px-Chess_board_opening_staunton.png"
-
-class Facts(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-        self.daily_fact.start()
-
-    # ------------------------------
-    # Command: Get Random Fact
-    # ------------------------------
-    @app_commands.command(name="sm_fact", description="Get a random Shellmates cybersecurity fact!")
-    async def cyberfact(self, interaction: discord.Interaction):
-        """Display a strategic cybersecurity fact"""
-        fact = await db.get_random_fact()
-        if not fact:
-            embed = discord.Embed(
-                title="♟️ No Facts Available",
-                description="*The knowledge vault is currently empty...*",
-                color=CHESS_GREEN
-            )
-            embed.set_thumbnail(url=CHESS_BOARD_URL)
-            embed.set_footer(text="♜ Use /sm_addfact to share your wisdom ♜")
-            await interaction.response.send_message(embed=embed)
-            return
-
-        symbol = random.choice(CHESS_SYMBOLS)
-        embed = discord.Embed(
-            title=f"{symbol} Security Fact {symbol}",
-            description=f"```\n{fact}\n```",
-            color=CHESS_GREEN
-        )
-        embed.set_thumbnail(url=CHESS_BOARD_URL)
-        embed.set_footer(text="♛ Knowledge is your strongest defense ♛")
-
-        await interaction.response.send_message(embed=embed)
-
-    # ------------------------------
-    # Command: Add New Fact (Admin)
-    # ------------------------------
-    @app_commands.command(name="sm_addfact", description="[Admin] Add a new cybersecurity fact")
-    @app_commands.describe(fact="The cybersecurity fact to add")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def addfact(self, interaction: discord.Interaction, fact: str):
-        """Add a new piece of strategic knowledge to the vault"""
-        await db.add_fact(fact)
-        
-        embed = discord.Embed(
-            title=f"✅♞ New Security Fact Added ♞✅",
-            description="*Your wisdom has been recorded in the knowledge vault!*",
-            color=CHESS_GREEN
-        )
-        embed.add_field(
-            name="📜 Security Fact", 
-            value=f"```{fact}```", 
-            inline=False
-        )
-        embed.add_field(
-            name="👑 Added By", 
-            value=f"🎖️ {interaction.user.display_name}", 
-            inline=True
-        )
-        embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Chess_klt45.svg/800px-Chess_klt45.svg.png")
-        embed.set_footer(text="♛ Your move strengthens our defenses ♛")
-        
-        await interaction.response.send_message(embed=embed)
-
-    # ------------------------------
-    # Command: Remove Fact (Admin)
-    # ------------------------------
-    @app_commands.command(name="sm_removefact", description="[Admin] Remove a cybersecurity fact")
-    @app_commands.describe(fact="The exact text of the fact to remove")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def removefact(self, interaction: discord.Interaction, fact: str):
-        """Remove outdated knowledge from the vault"""
-        success = await db.remove_fact(fact)
-        
-        if success:
-            embed = discord.Embed(
-                title="♟️ Fact Retired ♟️",
-                description=f"*The following fact has been removed from our playbook:*",
-                color=CHESS_GREEN
-            )
-            embed.add_field(
-                name="📜 Retired Fact",
-                value=f"```{fact}```",
-                inline=False
-            )
-            embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Chess_piece_-_White_king.jpg/320px-Chess_piece_-_White_king.jpg")
-            embed.set_footer(text=f"♜ Retired by {interaction.user.display_name} ♜")
-        else:
-            embed = discord.Embed(
-                title="❌ Strategic Error ❌",
-                description="*This fact was not found in our knowledge base.*\n\nCheck your notation and try again.",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♝ Verify the exact wording ♝")
-        
-        await interaction.response.send_message(embed=embed)
-
-    # ------------------------------
-    # Command: List All Facts (Admin)
-    # ------------------------------
-    @app_commands.command(name="sm_listfacts", description="[Admin] View all cybersecurity facts in the database")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def listfacts(self, interaction: discord.Interaction):
-        """Review the complete knowledge base"""
-        facts = await db.get_all_facts()
-        
-        if not facts:
-            embed = discord.Embed(
-                title="♟️ Empty Knowledge Vault ♟️",
-                description="*No facts are currently recorded.*\n\nUse `/sm_addfact` to begin building our defenses!",
-                color=CHESS_GREEN
-            )
-            embed.set_footer(text="♜ The vault awaits your wisdom ♜")
-            await interaction.response.send_message(embed=embed)
-            return
-        
-        # Show first page
-        description = ""
-        for i, fact in enumerate(facts, start=1):
-            symbol = CHESS_SYMBOLS[(i-1) % len(CHESS_SYMBOLS)]
-            description += f"{symbol} **{i}.** {fact}\n\n"
-        
-        embed = discord.Embed(
-            title="♛ Security Facts Collection ♛",
-            description=description,
-            color=CHESS_GREEN
-        )
-        embed.set_thumbnail(url=CHESS_BOARD_URL)
-        embed.set_footer(
-            text=f"Total Facts: {len(facts)} • Knowledge Base"
-        )
-        
-        await interaction.response.send_message(embed=embed)
-
-    # ------------------------------
-    # Daily Fact Automation (24 hours)
-    # ------------------------------
-    @tasks.loop(hours=24)
-    async def daily_fact(self):
-        """Automatically send a daily cybersecurity fact"""
-        # You can specify a channel ID here, or get it from a config
-        # For now, I'll send to the first text channel of each guild the bot is in
-        for guild in self.bot.guilds:
-            # Find a suitable channel to send the fact
-            channel = None
-            for text_channel in guild.text_channels:
-                if text_channel.permissions_for(guild.me).send_messages:
-                    channel = text_channel
-                    break
-            
-            if channel:
-                fact = await db.get_random_fact()
-                if fact:
-                    symbol = random.choice(CHESS_SYMBOLS)
-                    embed = discord.Embed(
-                        title=f"{symbol} Daily Security Fact {symbol}",
-                        description=f"```\n{fact}\n```",
-                        color=CHESS_GREEN
-                    )
-                    embed.set_thumbnail(url=CHESS_BOARD_URL)
-                    embed.set_footer(
-                        text=f"♛ Daily Security Update • {discord.utils.utcnow().strftime('%B %d, %Y')} ♛"
-                    )
-
-                    try:
-                        await channel.send(embed=embed)
-                    except:
-                        continue  # If we can't send in one channel, try others
-
-    @daily_fact.before_loop
-    async def before_daily_fact(self):
-        """Wait until the bot is ready before starting the daily fact loop"""
-        await self.bot.wait_until_ready()
-
-    def cog_unload(self):
-        """Cancel the daily fact task when the cog is unloaded"""
-        self.daily_fact.cancel()
-
-    # ------------------------------
-    # Unified Error Handler
-    # ------------------------------
-    @addfact.error
-    @removefact.error
-    @listfacts.error
-    async def fact_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
-        """Error handler for fact commands with chess theme"""
-        if isinstance(error, app_commands.MissingPermissions):
-            embed = discord.Embed(
-                title="🚫 Royal Decree Required 🚫",
-                description="*Only administrators may modify the knowledge base!*",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♚ Administrator privileges needed ♚")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        else:
-            embed = discord.Embed(
-                title="💥 Operation Failed 💥",
-                description=f"*An unexpected error occurred:*\n\n`{str(error)}`",
-                color=discord.Color.red()
-            )
-            embed.set_footer(text="♜ Try again later ♜")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    @commands.Cog.listener()
-    async def on_ready(self):
-        """Initialize default facts when the bot starts"""
-        await db.initialize_default_facts()
-
-async def setup(bot):
-    """Setup the Facts Command Center"""
+import logging
+import random
+import discord
+from typing import Literal
+from discord.ext import commands, tasks
+from discord import app_commands
+from bot.utils import bulk, db, Config
+from bot.utils.database import FACTS_PAGE_SIZE, FACT_SEARCH_LIMIT, MAX_FACT_SEARCH_LIMIT
+from bot.utils.embeds import import_report_embed, import_too_large_embed, render_cache, storage_unavailable_embed
+from bot.utils.fanout import announcement_channels, fan_out
+from bot.utils.pagination import KeysetPaginator
+from bot.utils.responses import auto_defer, respond
+from bot.utils.storage import StorageUnavailable
+
+CHESS_GREEN = discord.Color.from_rgb(29, 185, 84)
+CHESS_SYMBOLS = ["♟️", "♙", "♜", "♖", "♞", "♘", "♝", "♗", "♛", "♕", "♚", "♔"]
+CHESS_BOARD_URL = "https://upload.wikimedia.org/wikipedia/commons/thumb/d/d6/Chess_board_opening_staunton.png/320px-Chess_board_opening_staunton.png"
+
+log = logging.getLogger(__name__)
+# Longest fact shown on a /sm_listfacts page, so a full page stays under Discord's 4096-char limit
+LIST_FACT_MAX_CHARS = 350
+# Room for /sm_searchfacts results, leaving margin under the 4096-char limit
+SEARCH_DESCRIPTION_CHARS = 3900
+
+class Facts(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        # Static embeds are built once and reused for every send
+        self.no_facts_embed = self._build_no_facts()
+        self.empty_vault_embed = self._build_empty_vault()
+        self.daily_fact.start()
+
+    # ------------------------------
+    # Command: Get Random Fact
+    # ------------------------------
+    @app_commands.command(name="sm_fact", description="Get a random Shellmates cybersecurity fact!")
+    @auto_defer()
+    async def cyberfact(self, interaction: discord.Interaction):
+        """Display a strategic cybersecurity fact"""
+        fact = await db.get_random_fact(interaction.guild_id)
+        if not fact:
+            await respond(interaction, embed=self.no_facts_embed)
+            return
+
+        symbol = random.choice(CHESS_SYMBOLS)
+        embed = discord.Embed(
+            title=f"{symbol} Security Fact {symbol}",
+            description=f"```\n{fact}\n```",
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        embed.set_footer(text="♛ Knowledge is your strongest defense ♛")
+
+        await respond(interaction, embed=embed)
+
+    # ------------------------------
+    # Command: Add New Fact (Admin)
+    # ------------------------------
+    @app_commands.command(name="sm_addfact", description="[Admin] Add a new cybersecurity fact")
+    @app_commands.describe(fact="The cybersecurity fact to add")
+    @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer()
+    async def addfact(self, interaction: discord.Interaction, fact: str):
+        """Add a new piece of strategic knowledge to the vault"""
+        added = await db.add_fact(fact)
+        if not added:
+            embed = discord.Embed(
+                title="♟️ Fact Already Recorded ♟️",
+                description="*This fact is already in the knowledge vault.*",
+                color=CHESS_GREEN
+            )
+            embed.add_field(name="📜 Security Fact", value=f"```{fact}```", inline=False)
+            embed.set_footer(text="♝ Try sharing a new insight ♝")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title=f"✅♞ New Security Fact Added ♞✅",
+            description="*Your wisdom has been recorded in the knowledge vault!*",
+            color=CHESS_GREEN
+        )
+        embed.add_field(
+            name="📜 Security Fact", 
+            value=f"```{fact}```", 
+            inline=False
+        )
+        embed.add_field(
+            name="👑 Added By", 
+            value=f"🎖️ {interaction.user.display_name}", 
+            inline=True
+        )
+        embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/4/42/Chess_klt45.svg/800px-Chess_klt45.svg.png")
+        embed.set_footer(text="♛ Your move strengthens our defenses ♛")
+        
+        await respond(interaction, embed=embed)
+
+    # ------------------------------
+    # Command: Remove Fact (Admin)
+    # ------------------------------
+    @app_commands.command(name="sm_removefact", description="[Admin] Remove a cybersecurity fact")
+    @app_commands.describe(fact="The exact text of the fact to remove")
+    @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer()
+    async def removefact(self, interaction: discord.Interaction, fact: str):
+        """Remove outdated knowledge from the vault"""
+        success = await db.remove_fact(fact)
+        
+        if success:
+            embed = discord.Embed(
+                title="♟️ Fact Retired ♟️",
+                description=f"*The following fact has been removed from our playbook:*",
+                color=CHESS_GREEN
+            )
+            embed.add_field(
+                name="📜 Retired Fact",
+                value=f"```{fact}```",
+                inline=False
+            )
+            embed.set_thumbnail(url="https://upload.wikimedia.org/wikipedia/commons/thumb/8/81/Chess_piece_-_White_king.jpg/320px-Chess_piece_-_White_king.jpg")
+            embed.set_footer(text=f"♜ Retired by {interaction.user.display_name} ♜")
+        else:
+            embed = discord.Embed(
+                title="❌ Strategic Error ❌",
+                description="*This fact was not found in our knowledge base.*\n\nCheck your notation and try again.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♝ Verify the exact wording ♝")
+        
+        await respond(interaction, embed=embed)
+
+    # ------------------------------
+    # Command: List All Facts (Admin)
+    # ------------------------------
+    @app_commands.command(name="sm_listfacts", description="[Admin] View all cybersecurity facts in the database")
+    @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer()
+    async def listfacts(self, interaction: discord.Interaction):
+        """Review the complete knowledge base"""
+        total = await db.count_facts()
+        paginator = KeysetPaginator(
+            fetch=db.get_facts_page,
+            cursor_of=lambda fact: fact["_id"],
+            render=lambda facts, page: self._render_facts_page(facts, page, total),
+            page_size=FACTS_PAGE_SIZE,
+            owner_id=interaction.user.id,
+            cache=render_cache,
+            namespace="facts_list",
+            version=db.facts_version
+        )
+        
+        if not await paginator.load_first_page():
+            await respond(interaction, embed=self.empty_vault_embed)
+            return
+        
+        await paginator.send(interaction)
+
+    # ------------------------------
+    # Command: Search Facts
+    # ------------------------------
+    @app_commands.command(name="sm_searchfacts", description="Search the cybersecurity facts by keyword")
+    @app_commands.describe(query="Words to look for", limit=f"Maximum results (1-{MAX_FACT_SEARCH_LIMIT})")
+    @auto_defer()
+    async def searchfacts(
+        self,
+        interaction: discord.Interaction,
+        query: str,
+        limit: app_commands.Range[int, 1, MAX_FACT_SEARCH_LIMIT] = FACT_SEARCH_LIMIT
+    ):
+        """Find the right piece of knowledge for the position"""
+        facts = await db.search_facts(query, limit)
+        if not facts:
+            embed = discord.Embed(
+                title="♟️ No Matching Facts ♟️",
+                description=f"*No fact in the vault mentions **{query[:200]}**.*\n\nTry different keywords.",
+                color=CHESS_GREEN
+            )
+            embed.set_footer(text="♝ Every search is a new opening ♝")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        # Up to 25 results must share the 4096-char description
+        max_chars = min(LIST_FACT_MAX_CHARS, SEARCH_DESCRIPTION_CHARS // len(facts) - 16)
+        description = ""
+        for i, fact in enumerate(facts, start=1):
+            symbol = CHESS_SYMBOLS[(i-1) % len(CHESS_SYMBOLS)]
+            text = fact["text"]
+            if len(text) > max_chars:
+                text = text[:max_chars - 1] + "…"
+            description += f"{symbol} **{i}.** {text}\n\n"
+
+        embed = discord.Embed(
+            title=f"♛ Facts Matching: {query[:200]} ♛",
+            description=description,
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        embed.set_footer(text=f"{len(facts)} results • Most relevant first")
+        await respond(interaction, embed=embed)
+
+    # ------------------------------
+    # Command: Bulk Import / Export (Admin)
+    # ------------------------------
+    @app_commands.command(name="sm_importfacts", description="[Admin] Import facts from an NDJSON or CSV file")
+    @app_commands.describe(file="NDJSON (one string or {\"text\": ...} per line) or CSV with a text column")
+    @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer(ephemeral=True)
+    async def importfacts(self, interaction: discord.Interaction, file: discord.Attachment):
+        """Stock the knowledge vault in one move"""
+        fmt = bulk.detect_format(file.filename)
+        if fmt is None:
+            embed = discord.Embed(
+                title="❌ Unsupported File ❌",
+                description="*Upload a `.ndjson`/`.jsonl` or `.csv` file.*",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Check your file format ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        # Checked before anything is downloaded
+        if file.size > Config.IMPORT_MAX_BYTES:
+            await respond(interaction, embed=import_too_large_embed(file.size, Config.IMPORT_MAX_BYTES), ephemeral=True)
+            return
+
+        records = bulk.read_records(bulk.stream_url_lines(file.url), fmt)
+        report = await bulk.import_facts(records)
+        await respond(interaction, embed=import_report_embed(report, "facts"), ephemeral=True)
+
+    @app_commands.command(name="sm_exportfacts", description="[Admin] Export every fact as an NDJSON or CSV file")
+    @app_commands.describe(format="File format (default: ndjson)")
+    @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer(ephemeral=True)
+    async def exportfacts(self, interaction: discord.Interaction, format: Literal["ndjson", "csv"] = "ndjson"):
+        """Copy out the whole knowledge vault"""
+        buffer, count = await bulk.export_to_buffer(bulk.export_facts, format)
+        with buffer:
+            await respond(
+                interaction,
+                content=f"♜ Exported {count} facts ♜",
+                file=discord.File(buffer, filename=f"facts.{format}"),
+                ephemeral=True
+            )
+
+    def _build_no_facts(self):
+        embed = discord.Embed(
+            title="♟️ No Facts Available",
+            description="*The knowledge vault is currently empty...*",
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        embed.set_footer(text="♜ Use /sm_addfact to share your wisdom ♜")
+        return embed
+
+    def _build_empty_vault(self):
+        embed = discord.Embed(
+            title="♟️ Empty Knowledge Vault ♟️",
+            description="*No facts are currently recorded.*\n\nUse `/sm_addfact` to begin building our defenses!",
+            color=CHESS_GREEN
+        )
+        embed.set_footer(text="♜ The vault awaits your wisdom ♜")
+        return embed
+
+    def _render_facts_page(self, facts, page, total):
+        """Build the embed for one page of the knowledge base"""
+        description = ""
+        for i, fact in enumerate(facts, start=page * FACTS_PAGE_SIZE + 1):
+            symbol = CHESS_SYMBOLS[(i-1) % len(CHESS_SYMBOLS)]
+            text = fact["text"]
+            if len(text) > LIST_FACT_MAX_CHARS:
+                text = text[:LIST_FACT_MAX_CHARS - 1] + "…"
+            description += f"{symbol} **{i}.** {text}\n\n"
+        
+        embed = discord.Embed(
+            title="♛ Security Facts Collection ♛",
+            description=description,
+            color=CHESS_GREEN
+        )
+        embed.set_thumbnail(url=CHESS_BOARD_URL)
+        pages = max(1, -(-total // FACTS_PAGE_SIZE))
+        embed.set_footer(
+            text=f"Total Facts: {total} • Page {page + 1}/{pages} • Knowledge Base"
+        )
+        return embed
+
+    # ------------------------------
+    # Daily Fact Automation (24 hours)
+    # ------------------------------
+    @tasks.loop(hours=24)
+    async def daily_fact(self):
+        """Automatically send a daily cybersecurity fact"""
+        # In a cluster every process sees only its own shards' guilds, but
+        # filter anyway so a guild is never posted to twice
+        guilds = [guild for guild in self.bot.guilds if self.bot.owns_guild(guild)]
+        # One query for every guild's fact, then concurrent sends
+        try:
+            facts = await db.get_facts_for_guilds([guild.id for guild in guilds])
+        except StorageUnavailable as e:
+            # Skip today rather than let the error stop the loop for good
+            log.warning("Daily fact skipped, storage unavailable: %s", e)
+            return
+        today = discord.utils.utcnow().strftime('%B %d, %Y')
+
+        def make_job(guild):
+            channel = announcement_channels.get(guild)
+            fact = facts.get(guild.id)
+            if channel is None or fact is None:
+                return None
+
+            symbol = random.choice(CHESS_SYMBOLS)
+            embed = discord.Embed(
+                title=f"{symbol} Daily Security Fact {symbol}",
+                description=f"```\n{fact}\n```",
+                color=CHESS_GREEN
+            )
+            embed.set_thumbnail(url=CHESS_BOARD_URL)
+            embed.set_footer(text=f"♛ Daily Security Update • {today} ♛")
+            return lambda: channel.send(embed=embed)
+
+        stats = await fan_out(
+            (make_job(guild) for guild in guilds),
+            concurrency=Config.DAILY_FACT_CONCURRENCY,
+            max_retries=Config.DAILY_FACT_MAX_RETRIES
+        )
+        log.info(
+            "Daily fact run: %s", stats,
+            extra={"sent": stats.sent, "failed": stats.failed, "skipped": stats.skipped,
+                   "rate_limited": stats.rate_limited, "duration": round(stats.duration, 3)}
+        )
+        for error in stats.errors[:5]:
+            log.warning("Daily fact send failed: %s", error)
+
+    @daily_fact.before_loop
+    async def before_daily_fact(self):
+        """Wait until the bot is ready before starting the daily fact loop"""
+        await self.bot.wait_until_ready()
+        await db.wait_ready()
+
+    def cog_unload(self):
+        """Cancel the daily fact task when the cog is unloaded"""
+        self.daily_fact.cancel()
+
+    # ------------------------------
+    # Unified Error Handler
+    # ------------------------------
+    @addfact.error
+    @removefact.error
+    @listfacts.error
+    @searchfacts.error
+    @importfacts.error
+    @exportfacts.error
+    async def fact_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Error handler for fact commands with chess theme"""
+        if isinstance(error, app_commands.MissingPermissions):
+            embed = discord.Embed(
+                title="🚫 Royal Decree Required 🚫",
+                description="*Only administrators may modify the knowledge base!*",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♚ Administrator privileges needed ♚")
+            await respond(interaction, embed=embed, ephemeral=True)
+        elif isinstance(getattr(error, "original", error), StorageUnavailable):
+            embed = storage_unavailable_embed()
+            await respond(interaction, embed=embed, ephemeral=True)
+        else:
+            embed = discord.Embed(
+                title="💥 Operation Failed 💥",
+                description=f"*An unexpected error occurred:*\n\n`{str(error)}`",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Try again later ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Initialize default facts when the bot starts"""
+        await db.wait_ready()
+        await db.initialize_default_facts()
+
+async def setup(bot):
+    """Setup the Facts Command Center"""
     await bot.add_cog(Facts(bot))
\ No newline at end of file
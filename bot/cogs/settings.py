@@ -0,0 +1,94 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from bot.utils import db
+from bot.utils.command_sync import sync_commands
+from bot.utils.embeds import storage_unavailable_embed
+from bot.utils.responses import auto_defer, respond
+from bot.utils.storage import StorageUnavailable
+
+CHESS_GREEN = discord.Color.from_rgb(29, 185, 84)
+
+async def is_bot_owner(interaction: discord.Interaction) -> bool:
+    return await interaction.client.is_owner(interaction.user)
+
+class Settings(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="sm_setchannel", description="Set the channel for daily facts and announcements (Admin only)")
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.guild_only()
+    @app_commands.describe(channel="Text channel the bot should post announcements in")
+    @auto_defer()
+    async def set_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
+        """Choose where the bot makes its moves"""
+        if not channel.permissions_for(interaction.guild.me).send_messages:
+            embed = discord.Embed(
+                title="❌ Cannot Post There ❌",
+                description=f"*I don't have permission to send messages in {channel.mention}!*\n\nGrant access or pick another channel.",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Check the channel permissions ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+            return
+
+        await db.set_announcement_channel(interaction.guild_id, channel.id)
+
+        embed = discord.Embed(
+            title="♜ Announcement Channel Set ♜",
+            description=f"*Daily facts and announcements will now be posted in {channel.mention}.*",
+            color=CHESS_GREEN
+        )
+        embed.set_footer(text=f"♛ Set by {interaction.user.display_name} ♛")
+        await respond(interaction, embed=embed)
+
+    @app_commands.command(name="sm_synccommands", description="Force a global slash command sync (Bot owner only)")
+    @app_commands.check(is_bot_owner)
+    @auto_defer(ephemeral=True)
+    async def force_sync(self, interaction: discord.Interaction):
+        """Re-announce the whole move list to Discord"""
+        result = await sync_commands(self.bot.tree, self.bot.application_id, force=True)
+        embed = discord.Embed(
+            title="♜ Commands Synced ♜",
+            description=f"*Synced {result.count} commands in {result.duration:.2f}s.*\n\nNew commands may take a few minutes to appear.",
+            color=CHESS_GREEN
+        )
+        embed.set_footer(text=f"♛ Tree hash {result.tree_hash[:12]} ♛")
+        await respond(interaction, embed=embed, ephemeral=True)
+
+    @set_channel.error
+    @force_sync.error
+    async def settings_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Error handler for settings commands with chess theme"""
+        if isinstance(error, app_commands.MissingPermissions):
+            embed = discord.Embed(
+                title="🚫 Access Denied 🚫",
+                description="*Only administrators may change the bot's settings!*",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♚ Admin privileges required ♚")
+            await respond(interaction, embed=embed, ephemeral=True)
+        elif isinstance(error, app_commands.CheckFailure):
+            embed = discord.Embed(
+                title="🚫 Access Denied 🚫",
+                description="*Only the bot owner may sync commands!*",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♚ Owner privileges required ♚")
+            await respond(interaction, embed=embed, ephemeral=True)
+        elif isinstance(getattr(error, "original", error), StorageUnavailable):
+            embed = storage_unavailable_embed()
+            await respond(interaction, embed=embed, ephemeral=True)
+        else:
+            embed = discord.Embed(
+                title="💥 Operation Failed 💥",
+                description=f"*An unexpected error occurred:*\n\n`{str(error)}`",
+                color=discord.Color.red()
+            )
+            embed.set_footer(text="♜ Try again later ♜")
+            await respond(interaction, embed=embed, ephemeral=True)
+
+async def setup(bot):
+    """Setup the Settings Command Center"""
+    await bot.add_cog(Settings(bot))
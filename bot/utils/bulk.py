@@ -0,0 +1,300 @@
+import csv
+import io
+import json
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Hashable, List, Optional, TextIO, Tuple
+)
+
+from bot.utils.database import db, BULK_BATCH_SIZE
+from bot.utils.dates import coerce_event_date, make_event_date, parse_event_date
+from bot.utils.storage.base import normalize_key
+
+FORMATS = ("ndjson", "csv")
+EVENT_FIELDS = ("title", "date", "description", "guild_id", "created_by", "created_at")
+FACT_FIELDS = ("text",)
+# Invalid rows listed in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 10
+# Physical lines one CSV record may span before it is rejected as an unterminated quote
+MAX_CSV_RECORD_LINES = 100
+# Exports stay in memory up to this size, then spill to a temp file
+EXPORT_SPOOL_BYTES = 1024 * 1024
+
+# A parsed record, or the ValueError explaining why its line couldn't be parsed
+Record = Tuple[int, Any]
+
+
+@dataclass
+class ImportReport:
+    read: int = 0
+    inserted: int = 0
+    # Repeated within the file or already stored
+    duplicates: int = 0
+    invalid: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def reject(self, line: int, error: Exception) -> None:
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line}: {error}")
+
+
+def detect_format(filename: str) -> Optional[str]:
+    """Format implied by a file name's extension, or None if it isn't one we read."""
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        return "csv"
+    if extension in ("ndjson", "jsonl", "json"):
+        return "ndjson"
+    return None
+
+
+# -----------------------------
+# Parsing
+# -----------------------------
+
+async def _decode(lines: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    number = 0
+    async for raw in lines:
+        number += 1
+        text = raw.decode("utf-8", errors="replace")
+        if number == 1:
+            text = text.lstrip("\ufeff")
+        yield number, text
+
+
+async def read_records(lines: AsyncIterable[bytes], fmt: str) -> AsyncIterator[Record]:
+    """Parse a stream of raw lines into ``(line number, record)`` pairs.
+
+    NDJSON records are whatever each non-blank line decodes to; CSV records
+    are dicts keyed by the (lower-cased) header row. Nothing is buffered
+    beyond the current record. A line that can't be parsed yields a
+    ValueError in place of the record, so one bad row doesn't end the import.
+    """
+    if fmt == "ndjson":
+        async for number, text in _decode(lines):
+            if not text.strip():
+                continue
+            try:
+                yield number, json.loads(text)
+            except json.JSONDecodeError as e:
+                yield number, ValueError(f"invalid JSON ({e.msg})")
+        return
+
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    start = 0
+    async for number, text in _decode(lines):
+        if not pending:
+            start = number
+        pending.append(text)
+        try:
+            rows = list(csv.reader(pending, strict=True))
+        except csv.Error as e:
+            # A quoted field that continues on the next line
+            if "unexpected end of data" in str(e) and len(pending) < MAX_CSV_RECORD_LINES:
+                continue
+            pending = []
+            yield start, ValueError(f"invalid CSV ({e})")
+            continue
+        pending = []
+        if not rows or not any(cell.strip() for cell in rows[0]):
+            continue
+        if header is None:
+            header = [cell.strip().lower() for cell in rows[0]]
+            continue
+        yield start, dict(zip(header, rows[0]))
+    if pending:
+        yield start, ValueError("invalid CSV (unterminated quoted field)")
+
+
+def event_from_record(record: Any, guild_id: Optional[int] = None, created_by: Optional[int] = None) -> Dict[str, Any]:
+    """Build an event document from an imported record, or raise ValueError.
+
+    The date may be given as ``date`` (DD/MM/YYYY or ISO) or as separate
+    ``day``/``month``/``year`` fields, and must pass the same checks as
+    /sm_addevent. The event goes to ``guild_id`` when given, whatever the
+    record says; otherwise the record must carry its own ``guild_id``.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("expected an object with title, date and description")
+    title = str(record.get("title") or "").strip()
+    description = str(record.get("description") or "").strip()
+    if not title:
+        raise ValueError("missing title")
+    if not description:
+        raise ValueError("missing description")
+
+    if record.get("date"):
+        parsed = parse_event_date(str(record["date"]))
+        day, month, year = parsed.day, parsed.month, parsed.year
+    elif all(record.get(k) not in (None, "") for k in ("day", "month", "year")):
+        try:
+            day, month, year = (int(record[k]) for k in ("day", "month", "year"))
+        except (TypeError, ValueError):
+            raise ValueError("day, month and year must be whole numbers") from None
+    else:
+        raise ValueError("missing date")
+
+    if guild_id is None:
+        try:
+            guild_id = int(record.get("guild_id") or "")
+        except (TypeError, ValueError):
+            raise ValueError("missing guild_id") from None
+
+    created_at = record.get("created_at") or datetime.now(timezone.utc).isoformat()
+    return {
+        "title": title,
+        "date": make_event_date(day, month, year),
+        "description": description,
+        "guild_id": guild_id,
+        "created_by": record.get("created_by") or created_by,
+        "created_at": created_at,
+    }
+
+
+def fact_from_record(record: Any) -> str:
+    """Fact text from an imported record (``{"text": ...}`` or a bare string), or raise ValueError."""
+    text = record.get("text") if isinstance(record, dict) else record
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("missing text")
+    return text.strip()
+
+
+# -----------------------------
+# Import
+# -----------------------------
+
+async def _import(
+    records: AsyncIterable[Record],
+    convert: Callable[[Any], Any],
+    key_of: Callable[[Any], Hashable],
+    write: Callable[[List[Any]], Awaitable[int]],
+    batch_size: int
+) -> ImportReport:
+    report = ImportReport()
+    seen = set()
+    batch: List[Any] = []
+
+    async def flush():
+        inserted = await write(batch)
+        report.inserted += inserted
+        report.duplicates += len(batch) - inserted
+        batch.clear()
+
+    async for number, record in records:
+        report.read += 1
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            item = convert(record)
+        except ValueError as e:
+            report.reject(number, e)
+            continue
+        key = key_of(item)
+        if key in seen:
+            report.duplicates += 1
+            continue
+        seen.add(key)
+        batch.append(item)
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+    return report
+
+
+async def import_events(
+    records: AsyncIterable[Record],
+    guild_id: Optional[int] = None,
+    created_by: Optional[int] = None,
+    batch_size: int = BULK_BATCH_SIZE
+) -> ImportReport:
+    """Validate and store events in unordered batches, skipping titles their guild already has.
+
+    Every event goes to ``guild_id``; if None, to the guild named in its record.
+    """
+    return await _import(
+        records,
+        lambda r: event_from_record(r, guild_id, created_by),
+        lambda e: (e["guild_id"], normalize_key(e["title"])),
+        db.add_events,
+        batch_size
+    )
+
+
+async def import_facts(records: AsyncIterable[Record], batch_size: int = BULK_BATCH_SIZE) -> ImportReport:
+    """Store facts in unordered batches, skipping texts already stored."""
+    return await _import(records, fact_from_record, normalize_key, db.add_facts, batch_size)
+
+
+# -----------------------------
+# Export
+# -----------------------------
+
+def event_to_record(event: Dict[str, Any]) -> Dict[str, Any]:
+    date = coerce_event_date(event.get("date"))
+    return {
+        "title": event.get("title"),
+        # ISO dates read back unambiguously
+        "date": date.date().isoformat() if date else event.get("date"),
+        "description": event.get("description"),
+        "guild_id": event.get("guild_id"),
+        "created_by": event.get("created_by"),
+        "created_at": event.get("created_at"),
+    }
+
+
+async def _write(records: AsyncIterable[Dict[str, Any]], fields: Tuple[str, ...], out: TextIO, fmt: str) -> int:
+    count = 0
+    writer = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore") if fmt == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+    async for record in records:
+        if writer is not None:
+            writer.writerow(record)
+        else:
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        count += 1
+    return count
+
+
+async def export_events(out: TextIO, fmt: str, guild_id: Optional[int] = None) -> int:
+    """Write a guild's stored events (every guild's if None) to ``out`` as they are read; returns how many."""
+    async def records():
+        async for event in db.export_events(guild_id):
+            yield event_to_record(event)
+    return await _write(records(), EVENT_FIELDS, out, fmt)
+
+
+async def export_facts(out: TextIO, fmt: str) -> int:
+    """Write every stored fact to ``out`` as it is read; returns how many."""
+    async def records():
+        async for text in db.export_facts():
+            yield {"text": text}
+    return await _write(records(), FACT_FIELDS, out, fmt)
+
+
+async def export_to_buffer(export: Callable[[TextIO, str], Awaitable[int]], fmt: str) -> Tuple[BinaryIO, int]:
+    """Run ``export`` into a rewound binary buffer ready to upload, and return it with the row count."""
+    buffer = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    text = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+    count = await export(text, fmt)
+    text.flush()
+    text.detach()
+    buffer.seek(0)
+    return buffer, count
+
+
+async def stream_url_lines(url: str) -> AsyncIterator[bytes]:
+    """Download ``url`` line by line (e.g. a Discord attachment) without holding the whole body."""
+    # aiohttp comes with discord.py; imported here so bot.utils stays light
+    import aiohttp
+
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                yield line
@@ -0,0 +1,150 @@
+import contextlib
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from bot.utils.storage.base import StorageBackend, StorageUnavailable
+
+log = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails storage calls fast while the store is unreachable.
+
+    After ``failure_threshold`` consecutive outage errors the circuit opens
+    and every call raises StorageUnavailable at once, instead of each one
+    waiting out the driver's timeouts. ``reset_timeout`` seconds later a
+    single call is let through as a probe: if it succeeds the circuit
+    closes, otherwise it stays open for another ``reset_timeout``.
+
+    Only ``errors`` count as outages; any other exception (a duplicate
+    key, a bad query) means the store answered.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, errors: Tuple[type, ...] = ()):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.errors = errors
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        # Times the circuit opened, and calls refused while it was open
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def closed(self) -> bool:
+        return self.state == CLOSED
+
+    @contextlib.contextmanager
+    def guard(self) -> Iterator[None]:
+        """Run the enclosed storage call under the breaker.
+
+        Raises StorageUnavailable without running it while the circuit is
+        open, and in place of an outage error raised by it.
+        """
+        probe = self._acquire()
+        try:
+            yield
+        except self.errors as e:
+            self._failure(probe)
+            raise StorageUnavailable(str(e) or type(e).__name__) from e
+        except Exception:
+            self._success(probe)
+            raise
+        except BaseException:
+            # Cancelled (or an export abandoned midway): no verdict either way
+            if probe:
+                self._probing = False
+            raise
+        else:
+            self._success(probe)
+
+    def _acquire(self) -> bool:
+        """Whether this call is the recovery probe; raises if the call may not run."""
+        if self.state == CLOSED:
+            return False
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        raise StorageUnavailable("storage circuit is open")
+
+    def _success(self, probe: bool) -> None:
+        if self.state != CLOSED:
+            log.info("Storage reachable again; circuit closed after %d failure(s)", self.failures)
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def _failure(self, probe: bool) -> None:
+        self.failures += 1
+        if probe:
+            self._probing = False
+            self._open()
+        elif self.state == CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        if self.state != OPEN:
+            self.trips += 1
+            log.warning(
+                "Storage unreachable after %d failure(s); failing fast for %gs",
+                self.failures, self.reset_timeout
+            )
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "trips": self.trips, "rejected": self.rejected}
+
+
+class GuardedBackend:
+    """A storage backend whose every query goes through a CircuitBreaker.
+
+    Coroutine methods and streaming exports are wrapped (once each, on
+    first use); plain attributes such as ``name`` pass straight through.
+    """
+
+    def __init__(self, backend: StorageBackend, breaker: CircuitBreaker):
+        self.backend = backend
+        self.breaker = breaker
+        self._wrapped: Dict[str, Callable] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        wrapped = self._wrapped.get(name)
+        if wrapped is not None:
+            return wrapped
+        attr = getattr(self.backend, name)
+        if inspect.iscoroutinefunction(attr):
+            wrapped = self._guard_call(attr)
+        elif inspect.isasyncgenfunction(attr):
+            wrapped = self._guard_stream(attr)
+        else:
+            return attr
+        self._wrapped[name] = wrapped
+        return wrapped
+
+    def _guard_call(self, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with self.breaker.guard():
+                return await fn(*args, **kwargs)
+        return wrapper
+
+    def _guard_stream(self, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with self.breaker.guard():
+                async for item in fn(*args, **kwargs):
+                    yield item
+        return wrapper
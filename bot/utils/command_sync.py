@@ -0,0 +1,51 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from discord import app_commands
+
+from bot.utils.database import db
+
+
+@dataclass
+class SyncResult:
+    """What ``sync_commands`` did."""
+
+    synced: bool
+    tree_hash: str
+    count: int = 0
+    duration: float = 0.0
+    # Duration of the last real sync, i.e. the time a skipped sync saved
+    saved: Optional[float] = None
+
+
+def command_tree_hash(tree: app_commands.CommandTree) -> str:
+    """Stable hash of the global command payload Discord would receive.
+
+    Commands are sorted by name and keys serialized in sorted order, so
+    the hash only changes when a name, description, option or permission
+    actually changes.
+    """
+    payload = sorted((cmd.to_dict() for cmd in tree.get_commands()), key=lambda c: (c.get("type", 1), c["name"]))
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+async def sync_commands(tree: app_commands.CommandTree, application_id: int, force: bool = False) -> SyncResult:
+    """Globally sync ``tree`` unless the last synced hash matches.
+
+    The hash is kept in storage per application, so restarts and the other
+    processes in a cluster see it too.
+    """
+    tree_hash = command_tree_hash(tree)
+    state = await db.get_command_sync_state(application_id)
+    if not force and state and state.get("hash") == tree_hash:
+        return SyncResult(synced=False, tree_hash=tree_hash, saved=state.get("duration"))
+
+    started = time.perf_counter()
+    synced = await tree.sync()
+    duration = time.perf_counter() - started
+    await db.set_command_sync_state(application_id, tree_hash, duration)
+    return SyncResult(synced=True, tree_hash=tree_hash, count=len(synced), duration=duration)
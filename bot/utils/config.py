@@ -1,18 +1,171 @@
-import os
-from dotenv import load_dotenv
-import os
-
-# Load .env from project root and override any existing shell env
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-load_dotenv(os.path.join(PROJECT_ROOT, ".env"), override=True)
-
-class Config:
-    TOKEN = os.getenv("DISCORD_TOKEN")
-    MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
-    DEFAULT_PREFIX = "!"
-    
-    @classmethod
-    def verify_config(cls):
-        if not cls.TOKEN:
-            raise ValueError("DISCORD_TOKEN is not set in environment variables")
-        return True
+import os
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+# Load .env from project root and override any existing shell env
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+load_dotenv(os.path.join(PROJECT_ROOT, ".env"), override=True)
+
+# Accepted MEMORY_PROFILE values; see bot.bot.client_options
+MEMORY_PROFILES = ("standard", "low")
+
+class Config:
+    TOKEN = os.getenv("DISCORD_TOKEN")
+    MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+    # MongoDB connection pool and timeouts, so an unreachable cluster fails a
+    # command quickly instead of hanging past Discord's 3-second window
+    MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "2000"))
+    MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "2000"))
+    MONGODB_SOCKET_TIMEOUT_MS = int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "5000"))
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "1000"))
+    # Circuit breaker: consecutive storage outages before failing fast, and
+    # seconds before one call is let through to test for recovery
+    DB_BREAKER_FAILURES = int(os.getenv("DB_BREAKER_FAILURES", "3"))
+    DB_BREAKER_RESET_SECONDS = float(os.getenv("DB_BREAKER_RESET_SECONDS", "30"))
+    # Where events and facts live: "mongodb", "sqlite" or "memory"
+    STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "mongodb")
+    SQLITE_PATH = os.getenv("SQLITE_PATH", "cyberbot.db")
+    DEFAULT_PREFIX = "!"
+    # Seconds the in-process events board stays fresh before re-reading MongoDB
+    EVENT_CACHE_TTL = float(os.getenv("EVENT_CACHE_TTL", "60"))
+    # Seconds between re-reading fact IDs, to pick up facts added by other processes
+    FACT_POOL_TTL = float(os.getenv("FACT_POOL_TTL", "3600"))
+    # Seconds before the event title autocomplete index is refreshed in the background
+    TITLE_INDEX_TTL = float(os.getenv("TITLE_INDEX_TTL", "300"))
+    # Daily fact fan-out: concurrent sends and retries per guild after a 429
+    DAILY_FACT_CONCURRENCY = int(os.getenv("DAILY_FACT_CONCURRENCY", "10"))
+    DAILY_FACT_MAX_RETRIES = int(os.getenv("DAILY_FACT_MAX_RETRIES", "3"))
+    # Hours before an event's date (midnight UTC) to post reminders, e.g. "24,1"; empty disables
+    EVENT_REMINDER_HOURS = [float(h) for h in os.getenv("EVENT_REMINDER_HOURS", "24").split(",") if h.strip()]
+    # Server that inherits events created before boards were per guild; unset leaves them unlisted
+    LEGACY_EVENTS_GUILD_ID = int(os.getenv("LEGACY_EVENTS_GUILD_ID")) if os.getenv("LEGACY_EVENTS_GUILD_ID") else None
+    # Sharding: unset runs one unsharded connection; "auto" lets Discord choose the count
+    SHARD_COUNT = os.getenv("SHARD_COUNT")
+    # Shards this process runs, e.g. "0-3,8" (needs a numeric SHARD_COUNT)
+    SHARD_IDS = os.getenv("SHARD_IDS")
+    # Worker processes started by `python -m bot.cluster` (0 = one per CPU core)
+    CLUSTER_PROCESSES = int(os.getenv("CLUSTER_PROCESSES", "0"))
+    # Local Prometheus endpoint, off unless a port is set (e.g. 9108); cluster
+    # workers use consecutive ports. Read through metrics_port()
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = os.getenv("METRICS_PORT", "0")
+    # "standard" (member + message content intents, default caches) or "low"
+    # (guild events only, no member or message caches)
+    MEMORY_PROFILE = os.getenv("MEMORY_PROFILE", "standard").lower()
+    # Logging: root level, per-logger overrides ("discord=WARNING,bot.commands=INFO"),
+    # "json" or "text" output, and the share of per-command lines kept (0-1)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+    COMMAND_LOG_SAMPLE_RATE = float(os.getenv("COMMAND_LOG_SAMPLE_RATE", "1.0"))
+    # Seconds after a command is run before its reply is deferred ("thinking…");
+    # Discord drops interactions not answered within 3 seconds
+    RESPONSE_BUDGET_SECONDS = float(os.getenv("RESPONSE_BUDGET_SECONDS", "2.0"))
+    # Token-bucket limits per command, "command=N/seconds,...": bursts of up to N
+    # calls, refilled evenly over the period; per user, and per guild in total
+    USER_RATE_LIMITS = os.getenv("USER_RATE_LIMITS", "sm_fact=5/30,sm_events=5/30")
+    GUILD_RATE_LIMITS = os.getenv("GUILD_RATE_LIMITS", "sm_fact=30/30,sm_events=30/30")
+    # Largest file /sm_importevents and /sm_importfacts accept, in bytes
+    IMPORT_MAX_BYTES = int(os.getenv("IMPORT_MAX_BYTES", str(5 * 1024 * 1024)))
+    # Sync slash commands at startup even if the command tree hash is unchanged
+    FORCE_COMMAND_SYNC = os.getenv("FORCE_COMMAND_SYNC", "").lower() in ("1", "true", "yes")
+    
+    @staticmethod
+    def parse_shard_ids(spec: str) -> List[int]:
+        """Parse "0-3,8" into [0, 1, 2, 3, 8]."""
+        ids = []
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                start, end = part.split("-", 1)
+                ids.extend(range(int(start), int(end) + 1))
+            else:
+                ids.append(int(part))
+        return sorted(set(ids))
+    
+    @staticmethod
+    def parse_rate_limits(spec: str) -> Dict[str, Tuple[int, float]]:
+        """Parse "sm_fact=5/30,sm_events=10/60" into {command: (calls, seconds)}."""
+        limits = {}
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            command, limit = part.split("=", 1)
+            calls, seconds = limit.split("/", 1)
+            limits[command.strip().lstrip("/")] = (int(calls), float(seconds))
+        return limits
+    
+    @classmethod
+    def sharding(cls) -> Tuple[bool, Optional[int], Optional[List[int]]]:
+        """Return (sharded, shard_count, shard_ids) from SHARD_COUNT/SHARD_IDS.
+
+        shard_count None with sharded=True means Discord's recommended count;
+        shard_ids None means this process runs every shard.
+        """
+        if not cls.SHARD_COUNT:
+            return False, None, None
+        count = None if cls.SHARD_COUNT.lower() == "auto" else int(cls.SHARD_COUNT)
+        ids = cls.parse_shard_ids(cls.SHARD_IDS) if cls.SHARD_IDS else None
+        return True, count, ids
+    
+    @classmethod
+    def metrics_port(cls) -> int:
+        """The /metrics port from METRICS_PORT; 0 when the endpoint is disabled."""
+        return int(cls.METRICS_PORT or 0)
+    
+    @classmethod
+    def mongo_client_options(cls) -> Dict[str, int]:
+        """Keyword arguments for the MongoDB client (0 leaves a timeout unset)."""
+        options = {
+            "maxPoolSize": cls.MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": cls.MONGODB_MIN_POOL_SIZE,
+            "serverSelectionTimeoutMS": cls.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            "connectTimeoutMS": cls.MONGODB_CONNECT_TIMEOUT_MS,
+            "socketTimeoutMS": cls.MONGODB_SOCKET_TIMEOUT_MS,
+            "waitQueueTimeoutMS": cls.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        }
+        return {k: v for k, v in options.items() if v or k.endswith("PoolSize")}
+    
+    @classmethod
+    def verify_config(cls):
+        if not cls.TOKEN:
+            raise ValueError("DISCORD_TOKEN is not set in environment variables")
+        try:
+            sharded, count, ids = cls.sharding()
+        except ValueError:
+            raise ValueError("SHARD_COUNT must be a number or 'auto', and SHARD_IDS like '0-3,8'")
+        if ids is not None and count is None:
+            raise ValueError("SHARD_IDS requires a numeric SHARD_COUNT")
+        if ids is not None and any(i < 0 or i >= count for i in ids):
+            raise ValueError(f"SHARD_IDS must be between 0 and {count - 1}")
+        if any(h <= 0 for h in cls.EVENT_REMINDER_HOURS):
+            raise ValueError("EVENT_REMINDER_HOURS must be positive numbers of hours")
+        if cls.MONGODB_MAX_POOL_SIZE < 1 or cls.MONGODB_MIN_POOL_SIZE > cls.MONGODB_MAX_POOL_SIZE:
+            raise ValueError("MONGODB_MAX_POOL_SIZE must be at least 1 and no less than MONGODB_MIN_POOL_SIZE")
+        if cls.DB_BREAKER_FAILURES < 1:
+            raise ValueError("DB_BREAKER_FAILURES must be at least 1")
+        if not 0 <= cls.RESPONSE_BUDGET_SECONDS < 3:
+            raise ValueError("RESPONSE_BUDGET_SECONDS must be at least 0 and under Discord's 3 second limit")
+        try:
+            limits = [*cls.parse_rate_limits(cls.USER_RATE_LIMITS).values(),
+                      *cls.parse_rate_limits(cls.GUILD_RATE_LIMITS).values()]
+        except ValueError:
+            raise ValueError("USER_RATE_LIMITS and GUILD_RATE_LIMITS must look like 'sm_fact=5/30,sm_events=5/30'")
+        if any(calls < 1 or seconds <= 0 for calls, seconds in limits):
+            raise ValueError("Rate limits need at least 1 call over a positive number of seconds")
+        if cls.IMPORT_MAX_BYTES < 1:
+            raise ValueError("IMPORT_MAX_BYTES must be at least 1")
+        try:
+            port = cls.metrics_port()
+        except ValueError:
+            raise ValueError("METRICS_PORT must be a port number, or 0 to disable metrics")
+        if not 0 <= port <= 65535:
+            raise ValueError("METRICS_PORT must be between 0 (disabled) and 65535")
+        if cls.MEMORY_PROFILE not in MEMORY_PROFILES:
+            raise ValueError(f"MEMORY_PROFILE must be one of: {', '.join(MEMORY_PROFILES)}")
+        return True
@@ -1,125 +1,781 @@
-import os
-import random
-from typing import List, Dict, Any, Optional
-
-try:
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from pymongo import ReturnDocument  # needed for MongoDB modify
-    MONGO_AVAILABLE = True
-except ImportError:
-    MONGO_AVAILABLE = False
-
-
-class Database:
-    def __init__(self, use_mongodb: bool = True):
-        if not MONGO_AVAILABLE:
-            raise ImportError("MongoDB drivers not available. Ensure 'motor' and 'pymongo' are installed.")
-        self.use_mongodb = True  # Force MongoDB-only
-        self._init_mongodb()
-
-    def _init_mongodb(self):
-        """Initialize MongoDB connection"""
-        self.client = AsyncIOMotorClient(os.getenv("MONGODB_URI", "mongodb://localhost:27017"))
-        self.db = self.client.get_database("cyberbot_db")
-        self.events_collection = self.db.events
-        self.facts_collection = self.db.facts
-        print("✅ Using MongoDB for data storage")
-
-    # JSON storage removed: MongoDB-only backend
-
-    # -----------------------------
-    # Event methods
-    # -----------------------------
-
-    async def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        await self.events_collection.insert_one(event_data)
-        return event_data
-
-    async def get_events(self) -> List[Dict[str, Any]]:
-        return await self.events_collection.find().sort("date", 1).to_list(length=100)
-
-    async def remove_event(self, title: str) -> bool:
-        result = await self.events_collection.delete_one(
-            {"title": {"$regex": f"^{title}$", "$options": "i"}}
-        )
-        return result.deleted_count > 0
-
-    async def clear_events(self) -> None:
-        """Clear all events"""
-        await self.events_collection.delete_many({})
-
-    async def modify_event(
-        self,
-        title: str,
-        new_title: Optional[str] = None,
-        new_description: Optional[str] = None,
-        new_date: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Modify an existing event"""
-        updates = {}
-        if new_title:
-            updates["title"] = new_title
-        if new_date:
-            updates["date"] = new_date
-        if new_description:
-            updates["description"] = new_description
-
-        if not updates:
-            return None
-
-        updated = await self.events_collection.find_one_and_update(
-            {"title": {"$regex": f"^{title}$", "$options": "i"}},
-            {"$set": updates},
-            return_document=ReturnDocument.AFTER
-        )
-        return updated
-
-    # -----------------------------
-    # Fact methods
-    # -----------------------------
-
-    async def add_fact(self, fact: str) -> None:
-        await self.facts_collection.insert_one({"text": fact})
-
-    async def get_random_fact(self) -> Optional[str]:
-        count = await self.facts_collection.count_documents({})
-        if count == 0:
-            return None
-        random_skip = random.randint(0, count - 1)
-        fact = await self.facts_collection.find().skip(random_skip).limit(1).to_list(1)
-        return fact[0]["text"] if fact else None
-
-    async def get_all_facts(self) -> List[str]:
-        """Return all facts as a list of strings, ordered by insertion."""
-        docs = await self.facts_collection.find({}, {"text": 1, "_id": 0}).to_list(length=1000)
-        return [d.get("text", "") for d in docs]
-
-    async def remove_fact(self, fact_text: str) -> bool:
-        """Remove a fact by exact text (case-insensitive). Returns True if removed."""
-        result = await self.facts_collection.delete_one({
-            "text": {"$regex": f"^{fact_text}$", "$options": "i"}
-        })
-        return result.deleted_count > 0
-
-    async def initialize_default_facts(self) -> None:
-        """Ensure default facts exist in MongoDB."""
-        count = await self.facts_collection.count_documents({})
-        if count == 0:
-            default_facts = [
-                "The first computer virus was created in 1971 and was called 'Creeper'.",
-                "Phishing attacks account for more than 80% of reported security incidents.",
-                "A strong password should be at least 12 characters long.",
-                "Multi-factor authentication (MFA) can prevent 99.9% of account compromise attacks.",
-                "The cost of cybercrime is expected to reach $10.5 trillion annually by 2025."
-            ]
-            await self.facts_collection.insert_many([{ "text": f } for f in default_facts])
-
-    # -----------------------------
-    # Helpers
-    # -----------------------------
-
-    # JSON helpers removed
-
-
-# Create global instance (MongoDB-only)
-db = Database(use_mongodb=True)
+import asyncio
+import bisect
+import functools
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Dict, Any, Hashable, Optional
+
+from bot.utils.circuit import CircuitBreaker, GuardedBackend
+from bot.utils.config import Config
+from bot.utils.dates import start_of_today
+from bot.utils.fact_picker import FactPicker
+from bot.utils.reminders import ReminderHeap
+from bot.utils.single_flight import SingleFlight
+from bot.utils.metrics import (
+    REGISTRY, DB_LATENCY, DB_ERRORS, CACHE_REQUESTS, CACHE_HIT_RATIO, STORAGE_DEGRADED, STORAGE_REJECTED, QUERIES_COALESCED,
+    timed_methods
+)
+from bot.utils.title_index import TitleIndex, MAX_SUGGESTIONS
+from bot.utils.storage import StorageBackend, DuplicateError, StorageUnavailable, create_backend
+from bot.utils.storage.base import EventCursor
+
+# Maximum number of events returned for the events board
+EVENTS_BOARD_LIMIT = 100
+# Documents per bulk_write when migrating legacy string dates
+DATE_MIGRATION_BATCH = 500
+# Page sizes for /sm_events and /sm_listfacts (embeds allow 25 fields / 4096 chars)
+EVENTS_PAGE_SIZE = 10
+FACTS_PAGE_SIZE = 10
+# Default and maximum results for /sm_searchfacts
+FACT_SEARCH_LIMIT = 10
+MAX_FACT_SEARCH_LIMIT = 25
+# Rows per insert_many / cursor batch for bulk import and export
+BULK_BATCH_SIZE = 500
+# Bot state key prefix for the last global command sync
+COMMAND_SYNC_STATE = "command_sync"
+# Guilds whose events board is cached; the least recently viewed is dropped past this
+MAX_CACHED_BOARDS = 1000
+# Recently served facts kept for /sm_fact while storage is unreachable
+FACT_SNAPSHOT_SIZE = 100
+
+
+def event_cursor(event: Dict[str, Any]) -> EventCursor:
+    """Keyset position of an event on the board: (date, _id)."""
+    return (event["date"], event["_id"])
+
+
+class EventBoardCache:
+    """In-process copy of the events board.
+
+    Database writes keep it in sync (write-through); the TTL bounds how long
+    an edit made outside this process (another bot instance, Atlas UI) can
+    go unnoticed. A TTL of 0 disables caching.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._events: Optional[List[Dict[str, Any]]] = None
+        self._loaded_at = 0.0
+        # True when the cached list holds every event, not just the first page
+        self._complete = False
+        # Bumped on every load or write, so rendered pages can be keyed on it
+        self.version = 0
+
+    def get(self) -> Optional[List[Dict[str, Any]]]:
+        if self._events is not None and time.monotonic() - self._loaded_at < self.ttl:
+            self.hits += 1
+            # Events that went into the past since the board was loaded drop off here
+            today = start_of_today()
+            return [e for e in self._events if e["date"] >= today]
+        self.misses += 1
+        return None
+
+    def snapshot(self) -> Optional[List[Dict[str, Any]]]:
+        """The last board loaded, however old (None if there is none); served while storage is down."""
+        if self._events is None:
+            return None
+        today = start_of_today()
+        return [e for e in self._events if e["date"] >= today]
+
+    def set(self, events: List[Dict[str, Any]], limit: int) -> None:
+        self.version += 1
+        self._events = list(events)
+        self._complete = len(events) < limit
+        self._loaded_at = time.monotonic()
+
+    @property
+    def complete(self) -> bool:
+        """True when the cached list holds every upcoming event."""
+        return self._complete
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._events = None
+
+    def _writable(self) -> bool:
+        # Writes can only be applied in place if we hold the whole board;
+        # otherwise an add/remove may shift events across the page boundary.
+        if self._events is None:
+            return False
+        if not self._complete:
+            self.invalidate()
+            return False
+        return True
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.version += 1
+        if event["date"] < start_of_today() or not self._writable():
+            return
+        self._events.append(event)
+        self._events.sort(key=event_cursor)
+        if len(self._events) >= EVENTS_BOARD_LIMIT:
+            self.invalidate()
+
+    def replace(self, event: Dict[str, Any]) -> None:
+        self.version += 1
+        if not self._writable():
+            return
+        self._events = [e for e in self._events if e["_id"] != event["_id"]]
+        if event["date"] >= start_of_today():
+            self._events.append(event)
+        self._events.sort(key=event_cursor)
+
+    def remove(self, event_id: Any) -> None:
+        self.version += 1
+        if not self._writable():
+            return
+        self._events = [e for e in self._events if e["_id"] != event_id]
+
+    def clear(self) -> None:
+        self.version += 1
+        self._events = []
+        self._complete = True
+        self._loaded_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "cached_events": len(self._events) if self._events is not None else None,
+        }
+
+
+class EventBoards:
+    """One EventBoardCache per guild, created when the guild's board is first read.
+
+    Bounded to ``max_boards``: the least recently used board is dropped
+    (its counters are kept for the stats).
+    """
+
+    def __init__(self, ttl: float, max_boards: int = MAX_CACHED_BOARDS):
+        self.ttl = ttl
+        self.max_boards = max_boards
+        self._boards: "OrderedDict[int, EventBoardCache]" = OrderedDict()
+        self._dropped_hits = 0
+        self._dropped_misses = 0
+        # Versions keep counting across a dropped board, so stale rendered pages can't match
+        self._version_base = 0
+
+    def board(self, guild_id: int) -> EventBoardCache:
+        board = self._boards.get(guild_id)
+        if board is None:
+            board = self._boards[guild_id] = EventBoardCache(self.ttl)
+            board.version = self._version_base
+            if len(self._boards) > self.max_boards:
+                _, dropped = self._boards.popitem(last=False)
+                self._dropped_hits += dropped.hits
+                self._dropped_misses += dropped.misses
+                self._version_base = max(self._version_base, dropped.version) + 1
+        else:
+            self._boards.move_to_end(guild_id)
+        return board
+
+    def peek(self, guild_id: int) -> Optional[EventBoardCache]:
+        """The guild's board if one is cached, without creating it."""
+        return self._boards.get(guild_id)
+
+    def invalidate(self) -> None:
+        """Drop every guild's cached board."""
+        for board in self._boards.values():
+            board.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self._dropped_hits + sum(b.hits for b in self._boards.values())
+        misses = self._dropped_misses + sum(b.misses for b in self._boards.values())
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "cached_boards": len(self._boards),
+            "cached_events": sum(b.stats()["cached_events"] or 0 for b in self._boards.values()),
+        }
+
+
+# wait_ready is awaited by every interaction and would only measure startup
+@timed_methods(DB_LATENCY, DB_ERRORS, exclude=("wait_ready",))
+class Database:
+    """Storage facade used by the cogs.
+
+    Persistence is delegated to a ``StorageBackend`` chosen by
+    ``Config.STORAGE_BACKEND``; caching lives here so every backend gets it.
+    Constructing it does no I/O: the backend (and its client) is created by
+    ``connect()`` and released by ``close()``.
+
+    Every backend call goes through a circuit breaker. While it is open
+    the facade is degraded: the events board and /sm_fact are served from
+    what was last read, and everything else, writes included, raises
+    StorageUnavailable at once.
+
+    Concurrent identical reads (a board reload, a page past the board,
+    the fact listing and counts) share one query in flight.
+    """
+
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        self._backend = backend
+        self._guarded: Optional[GuardedBackend] = None
+        # Created on first use so it belongs to the running event loop
+        self._ready: Optional[asyncio.Event] = None
+        self._reset_caches()
+
+    def _reset_caches(self) -> None:
+        self.events_cache = EventBoards(Config.EVENT_CACHE_TTL)
+        self.fact_picker = FactPicker(Config.FACT_POOL_TTL)
+        # guild_id -> that guild's event titles, loaded on the first autocomplete
+        self.title_indexes: Dict[int, TitleIndex] = {}
+        # Loaded by the Events cog's reminder task (across every guild); kept in step by event writes
+        self.reminders = ReminderHeap(Config.EVENT_REMINDER_HOURS)
+        self._title_refresh: Dict[int, asyncio.Task] = {}
+        # guild_id -> settings; loaded once at startup, written through on change
+        self.guild_settings: Dict[int, Dict[str, Any]] = {}
+        # fact_id -> text of recently served facts, for /sm_fact while degraded
+        self._fact_snapshot: "OrderedDict[Any, str]" = OrderedDict()
+        self.breaker = CircuitBreaker(Config.DB_BREAKER_FAILURES, Config.DB_BREAKER_RESET_SECONDS)
+        self.flights = SingleFlight()
+
+    @property
+    def backend(self) -> StorageBackend:
+        """The storage backend, guarded by the circuit breaker."""
+        if self._backend is None:
+            raise RuntimeError("Database is not connected; await db.connect() first")
+        guarded = self._guarded
+        if guarded is None or guarded.backend is not self._backend or guarded.breaker is not self.breaker:
+            self.breaker.errors = self._backend.unavailable_errors
+            guarded = self._guarded = GuardedBackend(self._backend, self.breaker)
+        return guarded
+
+    @property
+    def connected(self) -> bool:
+        return self._backend is not None
+
+    @property
+    def degraded(self) -> bool:
+        """True while the circuit breaker is failing storage calls fast."""
+        return not self.breaker.closed
+
+    async def connect(self, backend: Optional[StorageBackend] = None) -> None:
+        """Create the storage backend (``Config.STORAGE_BACKEND`` unless one is given) and ping it.
+
+        Passing a different backend swaps storage and drops every cache
+        built from the old one.
+        """
+        if backend is not None and backend is not self._backend:
+            await self.close()
+            self._backend = backend
+            self._reset_caches()
+        elif self._backend is None:
+            self._backend = create_backend(Config.STORAGE_BACKEND)
+        await self._backend.ping()
+
+    async def ping(self) -> None:
+        """Raise if the storage backend is unreachable."""
+        await self.backend.ping()
+
+    async def close(self) -> None:
+        if self._backend is not None:
+            await self._backend.close()
+            self._backend = None
+        self._ready = None
+
+    def _ready_event(self) -> asyncio.Event:
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    def mark_ready(self) -> None:
+        """Signal that startup (indexes, migrations, settings) has finished."""
+        self._ready_event().set()
+
+    @property
+    def ready(self) -> bool:
+        """True once startup has finished and commands can be served."""
+        return self._ready is not None and self._ready.is_set()
+
+    async def wait_ready(self) -> None:
+        await self._ready_event().wait()
+
+    # -----------------------------
+    # Event methods
+    # -----------------------------
+
+    def _title_index(self, guild_id: int) -> TitleIndex:
+        index = self.title_indexes.get(guild_id)
+        if index is None:
+            index = self.title_indexes[guild_id] = TitleIndex(Config.TITLE_INDEX_TTL)
+        return index
+
+    async def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a new event in ``event_data["guild_id"]``'s board.
+
+        Raises DuplicateError if the guild already has an event with that title.
+        """
+        guild_id = event_data["guild_id"]
+        await self.backend.add_event(event_data)
+        self.events_cache.board(guild_id).add(event_data)
+        self._title_index(guild_id).add(event_data["title"])
+        self.reminders.schedule(event_data)
+        return event_data
+
+    async def add_events(self, events: List[Dict[str, Any]]) -> int:
+        """Store a batch of events (each carrying its ``guild_id``) in one write.
+
+        Titles already taken in their guild are skipped. Returns how many were stored.
+        """
+        added = await self.backend.add_events(events)
+        for event in added:
+            # Cheaper to reload a board once than to merge a batch into it
+            board = self.events_cache.peek(event["guild_id"])
+            if board is not None:
+                board.invalidate()
+            self._title_index(event["guild_id"]).add(event["title"])
+            self.reminders.schedule(event)
+        return len(added)
+
+    def export_events(
+        self, guild_id: Optional[int] = None, batch_size: int = BULK_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a guild's stored events (every guild's if None), past ones included, from one consistent read."""
+        return self.backend.export_events(batch_size, guild_id)
+
+    async def get_events(self, guild_id: int, limit: int = EVENTS_BOARD_LIMIT) -> List[Dict[str, Any]]:
+        """Return a guild's upcoming events (dated today or later), soonest first.
+
+        Served from the guild's in-process board when fresh; otherwise a
+        range query on the (guild_id, date) index.
+        """
+        if limit <= EVENTS_BOARD_LIMIT:
+            board = await self._cached_board(guild_id)
+            if board is not None:
+                return board[:limit]
+        today = start_of_today()
+        events = await self.flights.do(
+            ("get_events", guild_id, self.events_cache.board(guild_id).version, today, limit),
+            functools.partial(self.backend.get_events, guild_id, today, limit)
+        )
+        # Each caller gets its own list; the query's result is shared
+        return list(events)
+
+    async def get_events_page(
+        self, guild_id: int, after: Optional[EventCursor] = None, limit: int = EVENTS_PAGE_SIZE
+    ) -> List[Dict[str, Any]]:
+        """Return one page of a guild's upcoming events following the keyset cursor ``after``.
+
+        Pages inside the cached board are sliced from memory; pages beyond
+        it query only the requested slice through the (guild_id, date, _id) index.
+        """
+        board = await self._cached_board(guild_id)
+        if board is None:
+            return await self._query_events_page(guild_id, after, limit)
+        start = 0 if after is None else bisect.bisect_right([event_cursor(e) for e in board], after)
+        page = board[start:start + limit]
+        if len(page) == limit or self.events_cache.board(guild_id).complete:
+            return page
+        try:
+            return await self._query_events_page(guild_id, after, limit)
+        except StorageUnavailable:
+            # Degraded: the board ends where the cached part does
+            return page
+
+    async def _query_events_page(
+        self, guild_id: int, after: Optional[EventCursor], limit: int
+    ) -> List[Dict[str, Any]]:
+        today = start_of_today()
+        page = await self.flights.do(
+            ("get_events_page", guild_id, self.events_cache.board(guild_id).version, today, after, limit),
+            functools.partial(self.backend.get_events_page, guild_id, today, after, limit)
+        )
+        return list(page)
+
+    async def _cached_board(self, guild_id: int) -> Optional[List[Dict[str, Any]]]:
+        """A guild's first EVENTS_BOARD_LIMIT upcoming events, loading the cache on a miss.
+
+        Returns None when caching is disabled, so callers query directly.
+        If storage is unreachable the last board loaded is returned instead,
+        however old.
+        """
+        cache = self.events_cache.board(guild_id)
+        if self.events_cache.ttl <= 0:
+            cache.misses += 1
+            return None
+        board = cache.get()
+        if board is None:
+            try:
+                # Everyone who misses while the board reloads waits for the same query
+                board = await self.flights.do(
+                    ("load_board", guild_id, cache.version), functools.partial(self._load_board, guild_id, cache)
+                )
+            except StorageUnavailable:
+                board = cache.snapshot()
+                if board is None:
+                    raise
+        return board
+
+    async def _load_board(self, guild_id: int, cache: EventBoardCache) -> List[Dict[str, Any]]:
+        version = cache.version
+        board = await self.backend.get_events(guild_id, start_of_today(), EVENTS_BOARD_LIMIT)
+        # A write landed mid-query: this board may predate it, so don't cache it
+        if cache.version == version:
+            cache.set(board, EVENTS_BOARD_LIMIT)
+        return board
+
+    async def events_version(self, guild_id: int) -> Optional[Hashable]:
+        """Key that changes whenever a guild's upcoming-events board may have changed.
+
+        Reloads a stale board first, so a change made by another process is
+        picked up within the cache TTL. None when caching is disabled.
+        """
+        if await self._cached_board(guild_id) is None:
+            return None
+        # Events also drop off the board when their day passes
+        return (self.events_cache.board(guild_id).version, start_of_today())
+
+    async def get_upcoming_events(self, batch_size: int = BULK_BATCH_SIZE) -> List[Dict[str, Any]]:
+        """Every guild's upcoming events, however many, read in keyset pages."""
+        events: List[Dict[str, Any]] = []
+        after = None
+        while True:
+            page = await self.backend.get_events_page(None, start_of_today(), after, batch_size)
+            events.extend(page)
+            if len(page) < batch_size:
+                return events
+            after = event_cursor(page[-1])
+
+    async def get_events_by_ids(self, event_ids: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """``{_id: event}`` for the stored events among ``event_ids``, in one indexed query."""
+        return {event["_id"]: event for event in await self.backend.get_events_by_ids(event_ids)}
+
+    async def load_reminders(
+        self, keep: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """Build the reminder heap from storage and return the upcoming events it was built from.
+
+        Called once at startup; from then on event writes keep the heap
+        up to date, and due reminders are checked against storage by ID.
+        Only events passing ``keep`` are scheduled, e.g. those in guilds
+        this process serves.
+        """
+        while True:
+            changes = self.reminders.changes
+            events = await self.get_upcoming_events()
+            # A write in this process landed mid-read; read again so it isn't lost
+            if self.reminders.changes == changes:
+                break
+        if keep is not None:
+            events = [event for event in events if keep(event)]
+        self.reminders.load(events)
+        return events
+
+    async def remove_event(self, guild_id: int, title: str) -> bool:
+        removed = await self.backend.remove_event(guild_id, title)
+        if removed is None:
+            return False
+        self.events_cache.board(guild_id).remove(removed["_id"])
+        self._title_index(guild_id).remove(removed["title"])
+        self.reminders.cancel(removed["_id"])
+        return True
+
+    async def clear_events(self, guild_id: int) -> None:
+        """Clear all of a guild's events"""
+        await self.backend.clear_events(guild_id)
+        self.events_cache.board(guild_id).clear()
+        self._title_index(guild_id).clear()
+        self.reminders.cancel_guild(guild_id)
+
+    async def modify_event(
+        self,
+        guild_id: int,
+        title: str,
+        new_title: Optional[str] = None,
+        new_description: Optional[str] = None,
+        new_date: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Modify one of a guild's events. Raises DuplicateError if renamed onto another of its titles."""
+        updates = {}
+        if new_title:
+            updates["title"] = new_title
+        if new_date:
+            updates["date"] = new_date
+        if new_description:
+            updates["description"] = new_description
+
+        if not updates:
+            return None
+
+        updated = await self.backend.modify_event(guild_id, title, updates)
+        if updated is not None:
+            self.events_cache.board(guild_id).replace(updated)
+            self.reminders.schedule(updated)
+            if new_title:
+                index = self._title_index(guild_id)
+                index.remove(title)
+                index.add(updated["title"])
+        return updated
+
+    async def search_event_titles(self, guild_id: int, prefix: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """A guild's event titles starting with ``prefix`` (then those containing it), for autocomplete.
+
+        Answered from the guild's in-memory title index. Only the very
+        first call per guild queries storage; after that a stale index is
+        refreshed in the background so no keystroke waits on the database.
+        """
+        index = self._title_index(guild_id)
+        refresh = self._title_refresh.get(guild_id)
+        if not index.loaded:
+            index.load(await self.backend.get_event_titles(guild_id))
+        elif index.is_stale() and (refresh is None or refresh.done()):
+            self._title_refresh[guild_id] = asyncio.create_task(self._refresh_title_index(guild_id))
+        return index.search(prefix, limit)
+
+    async def _refresh_title_index(self, guild_id: int) -> None:
+        try:
+            self._title_index(guild_id).load(await self.backend.get_event_titles(guild_id))
+        finally:
+            self._title_refresh.pop(guild_id, None)
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create the indexes the queries rely on; return the names of any created."""
+        return await self.backend.ensure_indexes()
+
+    async def migrate_event_dates(self, batch_size: int = DATE_MIGRATION_BATCH) -> Dict[str, int]:
+        """Convert legacy string dates ("DD/MM/YYYY") to datetimes.
+
+        Safe to run on every startup. Returns converted/failed counts.
+        """
+        stats = await self.backend.migrate_event_dates(batch_size)
+        if stats["converted"]:
+            self.events_cache.invalidate()
+        return stats
+
+    async def migrate_event_guilds(self, guild_id: Optional[int]) -> Dict[str, int]:
+        """Move events stored before per-guild scoping into ``guild_id``.
+
+        Safe to run on every startup. Without a guild (LEGACY_EVENTS_GUILD_ID
+        unset) nothing moves; the returned ``unscoped`` count is what still
+        belongs to no guild and so shows on no board.
+        """
+        moved = 0
+        if guild_id is not None and await self.backend.count_unscoped_events():
+            moved = await self.backend.assign_event_guild(guild_id)
+            if moved:
+                self.events_cache.invalidate()
+                self.title_indexes.pop(guild_id, None)
+        return {"moved": moved, "unscoped": await self.backend.count_unscoped_events()}
+
+    # -----------------------------
+    # Fact methods
+    # -----------------------------
+
+    async def add_fact(self, fact: str) -> bool:
+        """Add a fact. Returns False if the same text (ignoring case and spacing) is already stored.
+
+        The check is the insert itself, against the unique index on the fact's hashed text.
+        """
+        try:
+            fact_id = await self.backend.add_fact(fact)
+        except DuplicateError:
+            return False
+        self.fact_picker.add(fact_id)
+        return True
+
+    async def add_facts(self, facts: List[str]) -> int:
+        """Store a batch of facts in one write; texts already stored are skipped.
+
+        Returns how many were stored.
+        """
+        fact_ids = await self.backend.add_facts(facts)
+        for fact_id in fact_ids:
+            self.fact_picker.add(fact_id)
+        return len(fact_ids)
+
+    def export_facts(self, batch_size: int = BULK_BATCH_SIZE) -> AsyncIterator[str]:
+        """Stream every fact's text in insertion order from one consistent read."""
+        return self.backend.export_facts(batch_size)
+
+    async def get_random_fact(self, guild_id: Optional[int] = None) -> Optional[str]:
+        """Return the next fact in ``guild_id``'s shuffle-bag rotation.
+
+        The fact ID comes from the in-memory pool, so this is a single
+        lookup by ``_id`` (none at all on the memory backend). While
+        storage is unreachable, one of the facts served recently is repeated.
+        """
+        try:
+            await self._refresh_fact_pool()
+            while True:
+                fact_id = self.fact_picker.pick(guild_id)
+                if fact_id is None:
+                    return None
+                fact = await self.backend.get_fact(fact_id)
+                if fact is not None:
+                    self._remember_facts({fact_id: fact})
+                    return fact
+                # Deleted outside this process since the last sync
+                self.fact_picker.discard(fact_id)
+        except StorageUnavailable:
+            if not self._fact_snapshot:
+                raise
+            return random.choice(list(self._fact_snapshot.values()))
+
+    def _remember_facts(self, facts: Dict[Any, str]) -> None:
+        for fact_id, text in facts.items():
+            self._fact_snapshot[fact_id] = text
+            self._fact_snapshot.move_to_end(fact_id)
+        while len(self._fact_snapshot) > FACT_SNAPSHOT_SIZE:
+            self._fact_snapshot.popitem(last=False)
+
+    async def get_facts_for_guilds(self, guild_ids: List[int]) -> Dict[int, str]:
+        """Pick the next fact for each guild and fetch them all in one query.
+
+        Guilds whose pick was deleted since the last pool sync are left out.
+        """
+        await self._refresh_fact_pool()
+        picks = {gid: self.fact_picker.pick(gid) for gid in guild_ids}
+        wanted = list({fid for fid in picks.values() if fid is not None})
+        texts = await self.backend.get_facts(wanted) if wanted else {}
+        self._remember_facts(texts)
+        for fact_id in wanted:
+            if fact_id not in texts:
+                self.fact_picker.discard(fact_id)
+        return {gid: texts[fid] for gid, fid in picks.items() if fid in texts}
+
+    async def _refresh_fact_pool(self) -> None:
+        if self.fact_picker.is_stale():
+            await self.flights.do(("get_fact_ids",), self._sync_fact_pool)
+
+    async def _sync_fact_pool(self) -> None:
+        self.fact_picker.sync(await self.backend.get_fact_ids())
+
+    async def facts_version(self) -> Hashable:
+        """Key that changes whenever the set of facts may have changed (synced within FACT_POOL_TTL)."""
+        await self._refresh_fact_pool()
+        return self.fact_picker.version
+
+    async def get_all_facts(self) -> List[str]:
+        """Return all facts as a list of strings, ordered by insertion."""
+        facts = await self.flights.do(
+            ("get_all_facts", self.fact_picker.version), functools.partial(self.backend.get_all_facts, limit=1000)
+        )
+        # The query's result is shared with every caller that joined it
+        return list(facts)
+
+    async def get_facts_page(self, after: Optional[Any] = None, limit: int = FACTS_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Return one page of ``{"_id", "text"}`` facts with IDs after ``after``."""
+        page = await self.flights.do(
+            ("get_facts_page", self.fact_picker.version, after, limit),
+            functools.partial(self.backend.get_facts_page, after, limit)
+        )
+        return list(page)
+
+    async def search_facts(self, query: str, limit: int = FACT_SEARCH_LIMIT) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` ``{"_id", "text"}`` facts matching ``query``, most relevant first.
+
+        Served by the backend's text index (MongoDB text index, SQLite FTS5).
+        """
+        limit = max(1, min(limit, MAX_FACT_SEARCH_LIMIT))
+        return await self.backend.search_facts(query, limit)
+
+    async def count_facts(self) -> int:
+        """Number of stored facts, answered from the in-memory ID pool."""
+        await self._refresh_fact_pool()
+        return len(self.fact_picker)
+
+    async def remove_fact(self, fact_text: str) -> bool:
+        """Remove a fact by exact text (case-insensitive). Returns True if removed."""
+        fact_id = await self.backend.remove_fact(fact_text)
+        if fact_id is None:
+            return False
+        self.fact_picker.discard(fact_id)
+        self._fact_snapshot.pop(fact_id, None)
+        return True
+
+    async def initialize_default_facts(self) -> None:
+        """Ensure default facts exist in storage."""
+        count = await self.flights.do(("count_facts",), self.backend.count_facts)
+        if count == 0:
+            default_facts = [
+                "The first computer virus was created in 1971 and was called 'Creeper'.",
+                "Phishing attacks account for more than 80% of reported security incidents.",
+                "A strong password should be at least 12 characters long.",
+                "Multi-factor authentication (MFA) can prevent 99.9% of account compromise attacks.",
+                "The cost of cybercrime is expected to reach $10.5 trillion annually by 2025."
+            ]
+            for fact_id in await self.backend.add_facts(default_facts):
+                self.fact_picker.add(fact_id)
+
+    # -----------------------------
+    # Guild settings
+    # -----------------------------
+
+    async def load_guild_settings(self) -> int:
+        """Load every guild's settings into memory; returns how many guilds have any."""
+        self.guild_settings = await self.backend.get_all_guild_settings()
+        return len(self.guild_settings)
+
+    def get_announcement_channel(self, guild_id: int) -> Optional[int]:
+        """Configured announcement channel ID for a guild (no I/O)."""
+        return self.guild_settings.get(guild_id, {}).get("announcement_channel_id")
+
+    async def set_announcement_channel(self, guild_id: int, channel_id: int) -> None:
+        self.guild_settings[guild_id] = await self.backend.update_guild_settings(
+            guild_id, {"announcement_channel_id": channel_id}
+        )
+
+    # -----------------------------
+    # Command sync state
+    # -----------------------------
+
+    async def get_command_sync_state(self, application_id: int) -> Optional[Dict[str, Any]]:
+        """``{"hash", "duration", "synced_at"}`` of the application's last global sync, or None."""
+        return await self.backend.get_state(f"{COMMAND_SYNC_STATE}:{application_id}")
+
+    async def set_command_sync_state(self, application_id: int, tree_hash: str, duration: float) -> None:
+        await self.backend.set_state(
+            f"{COMMAND_SYNC_STATE}:{application_id}",
+            {"hash": tree_hash, "duration": duration, "synced_at": time.time()}
+        )
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+
+    def breaker_stats(self) -> Dict[str, Any]:
+        """State and counters of the storage circuit breaker."""
+        return self.breaker.stats()
+
+    def coalesced_queries(self) -> Dict[str, int]:
+        """Per query, how many reads were answered by another caller's query in flight."""
+        return dict(self.flights.coalesced)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the events board caches, summed over guilds."""
+        return self.events_cache.stats()
+
+    def fact_pool_size(self) -> int:
+        """Number of fact IDs held in the in-memory selection pool."""
+        return len(self.fact_picker)
+
+
+# Global instance; call ``await db.connect()`` before use
+db = Database()
+
+
+def _collect_cache_metrics() -> None:
+    stats = db.cache_stats()
+    CACHE_REQUESTS.set(stats["hits"], "events_board", "hit")
+    CACHE_REQUESTS.set(stats["misses"], "events_board", "miss")
+    CACHE_HIT_RATIO.set(stats["hit_ratio"], "events_board")
+    STORAGE_DEGRADED.set(0.0 if db.breaker.closed else 1.0)
+    STORAGE_REJECTED.set(db.breaker.rejected)
+    for query, count in db.coalesced_queries().items():
+        QUERIES_COALESCED.set(count, query)
+
+
+REGISTRY.add_collector(_collect_cache_metrics)
@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from dateutil import parser as date_parser
+
+# Display format used on every embed
+DATE_FORMAT = "%d/%m/%Y"
+# Earliest year an event may be scheduled in
+MIN_EVENT_YEAR = 2024
+# Two parse defaults differing in day, month and year (see parse_event_date)
+_PARSE_DEFAULTS = (datetime(2000, 1, 1), datetime(2001, 2, 2))
+
+
+class EventDateError(ValueError):
+    """An event date outside the rules enforced by /sm_addevent.
+
+    ``field`` names the part that is wrong: "day", "month", "year", or
+    "date" when the day doesn't exist in that month.
+    """
+
+    def __init__(self, field: str, message: str):
+        super().__init__(message)
+        self.field = field
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching what MongoDB returns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def start_of_today() -> datetime:
+    """Midnight UTC today; events dated today still count as upcoming."""
+    now = utcnow()
+    return datetime(now.year, now.month, now.day)
+
+
+def make_event_date(day: int, month: int, year: int) -> datetime:
+    """Validate day/month/year the way /sm_addevent does and return midnight of that day.
+
+    Raises EventDateError describing the first rule broken.
+    """
+    if day < 1 or day > 31:
+        raise EventDateError("day", "Day must be between 1 and 31!")
+    if month < 1 or month > 12:
+        raise EventDateError("month", "Month must be between 1 and 12!")
+    if year < MIN_EVENT_YEAR:
+        raise EventDateError("year", f"Year must be {MIN_EVENT_YEAR} or later!")
+    if month in [4, 6, 9, 11] and day > 30:  # Months with 30 days
+        raise EventDateError("date", f"Month {month} only has 30 days!")
+    if month == 2:  # February
+        is_leap_year = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+        max_feb_days = 29 if is_leap_year else 28
+        if day > max_feb_days:
+            raise EventDateError("date", f"February {year} only has {max_feb_days} days!")
+    return datetime(year, month, day)
+
+
+def parse_event_date(text: str) -> datetime:
+    """Parse a free-form date ("25/12/2025", "2025-12-25", "Dec 25 2025").
+
+    Day-first is assumed for ambiguous numeric dates, matching the DD/MM/YYYY
+    format shown on the board. Raises ValueError if the text is not a date,
+    or leaves out its day, month or year.
+    """
+    text = text.strip()
+    try:
+        # ISO dates are unambiguous; dateutil's dayfirst would swap their day and month
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            # dateutil fills missing parts from its default: parsing against two
+            # defaults that differ in every part shows whether any was missing
+            parsed, other = (date_parser.parse(text, dayfirst=True, default=d) for d in _PARSE_DEFAULTS)
+        except (ValueError, OverflowError) as e:
+            raise ValueError(f"Could not understand the date '{text}'") from e
+        if parsed.date() != other.date():
+            raise ValueError(f"The date '{text}' needs a day, month and year")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def event_date_from_text(text: str) -> datetime:
+    """Parse a typed date and check it like make_event_date(); returns midnight of that day.
+
+    Raises EventDateError for a date /sm_addevent would refuse, and
+    ValueError for text that isn't a complete date.
+    """
+    parsed = parse_event_date(text)
+    return make_event_date(parsed.day, parsed.month, parsed.year)
+
+
+def coerce_event_date(value: Any) -> Optional[datetime]:
+    """Convert a stored date (datetime or legacy string) to a datetime, or None."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return parse_event_date(value)
+        except ValueError:
+            return None
+    return None
+
+
+def format_event_date(value: Any) -> str:
+    """Render a stored event date as DD/MM/YYYY; unknown values are shown as-is."""
+    parsed = coerce_event_date(value)
+    if parsed is None:
+        return str(value)
+    return parsed.strftime(DATE_FORMAT)
+
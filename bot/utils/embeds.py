@@ -0,0 +1,151 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
+
+import discord
+
+from bot.utils.database import MAX_CACHED_BOARDS
+from bot.utils.metrics import REGISTRY, CACHE_REQUESTS, CACHE_HIT_RATIO
+
+if TYPE_CHECKING:
+    from bot.utils.bulk import ImportReport
+
+CHESS_GREEN = discord.Color.from_rgb(29, 185, 84)
+
+# Rendered pages kept per namespace; browsing past this renders uncached
+MAX_CACHED_PAGES = 256
+# Namespaces kept (one per guild's events board); like the boards themselves,
+# the least recently used is dropped beyond this
+MAX_CACHED_NAMESPACES = MAX_CACHED_BOARDS
+
+
+class RenderCache:
+    """Rendered embeds (and the rows behind them) keyed by data version.
+
+    Each namespace holds pages for a single version. Looking one up or
+    storing one under a newer version drops everything rendered for the
+    old one, so a write invalidates its pages simply by bumping the
+    version. Cached embeds are shared between sends and must not be
+    mutated. At most ``max_namespaces`` namespaces are kept, least
+    recently used dropped first.
+    """
+
+    def __init__(self, max_pages: int = MAX_CACHED_PAGES, max_namespaces: int = MAX_CACHED_NAMESPACES):
+        self.max_pages = max_pages
+        self.max_namespaces = max_namespaces
+        self.hits = 0
+        self.misses = 0
+        self._namespaces: "OrderedDict[str, Tuple[Hashable, Dict[Hashable, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._namespaces)
+
+    def _pages(self, namespace: str, version: Hashable) -> Dict[Hashable, Any]:
+        entry = self._namespaces.get(namespace)
+        if entry is None or entry[0] != version:
+            entry = self._namespaces[namespace] = (version, {})
+            if len(self._namespaces) > self.max_namespaces:
+                self._namespaces.popitem(last=False)
+        self._namespaces.move_to_end(namespace)
+        return entry[1]
+
+    def get(self, namespace: str, version: Optional[Hashable], key: Hashable) -> Optional[Any]:
+        if version is None:
+            return None
+        value = self._pages(namespace, version).get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, namespace: str, version: Optional[Hashable], key: Hashable, value: Any) -> None:
+        if version is None:
+            return
+        pages = self._pages(namespace, version)
+        if len(pages) < self.max_pages:
+            pages[key] = value
+
+    def clear(self) -> None:
+        self._namespaces.clear()
+
+
+render_cache = RenderCache()
+
+
+def _collect_render_metrics() -> None:
+    total = render_cache.hits + render_cache.misses
+    CACHE_REQUESTS.set(render_cache.hits, "rendered_pages", "hit")
+    CACHE_REQUESTS.set(render_cache.misses, "rendered_pages", "miss")
+    CACHE_HIT_RATIO.set(render_cache.hits / total if total else 0.0, "rendered_pages")
+
+
+REGISTRY.add_collector(_collect_render_metrics)
+
+
+def import_report_embed(report: "ImportReport", noun: str) -> discord.Embed:
+    """Summary of a bulk import, shared by the events and facts cogs."""
+    embed = discord.Embed(
+        title=f"♞ {noun.capitalize()} Imported ♞",
+        description=f"*{report.inserted} new {noun} added.*",
+        color=CHESS_GREEN if report.inserted or not report.invalid else discord.Color.red()
+    )
+    embed.add_field(name="📥 Rows Read", value=str(report.read), inline=True)
+    embed.add_field(name="♻️ Duplicates Skipped", value=str(report.duplicates), inline=True)
+    embed.add_field(name="❌ Invalid Rows", value=str(report.invalid), inline=True)
+    if report.errors:
+        more = report.invalid - len(report.errors)
+        lines = "\n".join(report.errors) + (f"\n… and {more} more" if more else "")
+        embed.add_field(name="📜 Problems", value=lines[:1024], inline=False)
+    embed.set_footer(text="♛ Bulk moves complete ♛")
+    return embed
+
+
+def import_too_large_embed(size: int, limit: int) -> discord.Embed:
+    """Reply for an import whose attachment is over IMPORT_MAX_BYTES; nothing was read."""
+    embed = discord.Embed(
+        title="❌ File Too Large ❌",
+        description=(
+            f"*That file is {size / 1024 / 1024:.1f} MB; imports take up to {limit / 1024 / 1024:.1f} MB.*\n\n"
+            "Split it into smaller files and import them one after another."
+        ),
+        color=discord.Color.red()
+    )
+    embed.set_footer(text="♜ One move at a time ♜")
+    return embed
+
+
+def storage_unavailable_embed() -> discord.Embed:
+    """Reply for a command that needs storage while it is unreachable (degraded, read-only mode)."""
+    embed = discord.Embed(
+        title="🛠️ Board Under Repair 🛠️",
+        description=(
+            "*The database can't be reached right now, so the board is read-only.*\n\n"
+            "`/sm_events` and `/sm_fact` still show the last known moves; "
+            "changes can be made again once it recovers. Try again in a minute."
+        ),
+        color=discord.Color.orange()
+    )
+    embed.set_footer(text="♜ Holding the position ♜")
+    return embed
+
+
+def starting_up_embed() -> discord.Embed:
+    """Ephemeral reply for a command received before the database bootstrap has finished."""
+    embed = discord.Embed(
+        title="♟️ Setting Up the Board ♟️",
+        description="*The bot has just restarted and is still preparing its database.*\n\nTry again in a few seconds.",
+        color=discord.Color.orange()
+    )
+    embed.set_footer(text="♜ The game begins shortly ♜")
+    return embed
+
+
+def rate_limited_embed(retry_after: float) -> discord.Embed:
+    """Ephemeral reply for a command refused by a user or guild rate limit."""
+    embed = discord.Embed(
+        title="⏳ Not So Fast ⏳",
+        description=f"*Too many moves in a row! Try again in {max(1, round(retry_after))}s.*",
+        color=discord.Color.orange()
+    )
+    embed.set_footer(text="♞ Patience wins games ♞")
+    return embed
@@ -0,0 +1,117 @@
+import random
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+
+class _ShuffleBag:
+    """Draws pool positions without replacement (sparse Fisher-Yates).
+
+    Only positions that have been swapped are stored, so a guild that has
+    seen ten facts costs ten dict entries, not a copy of the whole pool.
+    """
+
+    __slots__ = ("remaining", "swaps")
+
+    def __init__(self, size: int):
+        self.remaining = size
+        self.swaps: Dict[int, int] = {}
+
+    def draw(self) -> Optional[int]:
+        if self.remaining == 0:
+            return None
+        j = random.randrange(self.remaining)
+        last = self.remaining - 1
+        value = self.swaps.get(j, j)
+        if j == last:
+            self.swaps.pop(last, None)
+        else:
+            self.swaps[j] = self.swaps.pop(last, last)
+        self.remaining = last
+        return value
+
+    def add(self, position: int) -> None:
+        self.swaps[self.remaining] = position
+        self.remaining += 1
+
+
+class FactPicker:
+    """In-memory pool of fact IDs with a shuffle-bag per guild.
+
+    A guild sees every fact once before any repeats. Picking is O(1) and
+    needs no database access; the caller then fetches the chosen fact by
+    ``_id``. Removed facts are tombstoned and skipped, and the pool is
+    compacted once more than half of it is tombstones.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._ids: List[Any] = []
+        self._positions: Dict[Any, int] = {}
+        self._bags: Dict[Hashable, _ShuffleBag] = {}
+        self._tombstones = 0
+        self._synced_at: Optional[float] = None
+        # Bumped whenever a fact enters or leaves the pool
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def is_stale(self) -> bool:
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.ttl
+
+    def sync(self, fact_ids: Iterable[Any]) -> None:
+        """Reconcile the pool with the IDs currently in storage.
+
+        Guild bags survive the sync, so a periodic refresh doesn't reset
+        anyone's rotation.
+        """
+        current = list(fact_ids)
+        wanted = set(current)
+        for fact_id in [i for i in self._positions if i not in wanted]:
+            self.discard(fact_id)
+        for fact_id in current:
+            if fact_id not in self._positions:
+                self.add(fact_id)
+        self._synced_at = time.monotonic()
+
+    def add(self, fact_id: Any) -> None:
+        if fact_id in self._positions:
+            return
+        self.version += 1
+        position = len(self._ids)
+        self._ids.append(fact_id)
+        self._positions[fact_id] = position
+        for bag in self._bags.values():
+            bag.add(position)
+
+    def discard(self, fact_id: Any) -> None:
+        position = self._positions.pop(fact_id, None)
+        if position is None:
+            return
+        self.version += 1
+        self._ids[position] = None
+        self._tombstones += 1
+        if self._tombstones > len(self._ids) // 2:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._ids = [i for i in self._ids if i is not None]
+        self._positions = {fact_id: pos for pos, fact_id in enumerate(self._ids)}
+        self._tombstones = 0
+        # Positions changed, so existing bags no longer point at the right facts
+        self._bags.clear()
+
+    def pick(self, guild_id: Hashable = None) -> Optional[Any]:
+        """Return the next fact ID for ``guild_id``'s rotation, or None if the pool is empty."""
+        if not self._positions:
+            return None
+        bag = self._bags.get(guild_id)
+        # At most one refill: a fresh bag always contains a live ID
+        for _ in range(2):
+            if bag is None or bag.remaining == 0:
+                bag = self._bags[guild_id] = _ShuffleBag(len(self._ids))
+            while bag.remaining:
+                fact_id = self._ids[bag.draw()]
+                if fact_id is not None:
+                    return fact_id
+        return None
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+import discord
+
+from bot.utils.database import db
+from bot.utils.metrics import RATE_LIMITS
+
+# Delay before the first retry when Discord's 429 carries no Retry-After
+DEFAULT_BACKOFF = 1.0
+
+
+@dataclass
+class FanoutStats:
+    """Outcome of one fan-out run."""
+
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    rate_limited: int = 0
+    duration: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return (
+            f"sent={self.sent} failed={self.failed} skipped={self.skipped} "
+            f"rate_limited={self.rate_limited} duration={self.duration:.2f}s"
+        )
+
+
+def _retry_after(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying ``error``, or None if it should not be retried."""
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        header = getattr(error.response, "headers", {}).get("Retry-After")
+        try:
+            return float(header)
+        except (TypeError, ValueError):
+            return DEFAULT_BACKOFF * 2 ** attempt
+    return None
+
+
+async def fan_out(
+    jobs: Iterable[Optional[Callable[[], Awaitable[object]]]],
+    concurrency: int,
+    max_retries: int
+) -> FanoutStats:
+    """Run send jobs concurrently, at most ``concurrency`` at a time.
+
+    A job of None counts as skipped (e.g. a guild with nowhere to post).
+    Rate-limited sends are retried after Discord's Retry-After, with
+    exponential backoff when it is missing; any other error fails the job
+    without affecting the rest.
+    """
+    stats = FanoutStats()
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+
+    async def run(job: Callable[[], Awaitable[object]]) -> None:
+        async with semaphore:
+            for attempt in range(max_retries + 1):
+                try:
+                    await job()
+                    stats.sent += 1
+                    return
+                except Exception as e:
+                    delay = _retry_after(e, attempt)
+                    if delay is None or attempt == max_retries:
+                        stats.failed += 1
+                        stats.errors.append(f"{type(e).__name__}: {e}")
+                        return
+                    stats.rate_limited += 1
+                    RATE_LIMITS.inc("fanout")
+                    await asyncio.sleep(delay)
+
+    tasks = []
+    for job in jobs:
+        if job is None:
+            stats.skipped += 1
+        else:
+            tasks.append(run(job))
+    await asyncio.gather(*tasks)
+    stats.duration = time.perf_counter() - started
+    return stats
+
+
+class AnnouncementChannels:
+    """Where the bot posts in each guild: the /sm_setchannel channel, else
+    the first one it can post in.
+
+    The fallback scan runs once per guild per process and is remembered.
+    """
+
+    def __init__(self):
+        # guild_id -> fallback channel ID for guilds without a configured channel
+        self._fallbacks: Dict[int, int] = {}
+
+    def get(self, guild: discord.Guild) -> Optional[discord.abc.Messageable]:
+        channel_id = db.get_announcement_channel(guild.id) or self._fallbacks.get(guild.id)
+        if channel_id is not None:
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                return channel
+        for text_channel in guild.text_channels:
+            if text_channel.permissions_for(guild.me).send_messages:
+                self._fallbacks[guild.id] = text_channel.id
+                return text_channel
+        return None
+
+
+# Shared by the daily facts and event reminders
+announcement_channels = AnnouncementChannels()
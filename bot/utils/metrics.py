@@ -0,0 +1,265 @@
+import bisect
+import functools
+import inspect
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds: interactions span Discord round trips,
+# storage calls go down to in-memory cache hits
+COMMAND_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+log = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """A named metric family with fixed label names."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float]]:
+        return ()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            names = self.labelnames + (("le",) if suffix == "_bucket" else ())
+            lines.append(f"{self.name}{suffix}{_format_labels(names, labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, value: float, *labels: str) -> None:
+        """Mirror a running total kept elsewhere (e.g. a cache's own counters)."""
+        self._values[labels] = value
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield "", labels, value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DB_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [0] * (len(self.buckets) + 2)
+        # Counts are stored per bucket and made cumulative when rendered
+        i = bisect.bisect_left(self.buckets, value)
+        if i < len(self.buckets):
+            state[i] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def samples(self):
+        for labels, state in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                yield "_bucket", labels + (_format_value(bound),), cumulative
+            yield "_bucket", labels + ("+Inf",), state[-1]
+            yield "_sum", labels, state[-2]
+            yield "_count", labels, state[-1]
+
+
+class MetricsRegistry:
+    """Every metric the bot exports, rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """Run ``collect`` before each scrape, to copy in values kept elsewhere."""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            collect()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+COMMAND_LATENCY = REGISTRY.register(Histogram(
+    "cyberbot_command_latency_seconds",
+    "Time from interaction creation to the end of the slash command handler",
+    ["command", "status"], COMMAND_BUCKETS
+))
+COMMAND_ERRORS = REGISTRY.register(Counter(
+    "cyberbot_command_errors_total", "Slash command invocations that raised", ["command", "error"]
+))
+COMMAND_DEFERRALS = REGISTRY.register(Counter(
+    "cyberbot_command_deferrals_total",
+    "Interactions deferred because their handler outran the response budget", ["command"]
+))
+COMMAND_THROTTLED = REGISTRY.register(Counter(
+    "cyberbot_command_throttled_total", "Slash commands refused by a user or guild rate limit", ["command", "scope"]
+))
+RATE_LIMIT_BUCKETS = REGISTRY.register(Gauge(
+    "cyberbot_rate_limit_buckets", "User and guild token buckets currently tracked"
+))
+DB_LATENCY = REGISTRY.register(Histogram(
+    "cyberbot_db_operation_seconds", "Database facade method latency, caches included", ["method"]
+))
+DB_ERRORS = REGISTRY.register(Counter(
+    "cyberbot_db_errors_total", "Database facade calls that raised", ["method", "error"]
+))
+STORAGE_LATENCY = REGISTRY.register(Histogram(
+    "cyberbot_storage_operation_seconds", "Storage backend query latency", ["backend", "method"]
+))
+STORAGE_ERRORS = REGISTRY.register(Counter(
+    "cyberbot_storage_errors_total", "Storage backend calls that raised", ["backend", "method", "error"]
+))
+STORAGE_DEGRADED = REGISTRY.register(Gauge(
+    "cyberbot_storage_degraded", "1 while the storage circuit breaker is failing calls fast"
+))
+STORAGE_REJECTED = REGISTRY.register(Counter(
+    "cyberbot_storage_rejected_total", "Storage calls refused by the open circuit breaker"
+))
+QUERIES_COALESCED = REGISTRY.register(Counter(
+    "cyberbot_queries_coalesced_total", "Reads that joined an identical query already in flight", ["query"]
+))
+RATE_LIMITS = REGISTRY.register(Counter(
+    "cyberbot_rate_limits_total", "Discord rate limits hit", ["source"]
+))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "cyberbot_cache_requests_total", "In-memory cache lookups", ["cache", "result"]
+))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "cyberbot_cache_hit_ratio", "Share of cache lookups served from memory", ["cache"]
+))
+
+
+def timed_methods(histogram: Histogram, errors: Counter, labels: Sequence[str] = (), exclude: Sequence[str] = ()):
+    """Class decorator: time every public coroutine method defined on the class.
+
+    Each call is observed in ``histogram`` labelled ``(*labels, method)``;
+    a call that raises also increments ``errors`` with the exception type.
+    """
+    def decorate(cls):
+        for name, fn in list(vars(cls).items()):
+            if name.startswith("_") or name in exclude or not inspect.iscoroutinefunction(fn):
+                continue
+            setattr(cls, name, _timed(fn, histogram, errors, tuple(labels) + (name,)))
+        return cls
+    return decorate
+
+
+def _timed(fn, histogram: Histogram, errors: Counter, labels: LabelValues):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            errors.inc(*labels, type(e).__name__)
+            raise
+        finally:
+            histogram.observe(time.perf_counter() - started, *labels)
+    return wrapper
+
+
+class _RateLimitCounter(logging.Handler):
+    """Counts the rate-limit warnings discord.py logs, since it emits no event for them."""
+
+    PATTERNS = (
+        ("We are being rate limited", "http"),
+        ("Global rate limit", "global"),
+        ("is ratelimited", "gateway"),
+    )
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = str(record.msg)
+        for pattern, source in self.PATTERNS:
+            if pattern in message:
+                RATE_LIMITS.inc(source)
+                return
+
+
+def count_discord_rate_limits() -> None:
+    """Start counting rate limits from discord.py's HTTP client and gateway."""
+    handler = _RateLimitCounter()
+    for name in ("discord.http", "discord.gateway"):
+        logger = logging.getLogger(name)
+        if not any(isinstance(h, _RateLimitCounter) for h in logger.handlers):
+            logger.addHandler(handler)
+
+
+async def start_metrics_server(host: str, port: int) -> Optional["web.AppRunner"]:
+    """Serve ``/metrics`` on ``host:port``; returns the runner to clean up, or None if the port is taken."""
+    # aiohttp comes with discord.py; imported here so bot.utils stays light
+    from aiohttp import web
+
+    async def _metrics_handler(request: web.Request) -> web.Response:
+        return web.Response(body=REGISTRY.render().encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    app = web.Application()
+    app.router.add_get("/metrics", _metrics_handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as e:
+        log.warning("Metrics endpoint disabled: could not bind %s:%d (%s)", host, port, e)
+        await runner.cleanup()
+        return None
+    log.info("Metrics available at http://%s:%d/metrics", host, port)
+    return runner
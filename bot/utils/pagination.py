@@ -0,0 +1,125 @@
+from typing import Any, Awaitable, Callable, Hashable, List, Optional
+
+import discord
+
+from bot.utils.embeds import RenderCache
+from bot.utils.responses import edit, respond, response_budget
+
+# A page fetcher takes the keyset cursor of the last item already shown
+# (None for the first page) and a limit.
+FetchPage = Callable[[Optional[Any], int], Awaitable[List[Any]]]
+RenderPage = Callable[[List[Any], int], discord.Embed]
+DataVersion = Callable[[], Awaitable[Optional[Hashable]]]
+
+
+class KeysetPaginator(discord.ui.View):
+    """Prev/next buttons over a keyset-paginated query.
+
+    Only the page being shown is fetched, when its button is clicked. The
+    view remembers the cursor each visited page started from, so going
+    back re-runs that page's query instead of needing a reverse scan.
+
+    With a ``cache`` and ``version``, a page already rendered for the
+    current data version is sent as-is, without fetching or rendering.
+    """
+
+    def __init__(
+        self,
+        fetch: FetchPage,
+        cursor_of: Callable[[Any], Any],
+        render: RenderPage,
+        page_size: int,
+        owner_id: int,
+        timeout: float = 180,
+        cache: Optional[RenderCache] = None,
+        namespace: str = "",
+        version: Optional[DataVersion] = None
+    ):
+        super().__init__(timeout=timeout)
+        self.fetch = fetch
+        self.cursor_of = cursor_of
+        self.render = render
+        self.page_size = page_size
+        self.owner_id = owner_id
+        self.cache = cache
+        self.namespace = namespace
+        self.version = version
+        self.page = 0
+        self.items: List[Any] = []
+        self.embed: Optional[discord.Embed] = None
+        self._starts: List[Optional[Any]] = [None]
+        self._has_next = False
+        self._message: Optional[discord.InteractionMessage] = None
+
+    async def _load(self) -> None:
+        start = self._starts[self.page]
+        version = await self.version() if self.cache is not None and self.version is not None else None
+        key = (self.page, start)
+        cached = self.cache.get(self.namespace, version, key) if version is not None else None
+        if cached is not None:
+            self.items, self._has_next, self.embed = cached
+        else:
+            # One extra row tells us whether a next page exists
+            rows = await self.fetch(start, self.page_size + 1)
+            self._has_next = len(rows) > self.page_size
+            self.items = rows[:self.page_size]
+            self.embed = self.render(self.items, self.page)
+            if version is not None:
+                self.cache.put(self.namespace, version, key, (self.items, self._has_next, self.embed))
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = not self._has_next
+
+    async def load_first_page(self) -> bool:
+        """Fetch page one; returns False if there is nothing to show."""
+        await self._load()
+        return bool(self.items)
+
+    async def send(self, interaction: discord.Interaction) -> None:
+        embed = self.embed
+        if not self._has_next:
+            # Single page: no buttons to keep alive
+            await respond(interaction, embed=embed)
+            self.stop()
+            return
+        await respond(interaction, embed=embed, view=self)
+        # Also right after a deferral: the first followup fills in the original response
+        self._message = await interaction.original_response()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if self.is_finished():
+            # A click that raced the timeout; its buttons are being disabled
+            await respond(interaction, "*This board has expired; run the command again.*", ephemeral=True)
+            return False
+        if interaction.user.id != self.owner_id:
+            await respond(
+                interaction, "*Only the player who opened this board can turn its pages.*", ephemeral=True
+            )
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction) -> None:
+        # Pages past the cached ones hit storage, so clicks get a budget too
+        async with response_budget(interaction, name="page_turn"):
+            await self._load()
+            await edit(interaction, embed=self.embed, view=self)
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(0, self.page - 1)
+        await self._show(interaction)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self._starts) == self.page + 1:
+            self._starts.append(self.cursor_of(self.items[-1]))
+        self.page += 1
+        await self._show(interaction)
+
+    async def on_timeout(self) -> None:
+        for item in self.children:
+            item.disabled = True
+        if self._message is not None:
+            try:
+                await self._message.edit(view=self)
+            except discord.HTTPException:
+                pass
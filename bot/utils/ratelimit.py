@@ -0,0 +1,122 @@
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from bot.utils.config import Config
+from bot.utils.metrics import REGISTRY, RATE_LIMIT_BUCKETS
+
+# (calls, seconds): a burst of ``calls``, refilled evenly over ``seconds``
+Limit = Tuple[int, float]
+
+
+class TokenBucket:
+    """Token buckets for many keys, stored as one float per key.
+
+    Instead of a token count and a refill timestamp, each key keeps the
+    time its bucket will be full again (the generic cell rate algorithm,
+    equivalent to a token bucket). A call takes a token by pushing that
+    time one refill interval later, and is refused if it would end up
+    more than a whole period ahead.
+
+    A key whose bucket has refilled is the same as a key never seen, so
+    idle keys are dropped by a sweep run at most once per period.
+    """
+
+    __slots__ = ("calls", "period", "interval", "_full_at", "_swept_at")
+
+    def __init__(self, calls: int, period: float):
+        self.calls = calls
+        self.period = period
+        self.interval = period / calls
+        self._full_at: Dict[Hashable, float] = {}
+        self._swept_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._full_at)
+
+    def retry_after(self, key: Hashable, now: float) -> float:
+        """Seconds until ``key`` has a token again; 0 if it has one now."""
+        full_at = max(self._full_at.get(key, now), now)
+        return max(0.0, full_at + self.interval - self.period - now)
+
+    def take(self, key: Hashable, now: float) -> None:
+        """Use one of ``key``'s tokens; check retry_after() first."""
+        self._full_at[key] = max(self._full_at.get(key, now), now) + self.interval
+        if now - self._swept_at >= self.period:
+            self.evict_idle(now)
+
+    def evict_idle(self, now: float) -> int:
+        """Drop keys whose bucket is full again; returns how many were dropped."""
+        idle = [key for key, full_at in self._full_at.items() if full_at <= now]
+        for key in idle:
+            del self._full_at[key]
+        self._swept_at = now
+        return len(idle)
+
+
+class CommandRateLimiter:
+    """Per-command token buckets for each user, and for each guild as a whole.
+
+    A call must find a token in both its user's and its guild's bucket;
+    it only takes them when both have one, so refused calls cost nothing.
+    Commands without a configured limit are never throttled. State is
+    per process, like the other in-memory caches.
+    """
+
+    def __init__(
+        self,
+        user_limits: Dict[str, Limit],
+        guild_limits: Dict[str, Limit],
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.clock = clock
+        self.user_buckets = {name: TokenBucket(*limit) for name, limit in user_limits.items()}
+        self.guild_buckets = {name: TokenBucket(*limit) for name, limit in guild_limits.items()}
+
+    @classmethod
+    def from_config(cls) -> "CommandRateLimiter":
+        return cls(Config.parse_rate_limits(Config.USER_RATE_LIMITS), Config.parse_rate_limits(Config.GUILD_RATE_LIMITS))
+
+    def acquire(self, command: str, user_id: int, guild_id: Optional[int]) -> Tuple[float, Optional[str]]:
+        """Take a token for one call of ``command``.
+
+        Returns ``(0, None)`` if the call may run, otherwise the seconds to
+        wait and which limit refused it ("user" or "guild").
+        """
+        now = self.clock()
+        buckets = [("user", self.user_buckets.get(command), user_id)]
+        if guild_id is not None:
+            buckets.append(("guild", self.guild_buckets.get(command), guild_id))
+        buckets = [(scope, bucket, key) for scope, bucket, key in buckets if bucket is not None]
+        for scope, bucket, key in buckets:
+            wait = bucket.retry_after(key, now)
+            if wait:
+                return wait, scope
+        for _, bucket, key in buckets:
+            bucket.take(key, now)
+        return 0.0, None
+
+    def bucket_count(self) -> int:
+        """Keys currently tracked across every bucket."""
+        return sum(len(b) for b in (*self.user_buckets.values(), *self.guild_buckets.values()))
+
+
+_rate_limiter: Optional[CommandRateLimiter] = None
+
+
+def get_rate_limiter() -> CommandRateLimiter:
+    """The process-wide limiter, built from the config on first use.
+
+    Not built at import, so a malformed limit is reported by
+    Config.verify_config() rather than by importing this module.
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = CommandRateLimiter.from_config()
+    return _rate_limiter
+
+
+def _collect_rate_limit_metrics() -> None:
+    RATE_LIMIT_BUCKETS.set(_rate_limiter.bucket_count() if _rate_limiter is not None else 0)
+
+
+REGISTRY.add_collector(_collect_rate_limit_metrics)
@@ -0,0 +1,206 @@
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bot.utils.dates import utcnow
+
+
+@dataclass
+class Reminder:
+    event: Dict[str, Any]
+    hours_before: float
+    due: datetime
+    # The event's generation when scheduled; restore() skips it once that changes
+    generation: int = 0
+
+
+class ReminderHeap:
+    """Upcoming event reminders in a min-heap ordered by due time.
+
+    Loaded once from storage, then kept in step by the Database's event
+    writes. An edited or removed event is not searched for in the heap:
+    it gets a new generation (or none) so the old entries are skipped when
+    they surface, and the heap is compacted once most of it is stale.
+    Per-event state lasts only while the event has reminders to fire, or
+    until the next pop_due() for those it has just handed out.
+
+    Times are naive UTC, like stored event dates.
+    """
+
+    def __init__(self, hours_before: Sequence[float]):
+        self.hours_before = sorted(set(hours_before), reverse=True)
+        self.loaded = False
+        # (due, seq, event_id, hours_before, generation)
+        self._heap: List[Tuple[datetime, int, Any, float, int]] = []
+        # event_id -> event, and how many of its reminders are still to fire
+        self._events: Dict[Any, Dict[str, Any]] = {}
+        self._pending: Dict[Any, int] = {}
+        # Generations come from one counter, so an event scheduled again never reuses one
+        self._generations: Dict[Any, int] = {}
+        self._generation_seq = itertools.count()
+        # event_id -> (generation, guild_id) of the events handed out by the last pop_due()
+        self._popped: Dict[Any, Tuple[int, Any]] = {}
+        self._live = 0
+        # Bumped by every incremental update, so a reload can tell it raced one
+        self.changes = 0
+        self._seq = itertools.count()
+        # Created on first use so it belongs to the running event loop
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        """Number of reminders still to fire."""
+        return self._live
+
+    def load(self, events: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> None:
+        """Replace every scheduled reminder with those of ``events`` due after ``now``."""
+        now = now or utcnow()
+        self._heap = []
+        self._events = {}
+        self._pending = {}
+        self._generations = {}
+        self._popped = {}
+        self._live = 0
+        for event in events:
+            self._add(event, now)
+        heapq.heapify(self._heap)
+        self.loaded = True
+        self._notify()
+
+    def schedule(self, event: Dict[str, Any], now: Optional[datetime] = None) -> None:
+        """(Re)schedule an added or edited event; replaces its earlier reminders."""
+        self.cancel(event["_id"])
+        self.changes += 1
+        head = self.next_due()
+        pushed = self._add(event, now or utcnow(), push=True)
+        if pushed and (head is None or pushed < head):
+            self._notify()
+
+    def cancel(self, event_id: Any) -> None:
+        """Drop a removed event's reminders."""
+        self.changes += 1
+        # Forgotten even once every reminder was popped, so restore() skips them
+        self._popped.pop(event_id, None)
+        if self._events.pop(event_id, None) is not None:
+            self._live -= self._pending.pop(event_id)
+            del self._generations[event_id]
+            self._maybe_compact()
+
+    def cancel_guild(self, guild_id: int) -> None:
+        """Drop the reminders of every event in a guild whose board was cleared."""
+        self.changes += 1
+        scheduled = [i for i, event in self._events.items() if event.get("guild_id") == guild_id]
+        popped = [i for i, (_, popped_guild) in self._popped.items() if popped_guild == guild_id]
+        for event_id in {*scheduled, *popped}:
+            self.cancel(event_id)
+
+    def clear(self) -> None:
+        self.changes += 1
+        self.load([])
+
+    def next_due(self) -> Optional[datetime]:
+        """When the earliest live reminder is due, or None if there are none."""
+        self._drop_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Reminder]:
+        """Remove and return every live reminder due at or before ``now``.
+
+        Only the reminders of the latest call can be restore()d.
+        """
+        now = now or utcnow()
+        due = []
+        self._popped = {}
+        while self.next_due() is not None and self._heap[0][0] <= now:
+            when, _, event_id, hours, generation = heapq.heappop(self._heap)
+            event = self._events[event_id]
+            due.append(Reminder(event, hours, when, generation))
+            self._popped[event_id] = (generation, event.get("guild_id"))
+            self._live -= 1
+            self._pending[event_id] -= 1
+            if not self._pending[event_id]:
+                del self._events[event_id], self._pending[event_id], self._generations[event_id]
+        return due
+
+    def restore(self, reminders: Iterable[Reminder]) -> None:
+        """Put popped reminders back, e.g. when they could not be sent.
+
+        A reminder whose event was edited or removed since it was popped is
+        dropped: the event's current reminders are already scheduled.
+        """
+        self.changes += 1
+        restored = False
+        for reminder in reminders:
+            event_id = reminder.event["_id"]
+            # An event with nothing left in the heap is checked against its pop
+            generation = self._generations.get(event_id)
+            if generation is None and event_id in self._popped:
+                generation = self._popped[event_id][0]
+            if generation != reminder.generation:
+                continue
+            heapq.heappush(
+                self._heap, (reminder.due, next(self._seq), event_id, reminder.hours_before, reminder.generation)
+            )
+            self._events[event_id] = reminder.event
+            self._generations[event_id] = generation
+            self._pending[event_id] = self._pending.get(event_id, 0) + 1
+            self._live += 1
+            restored = True
+        if restored:
+            self._notify()
+
+    async def wait(self, timeout: Optional[float]) -> None:
+        """Sleep for ``timeout`` seconds (forever if None), or until an earlier reminder is scheduled."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def _add(self, event: Dict[str, Any], now: datetime, push: bool = False) -> Optional[datetime]:
+        """Add ``event``'s reminders that are still ahead; returns the earliest, if any."""
+        event_id = event["_id"]
+        generation = self._generations.get(event_id)
+        if generation is None:
+            generation = next(self._generation_seq)
+        # Offsets are sorted largest first, so the first one kept is the earliest
+        earliest = None
+        count = 0
+        for hours in self.hours_before:
+            due = event["date"] - timedelta(hours=hours)
+            if due <= now:
+                continue
+            entry = (due, next(self._seq), event_id, hours, generation)
+            if push:
+                heapq.heappush(self._heap, entry)
+            else:
+                self._heap.append(entry)
+            earliest = earliest or due
+            count += 1
+        if count:
+            self._events[event_id] = event
+            self._generations[event_id] = generation
+            self._pending[event_id] = count
+            self._live += count
+        return earliest
+
+    def _is_stale(self, entry) -> bool:
+        _, _, event_id, _, generation = entry
+        return event_id not in self._events or self._generations[event_id] != generation
+
+    def _drop_stale_head(self) -> None:
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * self._live + 64:
+            self._heap = [e for e in self._heap if not self._is_stale(e)]
+            heapq.heapify(self._heap)
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
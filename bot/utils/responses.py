@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import functools
+import logging
+from typing import Any, AsyncIterator, Callable, Optional
+
+import discord
+
+from bot.utils.config import Config
+from bot.utils.metrics import COMMAND_DEFERRALS
+
+log = logging.getLogger(__name__)
+
+# Where an interaction's budget state lives in ``interaction.extras``
+_STATE_KEY = "response_budget"
+
+
+class _BudgetState:
+    """Per-interaction state shared by the deferral watchdog and respond()."""
+
+    __slots__ = ("lock", "deferring", "deferred", "placeholder", "replied")
+
+    def __init__(self):
+        # Serializes "is the response done? then defer/send", so the watchdog
+        # and the handler never both try to use the one initial response
+        self.lock = asyncio.Lock()
+        self.deferring = False
+        self.deferred = False
+        # A public "thinking…" message is standing in for the reply
+        self.placeholder = False
+        self.replied = False
+
+
+def _state(interaction: discord.Interaction) -> _BudgetState:
+    state = interaction.extras.get(_STATE_KEY)
+    if state is None:
+        state = interaction.extras[_STATE_KEY] = _BudgetState()
+    return state
+
+
+def interaction_age(interaction: discord.Interaction) -> float:
+    """Seconds since Discord created the interaction (when the user ran the command)."""
+    return (discord.utils.utcnow() - interaction.created_at).total_seconds()
+
+
+async def _defer_when_due(interaction: discord.Interaction, delay: float, ephemeral: bool, name: str) -> None:
+    await asyncio.sleep(delay)
+    state = _state(interaction)
+    async with state.lock:
+        if interaction.response.is_done():
+            return
+        # From here the handler waits for the defer instead of cancelling it
+        state.deferring = True
+        try:
+            # A deferred update for buttons, a "thinking…" reply for commands
+            await interaction.response.defer(ephemeral=ephemeral)
+        except discord.HTTPException as e:
+            log.warning("Could not defer /%s: %s", name, e, extra={"command": name})
+            return
+        state.deferred = True
+        state.placeholder = not ephemeral and interaction.type is discord.InteractionType.application_command
+    COMMAND_DEFERRALS.inc(name)
+    log.info(
+        "Deferred /%s after %.2fs", name, interaction_age(interaction),
+        extra={"command": name, "guild_id": interaction.guild_id}
+    )
+
+
+@contextlib.asynccontextmanager
+async def response_budget(
+    interaction: discord.Interaction,
+    budget: Optional[float] = None,
+    ephemeral: bool = False,
+    name: Optional[str] = None
+) -> AsyncIterator[None]:
+    """Defer ``interaction`` if the enclosed work outlasts its latency budget.
+
+    Discord drops an interaction that isn't answered within three seconds
+    of being created. ``budget`` (default RESPONSE_BUDGET_SECONDS) counts
+    from that moment; once it runs out the response is deferred, and
+    replies sent through respond() or edit() go out as followups instead.
+    """
+    budget = Config.RESPONSE_BUDGET_SECONDS if budget is None else budget
+    if name is None:
+        name = interaction.command.qualified_name if interaction.command else "component"
+    state = _state(interaction)
+    delay = max(0.0, budget - interaction_age(interaction))
+    watchdog = asyncio.create_task(_defer_when_due(interaction, delay, ephemeral, name))
+    try:
+        yield
+    finally:
+        if state.deferring:
+            # Mid-request: cancelling could leave Discord's view of it unknown
+            with contextlib.suppress(Exception):
+                await watchdog
+        else:
+            watchdog.cancel()
+
+
+def auto_defer(budget: Optional[float] = None, ephemeral: bool = False) -> Callable:
+    """Run a command callback under response_budget().
+
+    Goes directly above the ``async def``, below the app_commands
+    decorators. The callback must reply through respond() so its answer
+    still arrives after a deferral. ``ephemeral`` should match the
+    command's normal answer; respond() keeps ephemeral errors private
+    even after a public deferral.
+    """
+    def decorator(callback: Callable) -> Callable:
+        @functools.wraps(callback)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            async with response_budget(interaction, budget, ephemeral):
+                return await callback(self, interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+async def respond(interaction: discord.Interaction, content: Optional[str] = None, **kwargs: Any) -> None:
+    """Reply to an interaction: its initial response, or a followup once that is used.
+
+    The first followup after a deferral replaces the "thinking…" message
+    and takes its visibility. So an ephemeral reply (usually an error)
+    after a public deferral first deletes that message, and then goes out
+    as a separate, private followup.
+    """
+    state = _state(interaction)
+    async with state.lock:
+        if not interaction.response.is_done():
+            await interaction.response.send_message(content, **kwargs)
+        else:
+            if state.placeholder and kwargs.get("ephemeral") and not state.replied:
+                try:
+                    await interaction.delete_original_response()
+                except discord.HTTPException as e:
+                    log.warning("Could not delete the deferred response: %s", e)
+            await interaction.followup.send(content, **kwargs)
+        state.placeholder = False
+        state.replied = True
+
+
+async def edit(interaction: discord.Interaction, **kwargs: Any) -> None:
+    """Edit the message a component belongs to, also after the click was deferred."""
+    state = _state(interaction)
+    async with state.lock:
+        if interaction.response.is_done():
+            await interaction.edit_original_response(**kwargs)
+        else:
+            await interaction.response.edit_message(**kwargs)
+        state.replied = True
+
+
+def has_replied(interaction: discord.Interaction) -> bool:
+    """Whether the user has been answered; a bare deferral doesn't count."""
+    state = _state(interaction)
+    return state.replied or (interaction.response.is_done() and not state.deferred)
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Abandoned(Exception):
+    """Set on a flight whose leader was cancelled; its followers start over."""
+
+
+class SingleFlight:
+    """Shares one in-flight query among concurrent callers asking for the same thing.
+
+    The first caller for a key runs the query itself; callers that arrive
+    while it runs wait for its result (or its exception) instead of issuing
+    their own. The key is forgotten as soon as the query finishes, so
+    nothing is cached beyond the flight. If the first caller is cancelled
+    midway, the next waiting caller runs the query again.
+
+    Keys are tuples whose first element names the query; ``coalesced``
+    counts, per name, the calls that joined a flight. Put a data version
+    in the key when a write must not be answered by a query issued before
+    it. Results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[Hashable, ...], "asyncio.Future[Any]"] = {}
+        self.coalesced: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Queries currently in flight."""
+        return len(self._flights)
+
+    async def do(self, key: Tuple[Hashable, ...], query: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                return await self._lead(key, query)
+            self.coalesced[key[0]] = self.coalesced.get(key[0], 0) + 1
+            try:
+                # Shielded: a waiter being cancelled must not cancel the flight
+                return await asyncio.shield(flight)
+            except _Abandoned:
+                continue
+
+    async def _lead(self, key: Tuple[Hashable, ...], query: Callable[[], Awaitable[T]]) -> T:
+        # Run inline rather than as a task: no extra loop iteration per query
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await query()
+        except BaseException as e:
+            flight.set_exception(e if isinstance(e, Exception) else _Abandoned())
+            # Retrieved here, so a flight nobody joined doesn't log a warning
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
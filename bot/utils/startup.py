@@ -0,0 +1,47 @@
+import time
+from typing import Awaitable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class StartupTimer:
+    """Breakdown of where cold-start time goes.
+
+    Phases are recorded as (name, start offset, duration) relative to the
+    timer's origin. Startup phases overlap on purpose, so the report shows
+    each one's start offset next to its duration rather than a running sum.
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases: List[Tuple[str, float, float]] = []
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def record(self, name: str, started: float) -> None:
+        """Record a phase that began at ``started`` (a perf_counter value) and ends now."""
+        now = time.perf_counter()
+        self.phases.append((name, started - self.origin, now - started))
+
+    async def track(self, name: str, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable`` and record how long it took."""
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.record(name, started)
+
+    def as_dict(self):
+        return {
+            "total": round(self.elapsed(), 3),
+            "phases": {name: {"start": round(offset, 3), "duration": round(duration, 3)}
+                       for name, offset, duration in self.phases}
+        }
+
+    def report(self) -> str:
+        width = max((len(name) for name, _, _ in self.phases), default=0)
+        lines = [f"Startup timing ({self.elapsed():.2f}s total):"]
+        for name, offset, duration in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"  {name:<{width}}  +{offset:6.2f}s  {duration:6.2f}s")
+        return "\n".join(lines)
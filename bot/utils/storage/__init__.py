@@ -0,0 +1,25 @@
+from bot.utils.storage.base import StorageBackend, DuplicateError, StorageUnavailable, fact_hash, normalize_key
+from bot.utils.storage.memory import MemoryBackend
+
+
+def create_backend(name: str) -> StorageBackend:
+    """Build the storage backend named in config ("mongodb", "sqlite" or "memory").
+
+    Drivers are imported only for the selected backend, so a memory or
+    SQLite deployment does not need motor installed.
+    """
+    from bot.utils.config import Config
+
+    name = name.lower()
+    if name in ("mongodb", "mongo"):
+        from bot.utils.storage.mongo import MongoBackend
+        return MongoBackend(Config.MONGODB_URI, **Config.mongo_client_options())
+    if name == "sqlite":
+        from bot.utils.storage.sqlite import SQLiteBackend
+        return SQLiteBackend(Config.SQLITE_PATH)
+    if name == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown STORAGE_BACKEND '{name}' (expected mongodb, sqlite or memory)")
+
+
+__all__ = ['StorageBackend', 'DuplicateError', 'StorageUnavailable', 'fact_hash', 'normalize_key', 'MemoryBackend', 'create_backend']
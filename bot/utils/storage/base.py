@@ -0,0 +1,226 @@
+import hashlib
+import heapq
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional, Tuple
+
+# Keyset cursor for the events board: (date, _id) of the last event shown
+EventCursor = Tuple[datetime, Any]
+
+
+class DuplicateError(Exception):
+    """Raised when a write would create a second event title or fact text."""
+
+
+class StorageUnavailable(Exception):
+    """Raised when storage can't be reached, or the circuit breaker is failing calls fast."""
+
+
+def normalize_key(text: str) -> str:
+    """Lookup key for titles and fact texts: case-folded, whitespace collapsed.
+
+    Stored next to the original value and uniquely indexed, so lookups are
+    exact indexed matches instead of case-insensitive regex scans.
+    """
+    return " ".join(text.split()).casefold()
+
+
+def fact_hash(text: str) -> str:
+    """Unique key for a fact: a 128-bit digest of its normalized text.
+
+    Fixed-size, so the unique index stays small and its entries short no
+    matter how long facts get.
+    """
+    return hashlib.blake2b(normalize_key(text).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def search_terms(text: str) -> List[str]:
+    """Case-folded words of a search query or fact."""
+    return re.findall(r"\w+", text.casefold())
+
+
+def rank_facts(facts: Iterable[Tuple[Any, str]], query: str, limit: int) -> List[Dict[str, Any]]:
+    """Best ``limit`` of ``(id, text)`` facts by how many query words they contain.
+
+    For backends without a text index; ties keep ID order.
+    """
+    terms = set(search_terms(query))
+    scored = []
+    for fact_id, text in facts:
+        words = search_terms(text)
+        score = (len(terms.intersection(words)), sum(w in terms for w in words))
+        if score[0]:
+            scored.append((score, fact_id, text))
+    best = heapq.nsmallest(limit, scored, key=lambda s: (-s[0][0], -s[0][1], s[1]))
+    return [{"_id": fact_id, "text": text} for _, fact_id, text in best]
+
+
+class StorageBackend(ABC):
+    """Raw persistence for events and facts.
+
+    Backends only store and fetch; caching and other policy live in
+    ``bot.utils.database.Database``, which wraps whichever backend is
+    configured. Event documents carry an ``_id`` assigned by the backend,
+    a ``date`` stored as a naive UTC datetime and the ``guild_id`` of the
+    server they belong to; every event query is scoped to one guild.
+    """
+
+    name = "base"
+    # Driver errors meaning the store itself is unreachable (not a bad query);
+    # these trip the Database's circuit breaker
+    unavailable_errors: Tuple[type, ...] = ()
+
+    async def ping(self) -> None:
+        """Raise if the backend is unreachable."""
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create whatever indexes the queries below rely on; return the ones created."""
+        return []
+
+    async def migrate_event_dates(self, batch_size: int) -> Dict[str, int]:
+        """Convert legacy string dates; only stores that predate datetimes need this."""
+        return {"converted": 0, "failed": 0}
+
+    async def count_unscoped_events(self) -> int:
+        """Number of events stored before events were scoped by guild."""
+        return 0
+
+    async def assign_event_guild(self, guild_id: int) -> int:
+        """Move every unscoped event to ``guild_id``; returns how many moved."""
+        return 0
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+
+    # -----------------------------
+    # Event methods
+    # -----------------------------
+
+    @abstractmethod
+    async def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert an event, setting its ``_id``, and return it.
+
+        Raises DuplicateError if the event's guild already has the same title key.
+        """
+
+    @abstractmethod
+    async def add_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert several events in one batch and return the ones stored.
+
+        Events whose title key is already taken in their guild are skipped, not raised.
+        """
+
+    async def get_events(self, guild_id: Optional[int], since: datetime, limit: int) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` of a guild's events dated ``since`` or later, soonest first."""
+        return await self.get_events_page(guild_id, since, None, limit)
+
+    @abstractmethod
+    async def get_events_page(
+        self, guild_id: Optional[int], since: datetime, after: Optional[EventCursor], limit: int
+    ) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` of a guild's events dated ``since`` or later, ordered by (date, _id).
+
+        ``after`` is the (date, _id) of the last event on the previous page;
+        only events strictly after it are returned. A ``guild_id`` of None
+        reads every guild's events (for the reminder scheduler).
+        """
+
+    @abstractmethod
+    async def get_events_by_ids(self, event_ids: List[Any]) -> List[Dict[str, Any]]:
+        """Return the stored events among ``event_ids``, in any guild; missing IDs are left out."""
+
+    @abstractmethod
+    async def get_event_titles(self, guild_id: int) -> List[str]:
+        """Return the title of every event stored for a guild, past ones included."""
+
+    @abstractmethod
+    async def remove_event(self, guild_id: int, title: str) -> Optional[Dict[str, Any]]:
+        """Delete one of a guild's events by title (case-insensitive); return it, or None."""
+
+    @abstractmethod
+    async def modify_event(self, guild_id: int, title: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply ``updates`` to one of a guild's events by title; return the updated event, or None.
+
+        Raises DuplicateError if a new title collides with another of the guild's events.
+        """
+
+    @abstractmethod
+    async def clear_events(self, guild_id: int) -> None:
+        """Delete every event of a guild."""
+
+    @abstractmethod
+    def export_events(self, batch_size: int, guild_id: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every event of a guild (of all guilds if None), past ones included, from one consistent snapshot."""
+
+    # -----------------------------
+    # Fact methods
+    # -----------------------------
+
+    @abstractmethod
+    async def add_fact(self, fact: str) -> Any:
+        """Insert a single fact and return its ID; raise DuplicateError if its fact_hash is already stored."""
+
+    @abstractmethod
+    async def add_facts(self, facts: List[str]) -> List[Any]:
+        """Insert several facts at once and return their IDs; duplicates are skipped."""
+
+    @abstractmethod
+    async def count_facts(self) -> int:
+        """Return the number of stored facts."""
+
+    @abstractmethod
+    async def get_fact_ids(self) -> List[Any]:
+        """Return the ID of every stored fact."""
+
+    @abstractmethod
+    async def get_fact(self, fact_id: Any) -> Optional[str]:
+        """Return the text of one fact by ID, or None if it no longer exists."""
+
+    @abstractmethod
+    async def get_facts(self, fact_ids: List[Any]) -> Dict[Any, str]:
+        """Return ``{id: text}`` for the given IDs in one query; missing IDs are left out."""
+
+    @abstractmethod
+    async def get_all_facts(self, limit: int) -> List[str]:
+        """Return up to ``limit`` facts in insertion order."""
+
+    @abstractmethod
+    async def get_facts_page(self, after: Optional[Any], limit: int) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` ``{"_id", "text"}`` facts with IDs after ``after``, in ID order."""
+
+    @abstractmethod
+    def export_facts(self, batch_size: int) -> AsyncIterator[str]:
+        """Stream every fact's text in insertion order from one consistent snapshot."""
+
+    @abstractmethod
+    async def search_facts(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` ``{"_id", "text"}`` facts matching any word of ``query``, most relevant first."""
+
+    @abstractmethod
+    async def remove_fact(self, fact_text: str) -> Optional[Any]:
+        """Delete one fact by text (case-insensitive); return its ID, or None."""
+
+    # -----------------------------
+    # Guild settings
+    # -----------------------------
+
+    @abstractmethod
+    async def get_all_guild_settings(self) -> Dict[int, Dict[str, Any]]:
+        """Return ``{guild_id: settings}`` for every guild that has any."""
+
+    @abstractmethod
+    async def update_guild_settings(self, guild_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge ``updates`` into a guild's settings (creating them) and return the result."""
+
+    # -----------------------------
+    # Bot state
+    # -----------------------------
+
+    @abstractmethod
+    async def get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the bot-wide state document stored under ``key``, or None."""
+
+    @abstractmethod
+    async def set_state(self, key: str, value: Dict[str, Any]) -> None:
+        """Store (replacing) the bot-wide state document under ``key``."""
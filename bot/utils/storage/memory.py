@@ -0,0 +1,184 @@
+import copy
+import itertools
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional, Tuple
+
+from bot.utils.metrics import STORAGE_LATENCY, STORAGE_ERRORS, timed_methods
+from bot.utils.storage.base import StorageBackend, DuplicateError, EventCursor, normalize_key, rank_facts
+
+log = logging.getLogger(__name__)
+
+
+@timed_methods(STORAGE_LATENCY, STORAGE_ERRORS, labels=("memory",))
+class MemoryBackend(StorageBackend):
+    """Process-local storage for tests, benchmarks and throwaway deployments.
+
+    Nothing is persisted; every restart begins with an empty board.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._events: Dict[int, Dict[str, Any]] = {}
+        # (guild_id, title key) -> event ID
+        self._event_keys: Dict[Tuple[int, str], int] = {}
+        self._facts: Dict[int, str] = {}
+        self._fact_keys: Dict[str, int] = {}
+        self._guild_settings: Dict[int, Dict[str, Any]] = {}
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        log.info("Using in-memory storage (data is not persisted)")
+
+    # -----------------------------
+    # Event methods
+    # -----------------------------
+
+    async def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        key = normalize_key(event_data["title"])
+        if (event_data["guild_id"], key) in self._event_keys:
+            raise DuplicateError(event_data["title"])
+        event_data["_id"] = next(self._ids)
+        event_data["title_key"] = key
+        self._events[event_data["_id"]] = copy.deepcopy(event_data)
+        self._event_keys[event_data["guild_id"], key] = event_data["_id"]
+        return event_data
+
+    async def add_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        added = []
+        for event in events:
+            try:
+                added.append(await self.add_event(event))
+            except DuplicateError:
+                continue
+        return added
+
+    def _guild_events(self, guild_id: Optional[int]) -> Iterator[Dict[str, Any]]:
+        return (e for e in self._events.values() if guild_id is None or e["guild_id"] == guild_id)
+
+    async def get_events_page(
+        self, guild_id: Optional[int], since: datetime, after: Optional[EventCursor], limit: int
+    ) -> List[Dict[str, Any]]:
+        upcoming = sorted(
+            (e for e in self._guild_events(guild_id)
+             if e["date"] >= since and (after is None or (e["date"], e["_id"]) > after)),
+            key=lambda e: (e["date"], e["_id"])
+        )
+        return copy.deepcopy(upcoming[:limit])
+
+    async def get_events_by_ids(self, event_ids: List[Any]) -> List[Dict[str, Any]]:
+        return copy.deepcopy([self._events[i] for i in event_ids if i in self._events])
+
+    async def get_event_titles(self, guild_id: int) -> List[str]:
+        return [e["title"] for e in self._guild_events(guild_id)]
+
+    async def remove_event(self, guild_id: int, title: str) -> Optional[Dict[str, Any]]:
+        event_id = self._event_keys.pop((guild_id, normalize_key(title)), None)
+        if event_id is None:
+            return None
+        return self._events.pop(event_id)
+
+    async def modify_event(self, guild_id: int, title: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = normalize_key(title)
+        event_id = self._event_keys.get((guild_id, key))
+        if event_id is None:
+            return None
+        event = self._events[event_id]
+        if "title" in updates:
+            new_key = normalize_key(updates["title"])
+            if new_key != key and (guild_id, new_key) in self._event_keys:
+                raise DuplicateError(updates["title"])
+            del self._event_keys[guild_id, key]
+            self._event_keys[guild_id, new_key] = event_id
+            event["title_key"] = new_key
+        event.update(updates)
+        return copy.deepcopy(event)
+
+    async def clear_events(self, guild_id: int) -> None:
+        for event in list(self._guild_events(guild_id)):
+            del self._events[event["_id"]]
+            del self._event_keys[guild_id, event["title_key"]]
+
+    async def export_events(self, batch_size: int, guild_id: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        # Copied up front, so writes made while the export is consumed don't show
+        for event in copy.deepcopy(list(self._guild_events(guild_id))):
+            yield event
+
+    # -----------------------------
+    # Fact methods
+    # -----------------------------
+
+    async def add_fact(self, fact: str) -> Any:
+        key = normalize_key(fact)
+        if key in self._fact_keys:
+            raise DuplicateError(fact)
+        fact_id = next(self._ids)
+        self._facts[fact_id] = fact
+        self._fact_keys[key] = fact_id
+        return fact_id
+
+    async def add_facts(self, facts: List[str]) -> List[Any]:
+        ids = []
+        for f in facts:
+            try:
+                ids.append(await self.add_fact(f))
+            except DuplicateError:
+                continue
+        return ids
+
+    async def count_facts(self) -> int:
+        return len(self._facts)
+
+    async def get_fact_ids(self) -> List[Any]:
+        return list(self._facts)
+
+    async def get_fact(self, fact_id: Any) -> Optional[str]:
+        return self._facts.get(fact_id)
+
+    async def get_facts(self, fact_ids: List[Any]) -> Dict[Any, str]:
+        return {i: self._facts[i] for i in fact_ids if i in self._facts}
+
+    async def get_all_facts(self, limit: int) -> List[str]:
+        return list(itertools.islice(self._facts.values(), limit))
+
+    async def get_facts_page(self, after: Optional[Any], limit: int) -> List[Dict[str, Any]]:
+        # IDs are increasing and dicts keep insertion order
+        page = ({"_id": i, "text": t} for i, t in self._facts.items() if after is None or i > after)
+        return list(itertools.islice(page, limit))
+
+    async def export_facts(self, batch_size: int) -> AsyncIterator[str]:
+        for fact in list(self._facts.values()):
+            yield fact
+
+    async def search_facts(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        return rank_facts(self._facts.items(), query, limit)
+
+    async def remove_fact(self, fact_text: str) -> Optional[Any]:
+        fact_id = self._fact_keys.pop(normalize_key(fact_text), None)
+        if fact_id is None:
+            return None
+        del self._facts[fact_id]
+        return fact_id
+
+    # -----------------------------
+    # Guild settings
+    # -----------------------------
+
+    async def get_all_guild_settings(self) -> Dict[int, Dict[str, Any]]:
+        return copy.deepcopy(self._guild_settings)
+
+    async def update_guild_settings(self, guild_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        settings = self._guild_settings.setdefault(guild_id, {})
+        settings.update(updates)
+        return dict(settings)
+
+    # -----------------------------
+    # Bot state
+    # -----------------------------
+
+    async def get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self._state.get(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    async def set_state(self, key: str, value: Dict[str, Any]) -> None:
+        self._state[key] = copy.deepcopy(value)
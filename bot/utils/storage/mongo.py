@@ -0,0 +1,337 @@
+import logging
+from datetime import datetime
+from typing import AsyncIterator, List, Dict, Any, Optional
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo import ReturnDocument, UpdateOne  # needed for MongoDB modify/migrations
+    from pymongo.errors import BulkWriteError, ConfigurationError, ConnectionFailure, DuplicateKeyError, OperationFailure
+    MONGO_AVAILABLE = True
+except ImportError:
+    MONGO_AVAILABLE = False
+
+from bot.utils.dates import coerce_event_date
+from bot.utils.metrics import STORAGE_LATENCY, STORAGE_ERRORS, timed_methods
+from bot.utils.storage.base import StorageBackend, DuplicateError, EventCursor, fact_hash, normalize_key
+
+log = logging.getLogger(__name__)
+
+# Server error code for a unique index violation
+DUPLICATE_KEY = 11000
+
+
+@timed_methods(STORAGE_LATENCY, STORAGE_ERRORS, labels=("mongodb",))
+class MongoBackend(StorageBackend):
+    name = "mongodb"
+    # Server selection, network and pool wait timeouts all derive from ConnectionFailure
+    unavailable_errors = (ConnectionFailure,) if MONGO_AVAILABLE else ()
+
+    def __init__(self, uri: str, database: str = "cyberbot_db", **client_options: Any):
+        """``client_options`` (pool size, timeouts) are passed to the driver as-is."""
+        if not MONGO_AVAILABLE:
+            raise ImportError("MongoDB drivers not available. Ensure 'motor' and 'pymongo' are installed.")
+        self.client = AsyncIOMotorClient(uri, **client_options)
+        self.db = self.client.get_database(database)
+        self.events_collection = self.db.events
+        self.facts_collection = self.db.facts
+        self.guild_settings_collection = self.db.guild_settings
+        self.state_collection = self.db.bot_state
+        log.info("Using MongoDB for data storage")
+
+    async def ping(self) -> None:
+        await self.client.admin.command('ping')
+
+    async def ensure_indexes(self) -> List[str]:
+        # Keys must exist before the unique indexes are built, or every
+        # legacy document would collide on a missing (null) key.
+        await self._backfill_key(self.events_collection, "title", "title_key")
+        await self._backfill_key(self.facts_collection, "text", "text_hash", fact_hash)
+        created = []
+        # (guild_id, date, _id) serves a guild's board and its keyset
+        # pagination; (date, _id) the reminder scan across every guild
+        created += await self._create_index(self.events_collection, [("guild_id", 1), ("date", 1), ("_id", 1)])
+        created += await self._create_index(self.events_collection, [("date", 1), ("_id", 1)])
+        # Titles are unique per guild. Unscoped legacy events share a null
+        # guild_id, which is fine: their titles were already unique.
+        created += await self._create_index(
+            self.events_collection, [("guild_id", 1), ("title_key", 1)], unique=True
+        )
+        created += await self._create_index(self.facts_collection, "text_hash", unique=True)
+        created += await self._create_index(self.facts_collection, [("text", "text")])
+        # Superseded by the per-guild index; it would stop two guilds sharing a title
+        if "title_key_1" in await self.events_collection.index_information():
+            await self.events_collection.drop_index("title_key_1")
+        # Superseded by text_hash; new facts no longer carry text_key
+        if "text_key_1" in await self.facts_collection.index_information():
+            await self.facts_collection.drop_index("text_key_1")
+        return created
+
+    async def _create_index(self, collection, field, unique: bool = False) -> List[str]:
+        keys = [(field, 1)] if isinstance(field, str) else field
+        name = "_".join(f"{k}_{d}" for k, d in keys)
+        if name in await collection.index_information():
+            return []
+        try:
+            await collection.create_index(keys, name=name, unique=unique)
+        except OperationFailure as e:
+            if not unique or e.code != DUPLICATE_KEY:
+                raise
+            # Existing duplicates: still index the key so lookups avoid a scan
+            await collection.create_index(keys, name=name)
+            return [f"{collection.name}.{name} (not unique: duplicates present)"]
+        return [f"{collection.name}.{name}"]
+
+    async def _backfill_key(self, collection, source: str, target: str, key=normalize_key, batch_size: int = 500) -> int:
+        """Set ``target`` to ``key(source)`` on documents that lack it."""
+        updated = 0
+        batch = []
+        cursor = collection.find({target: {"$exists": False}}, {source: 1}, batch_size=batch_size)
+        async for doc in cursor:
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {target: key(doc.get(source, ""))}}))
+            if len(batch) >= batch_size:
+                await collection.bulk_write(batch, ordered=False)
+                updated += len(batch)
+                batch = []
+        if batch:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+        return updated
+
+    async def migrate_event_dates(self, batch_size: int) -> Dict[str, int]:
+        """Stream legacy string dates and rewrite them in unordered batches."""
+        stats = {"converted": 0, "failed": 0}
+        batch = []
+        cursor = self.events_collection.find(
+            {"date": {"$type": "string"}}, {"date": 1}, batch_size=batch_size
+        )
+        async for doc in cursor:
+            parsed = coerce_event_date(doc["date"])
+            if parsed is None:
+                stats["failed"] += 1
+                continue
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"date": parsed}}))
+            if len(batch) >= batch_size:
+                await self.events_collection.bulk_write(batch, ordered=False)
+                stats["converted"] += len(batch)
+                batch = []
+        if batch:
+            await self.events_collection.bulk_write(batch, ordered=False)
+            stats["converted"] += len(batch)
+        return stats
+
+    async def count_unscoped_events(self) -> int:
+        # Matches documents where guild_id is missing as well as null
+        return await self.events_collection.count_documents({"guild_id": None})
+
+    async def assign_event_guild(self, guild_id: int, batch_size: int = 500) -> int:
+        """Move unscoped events in unordered batches; ones whose title the guild already has stay put."""
+        moved = 0
+        batch = []
+        cursor = self.events_collection.find({"guild_id": None}, {"_id": 1}, batch_size=batch_size)
+        async for doc in cursor:
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"guild_id": guild_id}}))
+            if len(batch) >= batch_size:
+                moved += await self._bulk_update(self.events_collection, batch)
+                batch = []
+        if batch:
+            moved += await self._bulk_update(self.events_collection, batch)
+        return moved
+
+    async def _bulk_update(self, collection, ops: List[Any]) -> int:
+        """Unordered bulk_write that skips duplicate keys; returns how many documents changed."""
+        try:
+            result = await collection.bulk_write(ops, ordered=False)
+        except BulkWriteError as e:
+            if any(err.get("code") != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+                raise
+            return e.details.get("nModified", 0)
+        return result.modified_count
+
+    async def close(self) -> None:
+        self.client.close()
+
+    # -----------------------------
+    # Event methods
+    # -----------------------------
+
+    async def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        event_data["title_key"] = normalize_key(event_data["title"])
+        try:
+            await self.events_collection.insert_one(event_data)
+        except DuplicateKeyError as e:
+            raise DuplicateError(event_data["title"]) from e
+        return event_data
+
+    async def add_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for event in events:
+            event["title_key"] = normalize_key(event["title"])
+        failed = await self._insert_many(self.events_collection, events)
+        return [e for i, e in enumerate(events) if i not in failed]
+
+    async def _insert_many(self, collection, docs: List[Dict[str, Any]]) -> set:
+        """Unordered insert_many that skips duplicate keys; returns the indexes that failed."""
+        try:
+            await collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(err.get("code") != DUPLICATE_KEY for err in errors):
+                raise
+            return {err["index"] for err in errors}
+        return set()
+
+    async def _export(self, collection, projection: Dict[str, int], batch_size: int, query: Optional[Dict[str, Any]] = None):
+        """Stream a collection in _id order, from a snapshot read when the cluster supports one."""
+        query = query or {}
+        yielded = False
+        try:
+            async with await self.client.start_session(snapshot=True) as session:
+                cursor = collection.find(query, projection, batch_size=batch_size, session=session).sort("_id", 1)
+                async for doc in cursor:
+                    yielded = True
+                    yield doc
+            return
+        except (ConfigurationError, OperationFailure) as e:
+            # Standalone servers have no snapshot reads
+            if yielded:
+                raise
+            log.info("Snapshot reads unavailable (%s); exporting %s without one", e, collection.name)
+        async for doc in collection.find(query, projection, batch_size=batch_size).sort("_id", 1):
+            yield doc
+
+    async def get_events_page(
+        self, guild_id: Optional[int], since: datetime, after: Optional[EventCursor], limit: int
+    ) -> List[Dict[str, Any]]:
+        query: Dict[str, Any] = {"date": {"$gte": since}}
+        if guild_id is not None:
+            query["guild_id"] = guild_id
+        if after is not None:
+            after_date, after_id = after
+            query["$or"] = [
+                {"date": {"$gt": after_date}},
+                {"date": after_date, "_id": {"$gt": after_id}},
+            ]
+        return await self.events_collection.find(query).sort(
+            [("date", 1), ("_id", 1)]
+        ).limit(limit).to_list(length=None)
+
+    async def get_events_by_ids(self, event_ids: List[Any]) -> List[Dict[str, Any]]:
+        if not event_ids:
+            return []
+        return await self.events_collection.find({"_id": {"$in": list(event_ids)}}).to_list(length=None)
+
+    async def get_event_titles(self, guild_id: int) -> List[str]:
+        docs = await self.events_collection.find({"guild_id": guild_id}, {"title": 1, "_id": 0}).to_list(length=None)
+        return [d["title"] for d in docs]
+
+    async def remove_event(self, guild_id: int, title: str) -> Optional[Dict[str, Any]]:
+        return await self.events_collection.find_one_and_delete(
+            {"guild_id": guild_id, "title_key": normalize_key(title)}
+        )
+
+    async def modify_event(self, guild_id: int, title: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if "title" in updates:
+            updates = {**updates, "title_key": normalize_key(updates["title"])}
+        try:
+            return await self.events_collection.find_one_and_update(
+                {"guild_id": guild_id, "title_key": normalize_key(title)},
+                {"$set": updates},
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError as e:
+            raise DuplicateError(updates["title"]) from e
+
+    async def clear_events(self, guild_id: int) -> None:
+        await self.events_collection.delete_many({"guild_id": guild_id})
+
+    async def export_events(self, batch_size: int, guild_id: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        query = None if guild_id is None else {"guild_id": guild_id}
+        async for doc in self._export(self.events_collection, {"title_key": 0}, batch_size, query):
+            yield doc
+
+    # -----------------------------
+    # Fact methods
+    # -----------------------------
+
+    async def add_fact(self, fact: str) -> Any:
+        try:
+            result = await self.facts_collection.insert_one({"text": fact, "text_hash": fact_hash(fact)})
+        except DuplicateKeyError as e:
+            raise DuplicateError(fact) from e
+        return result.inserted_id
+
+    async def add_facts(self, facts: List[str]) -> List[Any]:
+        docs = [{"text": f, "text_hash": fact_hash(f)} for f in facts]
+        failed = await self._insert_many(self.facts_collection, docs)
+        # insert_many assigned every _id up front; keep the ones that landed
+        return [d["_id"] for i, d in enumerate(docs) if i not in failed]
+
+    async def count_facts(self) -> int:
+        return await self.facts_collection.count_documents({})
+
+    async def get_fact_ids(self) -> List[Any]:
+        # Covered by the _id index; no fact text is transferred
+        docs = await self.facts_collection.find({}, {"_id": 1}).to_list(length=None)
+        return [d["_id"] for d in docs]
+
+    async def get_fact(self, fact_id: Any) -> Optional[str]:
+        doc = await self.facts_collection.find_one({"_id": fact_id}, {"text": 1})
+        return doc["text"] if doc else None
+
+    async def get_facts(self, fact_ids: List[Any]) -> Dict[Any, str]:
+        docs = await self.facts_collection.find({"_id": {"$in": fact_ids}}, {"text": 1}).to_list(length=None)
+        return {d["_id"]: d["text"] for d in docs}
+
+    async def get_all_facts(self, limit: int) -> List[str]:
+        docs = await self.facts_collection.find({}, {"text": 1, "_id": 0}).to_list(length=limit)
+        return [d.get("text", "") for d in docs]
+
+    async def get_facts_page(self, after: Optional[Any], limit: int) -> List[Dict[str, Any]]:
+        query = {} if after is None else {"_id": {"$gt": after}}
+        return await self.facts_collection.find(query, {"text": 1}).sort("_id", 1).limit(limit).to_list(length=None)
+
+    async def export_facts(self, batch_size: int) -> AsyncIterator[str]:
+        async for doc in self._export(self.facts_collection, {"text": 1}, batch_size):
+            yield doc.get("text", "")
+
+    async def search_facts(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        score = {"score": {"$meta": "textScore"}}
+        cursor = self.facts_collection.find({"$text": {"$search": query}}, {"text": 1, **score})
+        docs = await cursor.sort([("score", score["score"])]).limit(limit).to_list(length=None)
+        return [{"_id": d["_id"], "text": d["text"]} for d in docs]
+
+    async def remove_fact(self, fact_text: str) -> Optional[Any]:
+        removed = await self.facts_collection.find_one_and_delete(
+            {"text_hash": fact_hash(fact_text)},
+            projection={"_id": 1}
+        )
+        return removed["_id"] if removed else None
+
+    # -----------------------------
+    # Guild settings
+    # -----------------------------
+
+    async def get_all_guild_settings(self) -> Dict[int, Dict[str, Any]]:
+        docs = await self.guild_settings_collection.find({}).to_list(length=None)
+        return {d.pop("_id"): d for d in docs}
+
+    async def update_guild_settings(self, guild_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        # Keyed by guild ID, so the default _id index is the only one needed
+        doc = await self.guild_settings_collection.find_one_and_update(
+            {"_id": guild_id},
+            {"$set": updates},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        doc.pop("_id")
+        return doc
+
+    # -----------------------------
+    # Bot state
+    # -----------------------------
+
+    async def get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        doc = await self.state_collection.find_one({"_id": key}, {"_id": 0})
+        return doc
+
+    async def set_state(self, key: str, value: Dict[str, Any]) -> None:
+        await self.state_collection.replace_one({"_id": key}, value, upsert=True)
@@ -0,0 +1,421 @@
+import asyncio
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence
+
+try:
+    import aiosqlite
+    SQLITE_AVAILABLE = True
+except ImportError:
+    SQLITE_AVAILABLE = False
+
+from bot.utils.metrics import STORAGE_LATENCY, STORAGE_ERRORS, timed_methods
+from bot.utils.storage.base import (
+    StorageBackend, DuplicateError, EventCursor, fact_hash, normalize_key, rank_facts, search_terms
+)
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    date TEXT NOT NULL,
+    data TEXT NOT NULL,
+    guild_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS facts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    text_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bot_state (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+INDEXES = {
+    # Index entries carry the rowid, so these also order by (date, id).
+    # events_date serves the all-guild reminder scan, the rest one guild's board.
+    "events_date": "CREATE INDEX IF NOT EXISTS events_date ON events (date)",
+    "events_guild_date": "CREATE INDEX IF NOT EXISTS events_guild_date ON events (guild_id, date)",
+    "events_guild_title_key": (
+        "CREATE UNIQUE INDEX IF NOT EXISTS events_guild_title_key ON events (guild_id, title_key)"
+    ),
+    "facts_text_hash": "CREATE UNIQUE INDEX IF NOT EXISTS facts_text_hash ON facts (text_hash)",
+}
+
+# Full-text index over facts.text, kept in sync by triggers
+FACTS_FTS = """
+CREATE VIRTUAL TABLE facts_fts USING fts5(text, content='facts', content_rowid='id');
+CREATE TRIGGER facts_fts_insert AFTER INSERT ON facts BEGIN
+    INSERT INTO facts_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER facts_fts_delete AFTER DELETE ON facts BEGIN
+    INSERT INTO facts_fts (facts_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER facts_fts_update AFTER UPDATE OF text ON facts BEGIN
+    INSERT INTO facts_fts (facts_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO facts_fts (rowid, text) VALUES (new.id, new.text);
+END;
+INSERT INTO facts_fts (facts_fts) VALUES ('rebuild');
+"""
+
+# Columns held outside the JSON blob
+EVENT_COLUMNS = ("_id", "title", "title_key", "date", "guild_id")
+EVENT_SELECT = "SELECT id, title, date, data, guild_id FROM events"
+
+
+def _date_to_sql(value: datetime) -> str:
+    # Fixed-width ISO text so SQLite's string ordering is chronological
+    return value.isoformat(sep=" ", timespec="seconds")
+
+
+@timed_methods(STORAGE_LATENCY, STORAGE_ERRORS, labels=("sqlite",))
+class SQLiteBackend(StorageBackend):
+    """Single-file storage for deployments that don't need a MongoDB cluster.
+
+    Fields other than title and date are kept as a JSON blob, so events can
+    carry the same free-form keys they do in MongoDB.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        if not SQLITE_AVAILABLE:
+            raise ImportError("SQLite driver not available. Ensure 'aiosqlite' is installed.")
+        self.path = path
+        self._db: Optional["aiosqlite.Connection"] = None
+        self._connecting = asyncio.Lock()
+        # Whether facts_fts exists; None until checked
+        self._fts: Optional[bool] = None
+        log.info("Using SQLite for data storage (%s)", path)
+
+    async def _conn(self) -> "aiosqlite.Connection":
+        if self._db is None:
+            # Two first calls must not each open (and one of them leak) a connection
+            async with self._connecting:
+                if self._db is None:
+                    conn = await aiosqlite.connect(self.path)
+                    await conn.executescript(SCHEMA)
+                    await conn.commit()
+                    # Published only once the schema exists
+                    self._db = conn
+        return self._db
+
+    async def _tables(self, conn) -> set:
+        async with conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'") as cursor:
+            return {row[0] async for row in cursor}
+
+    async def ping(self) -> None:
+        conn = await self._conn()
+        await conn.execute("SELECT 1")
+
+    async def ensure_indexes(self) -> List[str]:
+        conn = await self._conn()
+        async with conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'") as cursor:
+            existing = {row[0] async for row in cursor}
+        created = []
+        for name, sql in INDEXES.items():
+            if name not in existing:
+                await conn.execute(sql)
+                created.append(name)
+        if "facts_fts" not in await self._tables(conn):
+            try:
+                await conn.executescript(FACTS_FTS)
+                created.append("facts_fts")
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5: /sm_searchfacts falls back to a scan
+                log.warning("Full-text fact search unavailable: %s", e)
+        await conn.commit()
+        self._fts = None
+        return created
+
+    async def close(self) -> None:
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    @staticmethod
+    def _row_to_event(row) -> Dict[str, Any]:
+        event_id, title, date, data, guild_id = row
+        event = json.loads(data)
+        event.update({
+            "_id": event_id,
+            "title": title,
+            "title_key": normalize_key(title),
+            "date": datetime.fromisoformat(date),
+            "guild_id": guild_id,
+        })
+        return event
+
+    # -----------------------------
+    # Event methods
+    # -----------------------------
+
+    async def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        conn = await self._conn()
+        extra = {k: v for k, v in event_data.items() if k not in EVENT_COLUMNS}
+        key = normalize_key(event_data["title"])
+        try:
+            cursor = await conn.execute(
+                "INSERT INTO events (title, title_key, date, data, guild_id) VALUES (?, ?, ?, ?, ?)",
+                (event_data["title"], key, _date_to_sql(event_data["date"]), json.dumps(extra), event_data["guild_id"])
+            )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateError(event_data["title"]) from e
+        await conn.commit()
+        event_data["_id"] = cursor.lastrowid
+        event_data["title_key"] = key
+        return event_data
+
+    async def add_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        conn = await self._conn()
+        added = []
+        # One transaction; executemany would not report the new row IDs
+        for event in events:
+            extra = {k: v for k, v in event.items() if k not in EVENT_COLUMNS}
+            key = normalize_key(event["title"])
+            cursor = await conn.execute(
+                "INSERT OR IGNORE INTO events (title, title_key, date, data, guild_id) VALUES (?, ?, ?, ?, ?)",
+                (event["title"], key, _date_to_sql(event["date"]), json.dumps(extra), event["guild_id"])
+            )
+            if cursor.rowcount:
+                event["_id"] = cursor.lastrowid
+                event["title_key"] = key
+                added.append(event)
+        await conn.commit()
+        return added
+
+    async def get_events_page(
+        self, guild_id: Optional[int], since: datetime, after: Optional[EventCursor], limit: int
+    ) -> List[Dict[str, Any]]:
+        conn = await self._conn()
+        sql = f"{EVENT_SELECT} WHERE date >= ?"
+        params: List[Any] = [_date_to_sql(since)]
+        if guild_id is not None:
+            sql += " AND guild_id = ?"
+            params.append(guild_id)
+        if after is not None:
+            after_date = _date_to_sql(after[0])
+            sql += " AND (date > ? OR (date = ? AND id > ?))"
+            params += [after_date, after_date, after[1]]
+        sql += " ORDER BY date, id LIMIT ?"
+        params.append(limit)
+        async with conn.execute(sql, params) as cursor:
+            return [self._row_to_event(row) async for row in cursor]
+
+    async def get_events_by_ids(self, event_ids: List[Any]) -> List[Dict[str, Any]]:
+        if not event_ids:
+            return []
+        conn = await self._conn()
+        placeholders = ",".join("?" * len(event_ids))
+        async with conn.execute(f"{EVENT_SELECT} WHERE id IN ({placeholders})", list(event_ids)) as cursor:
+            return [self._row_to_event(row) async for row in cursor]
+
+    async def get_event_titles(self, guild_id: int) -> List[str]:
+        conn = await self._conn()
+        async with conn.execute("SELECT title FROM events WHERE guild_id = ?", (guild_id,)) as cursor:
+            return [row[0] async for row in cursor]
+
+    async def _find_event(self, conn, guild_id: int, title: str):
+        async with conn.execute(
+            f"{EVENT_SELECT} WHERE guild_id = ? AND title_key = ? LIMIT 1",
+            (guild_id, normalize_key(title))
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def remove_event(self, guild_id: int, title: str) -> Optional[Dict[str, Any]]:
+        conn = await self._conn()
+        row = await self._find_event(conn, guild_id, title)
+        if row is None:
+            return None
+        await conn.execute("DELETE FROM events WHERE id = ?", (row[0],))
+        await conn.commit()
+        return self._row_to_event(row)
+
+    async def modify_event(self, guild_id: int, title: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        conn = await self._conn()
+        row = await self._find_event(conn, guild_id, title)
+        if row is None:
+            return None
+        event = self._row_to_event(row)
+        event.update(updates)
+        event["title_key"] = normalize_key(event["title"])
+        extra = {k: v for k, v in event.items() if k not in EVENT_COLUMNS}
+        try:
+            await conn.execute(
+                "UPDATE events SET title = ?, title_key = ?, date = ?, data = ? WHERE id = ?",
+                (event["title"], event["title_key"], _date_to_sql(event["date"]), json.dumps(extra), event["_id"])
+            )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateError(event["title"]) from e
+        await conn.commit()
+        return event
+
+    async def clear_events(self, guild_id: int) -> None:
+        conn = await self._conn()
+        await conn.execute("DELETE FROM events WHERE guild_id = ?", (guild_id,))
+        await conn.commit()
+
+    async def _export(self, sql: str, batch_size: int, params: Sequence[Any] = ()):
+        # A single SELECT sees one snapshot of the file. It runs on its own
+        # connection so the bot's writes can't interleave with the read.
+        async with aiosqlite.connect(self.path, iter_chunk_size=batch_size) as conn:
+            async with conn.execute(sql, params) as cursor:
+                async for row in cursor:
+                    yield row
+
+    async def export_events(self, batch_size: int, guild_id: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        if guild_id is None:
+            rows = self._export(f"{EVENT_SELECT} ORDER BY id", batch_size)
+        else:
+            rows = self._export(f"{EVENT_SELECT} WHERE guild_id = ? ORDER BY id", batch_size, (guild_id,))
+        async for row in rows:
+            yield self._row_to_event(row)
+
+    # -----------------------------
+    # Fact methods
+    # -----------------------------
+
+    async def add_fact(self, fact: str) -> Any:
+        conn = await self._conn()
+        try:
+            cursor = await conn.execute(
+                "INSERT INTO facts (text, text_hash) VALUES (?, ?)", (fact, fact_hash(fact))
+            )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateError(fact) from e
+        await conn.commit()
+        return cursor.lastrowid
+
+    async def add_facts(self, facts: List[str]) -> List[Any]:
+        conn = await self._conn()
+        ids = []
+        # One transaction; executemany would not report the new row IDs
+        for f in facts:
+            cursor = await conn.execute(
+                "INSERT OR IGNORE INTO facts (text, text_hash) VALUES (?, ?)", (f, fact_hash(f))
+            )
+            if cursor.rowcount:
+                ids.append(cursor.lastrowid)
+        await conn.commit()
+        return ids
+
+    async def count_facts(self) -> int:
+        conn = await self._conn()
+        async with conn.execute("SELECT COUNT(*) FROM facts") as cursor:
+            (count,) = await cursor.fetchone()
+        return count
+
+    async def get_fact_ids(self) -> List[Any]:
+        conn = await self._conn()
+        async with conn.execute("SELECT id FROM facts") as cursor:
+            return [row[0] async for row in cursor]
+
+    async def get_fact(self, fact_id: Any) -> Optional[str]:
+        conn = await self._conn()
+        async with conn.execute("SELECT text FROM facts WHERE id = ?", (fact_id,)) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def get_facts(self, fact_ids: List[Any]) -> Dict[Any, str]:
+        if not fact_ids:
+            return {}
+        conn = await self._conn()
+        placeholders = ", ".join("?" for _ in fact_ids)
+        async with conn.execute(f"SELECT id, text FROM facts WHERE id IN ({placeholders})", list(fact_ids)) as cursor:
+            return {row[0]: row[1] async for row in cursor}
+
+    async def get_all_facts(self, limit: int) -> List[str]:
+        conn = await self._conn()
+        async with conn.execute("SELECT text FROM facts ORDER BY id LIMIT ?", (limit,)) as cursor:
+            return [row[0] async for row in cursor]
+
+    async def get_facts_page(self, after: Optional[Any], limit: int) -> List[Dict[str, Any]]:
+        conn = await self._conn()
+        async with conn.execute(
+            "SELECT id, text FROM facts WHERE id > ? ORDER BY id LIMIT ?",
+            (after if after is not None else 0, limit)
+        ) as cursor:
+            return [{"_id": row[0], "text": row[1]} async for row in cursor]
+
+    async def export_facts(self, batch_size: int) -> AsyncIterator[str]:
+        async for row in self._export("SELECT text FROM facts ORDER BY id", batch_size):
+            yield row[0]
+
+    async def search_facts(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        terms = search_terms(query)
+        if not terms:
+            return []
+        conn = await self._conn()
+        if self._fts is None:
+            self._fts = "facts_fts" in await self._tables(conn)
+        if not self._fts:
+            clause = " OR ".join("text LIKE ?" for _ in terms)
+            async with conn.execute(f"SELECT id, text FROM facts WHERE {clause}", [f"%{t}%" for t in terms]) as cursor:
+                return rank_facts([tuple(row) async for row in cursor], query, limit)
+        # Quoted so user input is never read as FTS5 query syntax; bm25 rank puts the best first
+        match = " OR ".join(f'"{t}"' for t in terms)
+        async with conn.execute(
+            "SELECT rowid, text FROM facts_fts WHERE facts_fts MATCH ? ORDER BY rank LIMIT ?", (match, limit)
+        ) as cursor:
+            return [{"_id": row[0], "text": row[1]} async for row in cursor]
+
+    async def remove_fact(self, fact_text: str) -> Optional[Any]:
+        conn = await self._conn()
+        async with conn.execute("SELECT id FROM facts WHERE text_hash = ? LIMIT 1", (fact_hash(fact_text),)) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        await conn.execute("DELETE FROM facts WHERE id = ?", (row[0],))
+        await conn.commit()
+        return row[0]
+
+    # -----------------------------
+    # Guild settings
+    # -----------------------------
+
+    async def get_all_guild_settings(self) -> Dict[int, Dict[str, Any]]:
+        conn = await self._conn()
+        async with conn.execute("SELECT guild_id, data FROM guild_settings") as cursor:
+            return {row[0]: json.loads(row[1]) async for row in cursor}
+
+    async def update_guild_settings(self, guild_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        conn = await self._conn()
+        async with conn.execute("SELECT data FROM guild_settings WHERE guild_id = ?", (guild_id,)) as cursor:
+            row = await cursor.fetchone()
+        settings = json.loads(row[0]) if row else {}
+        settings.update(updates)
+        await conn.execute(
+            "INSERT OR REPLACE INTO guild_settings (guild_id, data) VALUES (?, ?)",
+            (guild_id, json.dumps(settings))
+        )
+        await conn.commit()
+        return settings
+
+    # -----------------------------
+    # Bot state
+    # -----------------------------
+
+    async def get_state(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = await self._conn()
+        async with conn.execute("SELECT data FROM bot_state WHERE key = ?", (key,)) as cursor:
+            row = await cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def set_state(self, key: str, value: Dict[str, Any]) -> None:
+        conn = await self._conn()
+        await conn.execute(
+            "INSERT OR REPLACE INTO bot_state (key, data) VALUES (?, ?)",
+            (key, json.dumps(value))
+        )
+        await conn.commit()
@@ -0,0 +1,73 @@
+import bisect
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from bot.utils.storage.base import normalize_key
+
+# Discord shows at most 25 autocomplete choices
+MAX_SUGGESTIONS = 25
+
+
+class TitleIndex:
+    """Sorted list of event titles for prefix lookups.
+
+    Entries are ``(normalized_key, title)`` pairs, so a prefix search is a
+    bisect to the first candidate followed by a short forward scan. Titles
+    that only contain the typed text come after every prefix match.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: List[Tuple[str, str]] = []
+        self._loaded_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl
+
+    def load(self, titles: Iterable[str]) -> None:
+        self._entries = sorted((normalize_key(t), t) for t in titles)
+        self._loaded_at = time.monotonic()
+
+    def add(self, title: str) -> None:
+        if self.loaded:
+            bisect.insort(self._entries, (normalize_key(title), title))
+
+    def remove(self, title: str) -> None:
+        """Drop the entry for ``title``, matched the same way storage matches it."""
+        if not self.loaded:
+            return
+        key = normalize_key(title)
+        i = bisect.bisect_left(self._entries, (key, ""))
+        while i < len(self._entries) and self._entries[i][0] == key:
+            del self._entries[i]
+
+    def clear(self) -> None:
+        if self.loaded:
+            self._entries = []
+
+    def search(self, prefix: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """Titles whose normalized form starts with ``prefix``, then those containing it; each alphabetically."""
+        key = normalize_key(prefix)
+        i = bisect.bisect_left(self._entries, (key, ""))
+        matches = []
+        while i < len(self._entries) and len(matches) < limit:
+            entry_key, title = self._entries[i]
+            if not entry_key.startswith(key):
+                break
+            matches.append(title)
+            i += 1
+        if len(matches) < limit and key:
+            # A guild's board is small enough to scan for the rest
+            for entry_key, title in self._entries:
+                if key in entry_key and not entry_key.startswith(key):
+                    matches.append(title)
+                    if len(matches) == limit:
+                        break
+        return matches
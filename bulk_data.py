@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Bulk Import/Export Script for CyberBot
+Seeds or backs up events and facts from NDJSON or CSV files, using the
+same storage settings (.env) as the bot.
+
+    python bulk_data.py import events calendar.csv --guild 123456789012345678
+    python bulk_data.py import facts facts.ndjson
+    python bulk_data.py export events backup.ndjson
+    python bulk_data.py export facts - --format csv
+
+Events belong to a server. Without --guild, an events import puts each
+row in the server named by its guild_id column (as written by an export)
+and an events export covers every server.
+"""
+
+import argparse
+import asyncio
+import functools
+import io
+import sys
+import os
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Ensure environment variables from .env are loaded BEFORE importing db
+load_dotenv()
+from bot.utils import bulk
+from bot.utils.database import db
+
+
+async def file_lines(path):
+    """Read a file (or stdin for "-") line by line."""
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        for line in f:
+            yield line
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+async def run_import(kind, path, fmt, guild_id):
+    records = bulk.read_records(file_lines(path), fmt)
+    if kind == "events":
+        report = await bulk.import_events(records, guild_id)
+    else:
+        report = await bulk.import_facts(records)
+
+    print(f"📥 Read {report.read} rows from {path}")
+    print(f"✅ Inserted {report.inserted} {kind}")
+    print(f"♻️ Skipped {report.duplicates} duplicates")
+    if report.invalid:
+        print(f"❌ Rejected {report.invalid} invalid rows:")
+        for error in report.errors:
+            print(f"   {error}")
+        if report.invalid > len(report.errors):
+            print(f"   … and {report.invalid - len(report.errors)} more")
+
+
+async def run_export(kind, path, fmt, guild_id):
+    export = functools.partial(bulk.export_events, guild_id=guild_id) if kind == "events" else bulk.export_facts
+    if path == "-":
+        out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="")
+        count = await export(out, fmt)
+        out.flush()
+        out.detach()
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as out:
+            count = await export(out, fmt)
+    print(f"✅ Exported {count} {kind} to {path}", file=sys.stderr)
+
+
+async def main(args):
+    # stdin/stdout has no extension to go by
+    fmt = args.format or ("ndjson" if args.path == "-" else bulk.detect_format(args.path))
+    if fmt is None:
+        print(f"❌ Can't tell the format of {args.path}; pass --format ndjson or --format csv", file=sys.stderr)
+        return 2
+
+    try:
+        await db.connect()
+    except Exception as e:
+        print("❌ Could not connect to storage. Check STORAGE_BACKEND, MONGODB_URI and network.", file=sys.stderr)
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        await db.ensure_indexes()
+        if args.action == "import":
+            await run_import(args.kind, args.path, fmt, args.guild)
+        else:
+            await run_export(args.kind, args.path, fmt, args.guild)
+    finally:
+        await db.close()
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Import or export CyberBot events and facts")
+    parser.add_argument("action", choices=["import", "export"])
+    parser.add_argument("kind", choices=["events", "facts"])
+    parser.add_argument("path", help='File to read or write; "-" for stdin/stdout')
+    parser.add_argument("--format", choices=bulk.FORMATS, help="Defaults to the file extension (ndjson for stdin/stdout)")
+    parser.add_argument("--guild", type=int, help="Server ID the events belong to (events only)")
+    args = parser.parse_args(argv)
+    if args.guild is not None and args.kind != "events":
+        parser.error("--guild only applies to events")
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
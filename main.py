@@ -1,5 +1,14 @@
-from bot.bot import main
-
-if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+import argparse
+
+from bot.bot import main
+from bot.utils import Config
+
+if __name__ == "__main__":
+    import asyncio
+    parser = argparse.ArgumentParser(description="Run CyberBot")
+    parser.add_argument("--force-sync", action="store_true",
+                        help="Sync slash commands even if the command tree is unchanged")
+    args = parser.parse_args()
+    if args.force_sync:
+        Config.FORCE_COMMAND_SYNC = True
+    asyncio.run(main())
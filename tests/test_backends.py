@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from bot.utils.database import event_cursor
+from bot.utils.storage import DuplicateError, MemoryBackend
+from bot.utils.storage.sqlite import SQLITE_AVAILABLE, SQLiteBackend
+
+SINCE = datetime(2030, 1, 1)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_backend(request, tmp_path):
+    def make():
+        if request.param == "memory":
+            return MemoryBackend()
+        if not SQLITE_AVAILABLE:
+            pytest.skip("aiosqlite is not installed")
+        return SQLiteBackend(str(tmp_path / "bot.db"))
+    return make
+
+
+def run(make_backend, scenario):
+    async def main():
+        backend = make_backend()
+        await backend.ensure_indexes()
+        try:
+            await scenario(backend)
+        finally:
+            await backend.close()
+    asyncio.run(main())
+
+
+def event(title, day, guild_id=1):
+    return {"guild_id": guild_id, "title": title, "date": datetime(2030, 1, day), "description": "-"}
+
+
+def test_duplicate_titles_are_refused_within_a_guild(make_backend):
+    async def scenario(backend):
+        await backend.add_event(event("Kickoff", 2))
+        with pytest.raises(DuplicateError):
+            # Same title up to case and spacing
+            await backend.add_event(event("  kickoff ", 3))
+        # Another guild may use it
+        await backend.add_event(event("Kickoff", 3, guild_id=2))
+        added = await backend.add_events([event("KICKOFF", 4), event("Retro", 5)])
+        assert [e["title"] for e in added] == ["Retro"]
+        with pytest.raises(DuplicateError):
+            await backend.modify_event(1, "Retro", {"title": "Kickoff"})
+        assert await backend.get_event_titles(1) == ["Kickoff", "Retro"]
+
+    run(make_backend, scenario)
+
+
+def test_keyset_pages_follow_date_then_id(make_backend):
+    async def scenario(backend):
+        # Several events share a date, so the id breaks the tie
+        for i, day in enumerate([3, 2, 3, 5, 3, 2, 4]):
+            await backend.add_event(event(f"Event {i}", day))
+        await backend.add_event(event("Elsewhere", 2, guild_id=2))
+        await backend.add_event({**event("Past", 1), "date": datetime(2029, 12, 31)})
+
+        expected = await backend.get_events(1, SINCE, 100)
+        assert [event_cursor(e) for e in expected] == sorted(event_cursor(e) for e in expected)
+        assert len(expected) == 7
+
+        pages, after = [], None
+        while True:
+            page = await backend.get_events_page(1, SINCE, after, 3)
+            pages.append(page)
+            if len(page) < 3:
+                break
+            after = event_cursor(page[-1])
+        assert [len(p) for p in pages] == [3, 3, 1]
+        assert [e["_id"] for p in pages for e in p] == [e["_id"] for e in expected]
+
+    run(make_backend, scenario)
+
+
+def test_fact_search_ranks_matches(make_backend):
+    async def scenario(backend):
+        await backend.add_facts([
+            "Phishing attacks account for most reported incidents.",
+            "A strong password should be at least 12 characters long.",
+            "Password managers make strong, unique passwords practical.",
+            "Multi-factor authentication stops most account takeovers.",
+        ])
+        assert [f["text"] for f in await backend.search_facts("phishing", 5)] == [
+            "Phishing attacks account for most reported incidents."
+        ]
+        matches = [f["text"] for f in await backend.search_facts("strong password", 5)]
+        assert set(matches) == {
+            "A strong password should be at least 12 characters long.",
+            "Password managers make strong, unique passwords practical.",
+        }
+        assert await backend.search_facts("quantum", 5) == []
+        assert len(await backend.search_facts("most", 1)) == 1
+
+    run(make_backend, scenario)
+
+
+def test_concurrent_first_calls_share_one_connection(tmp_path):
+    if not SQLITE_AVAILABLE:
+        pytest.skip("aiosqlite is not installed")
+
+    async def main():
+        backend = SQLiteBackend(str(tmp_path / "bot.db"))
+        connections = await asyncio.gather(*(backend._conn() for _ in range(5)))
+        assert all(c is connections[0] for c in connections)
+        await backend.close()
+
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+
+from benchmarks.fakes import FakeBot, FakeInteraction
+from bot.cogs.facts import Facts
+from bot.utils import bulk
+from bot.utils.config import Config
+from bot.utils.database import db
+from bot.utils.storage import MemoryBackend
+
+
+async def lines_of(text):
+    for line in text.encode("utf-8").splitlines(keepends=True):
+        yield line
+
+
+def parse(text, fmt):
+    async def collect():
+        return [record async for record in bulk.read_records(lines_of(text), fmt)]
+    return asyncio.run(collect())
+
+
+def import_events(text, fmt):
+    async def scenario():
+        await db.connect(MemoryBackend())
+        report = await bulk.import_events(bulk.read_records(lines_of(text), fmt), guild_id=1)
+        return report, await db.get_events(1)
+    return asyncio.run(scenario())
+
+
+def test_malformed_ndjson_lines_are_reported_and_the_rest_kept():
+    records = parse('{"text": "one"}\n{"text": \n\n"two"\n[1, 2\n', "ndjson")
+    assert [(n, r) for n, r in records if not isinstance(r, ValueError)] == [(1, {"text": "one"}), (4, "two")]
+    assert [n for n, r in records if isinstance(r, ValueError)] == [2, 5]
+
+
+def test_unterminated_csv_quote_is_one_invalid_record():
+    records = parse('text\n"never closed\nmore\n', "csv")
+    assert len(records) == 1
+    number, error = records[0]
+    assert number == 2 and isinstance(error, ValueError)
+
+
+def test_multiline_csv_field_keeps_its_first_line_number():
+    records = parse('title,description\n"Kickoff","line one\nline two"\nRetro,x\n', "csv")
+    assert records == [
+        (2, {"title": "Kickoff", "description": "line one\nline two"}),
+        (4, {"title": "Retro", "description": "x"}),
+    ]
+
+
+def test_a_byte_order_mark_is_ignored():
+    assert parse('\ufefftext\nhello\n', "csv") == [(2, {"text": "hello"})]
+    assert parse('\ufeff{"text": "hello"}\n', "ndjson") == [(1, {"text": "hello"})]
+
+
+def test_rows_missing_fields_are_rejected_with_their_line():
+    text = (
+        "title,date,description\n"
+        "Kickoff,25/12/2030,First meeting\n"
+        ",25/12/2030,No title\n"
+        "Retro,31/02/2030,Bad day\n"
+        "Old,01/01/2020,Past year\n"
+    )
+    report, events = import_events(text, "csv")
+    assert report.read == 4 and report.inserted == 1 and report.invalid == 3
+    assert [e.split(":")[0] for e in report.errors] == ["line 3", "line 4", "line 5"]
+    assert [e["title"] for e in events] == ["Kickoff"]
+
+
+def test_duplicate_rows_are_counted_not_stored():
+    text = (
+        '{"title": "Kickoff", "date": "2030-12-25", "description": "a"}\n'
+        '{"title": "  KICKOFF ", "date": "2030-12-26", "description": "b"}\n'
+        '{"title": "Retro", "date": "2030-12-27", "description": "c"}\n'
+    )
+    report, events = import_events(text, "ndjson")
+    assert (report.inserted, report.duplicates, report.invalid) == (2, 1, 0)
+    assert [e["description"] for e in events] == ["a", "c"]
+
+
+def test_oversized_attachments_are_refused_before_download(monkeypatch):
+    monkeypatch.setattr(Config, "IMPORT_MAX_BYTES", 1024)
+
+    async def scenario():
+        await db.connect(MemoryBackend())
+        cog = Facts.__new__(Facts)
+        cog.bot = FakeBot()
+        interaction = FakeInteraction()
+        # No url: reading the file would fail the test
+        file = SimpleNamespace(filename="facts.ndjson", size=2048)
+        await Facts.importfacts.callback(cog, interaction, file)
+        return interaction.sent
+
+    [reply] = asyncio.run(scenario())
+    assert reply["title"] == "❌ File Too Large ❌"
@@ -0,0 +1,161 @@
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from bot.utils import circuit
+from bot.utils.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from bot.utils.database import Database
+from bot.utils.dates import start_of_today
+from bot.utils.storage import MemoryBackend, StorageUnavailable
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def call(breaker, error=None):
+    with breaker.guard():
+        if error is not None:
+            raise error
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(StorageUnavailable):
+            call(breaker, ConnectionError("down"))
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(3, 30, (ConnectionError,))
+    for _ in range(2):
+        with pytest.raises(StorageUnavailable):
+            call(breaker, ConnectionError("down"))
+    assert breaker.state == CLOSED
+    with pytest.raises(StorageUnavailable):
+        call(breaker, ConnectionError("down"))
+    assert breaker.state == OPEN and breaker.trips == 1
+
+
+def test_a_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(2, 30, (ConnectionError,))
+    with pytest.raises(StorageUnavailable):
+        call(breaker, ConnectionError("down"))
+    call(breaker)
+    with pytest.raises(StorageUnavailable):
+        call(breaker, ConnectionError("down"))
+    assert breaker.state == CLOSED
+
+
+def test_other_errors_are_not_outages(clock):
+    breaker = CircuitBreaker(1, 30, (ConnectionError,))
+    with pytest.raises(KeyError):
+        call(breaker, KeyError("duplicate"))
+    assert breaker.state == CLOSED
+
+
+def test_fails_fast_while_open(clock):
+    breaker = CircuitBreaker(2, 30, (ConnectionError,))
+    trip(breaker)
+    ran = []
+    with pytest.raises(StorageUnavailable):
+        with breaker.guard():
+            ran.append(True)
+    assert ran == [] and breaker.rejected == 1
+
+
+def test_half_opens_after_the_cooldown_and_a_success_closes_it(clock):
+    breaker = CircuitBreaker(2, 30, (ConnectionError,))
+    trip(breaker)
+    clock.now += 30
+    with breaker.guard():
+        assert breaker.state == HALF_OPEN
+        # Only one probe at a time
+        with pytest.raises(StorageUnavailable):
+            call(breaker)
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+
+def test_a_failed_probe_reopens_it(clock):
+    breaker = CircuitBreaker(2, 30, (ConnectionError,))
+    trip(breaker)
+    clock.now += 30
+    with pytest.raises(StorageUnavailable):
+        call(breaker, ConnectionError("still down"))
+    assert breaker.state == OPEN
+    clock.now += 29
+    with pytest.raises(StorageUnavailable):
+        call(breaker)
+    clock.now += 1
+    call(breaker)
+    assert breaker.state == CLOSED
+
+
+class FlakyBackend(MemoryBackend):
+    """Memory storage that can be taken "offline"; counts the writes that reach it."""
+
+    unavailable_errors = (ConnectionError,)
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+        self.writes = 0
+
+    def _check(self):
+        if self.down:
+            raise ConnectionError("no route to host")
+
+    async def get_events(self, *args, **kwargs):
+        self._check()
+        return await super().get_events(*args, **kwargs)
+
+    async def add_event(self, event_data):
+        self.writes += 1
+        self._check()
+        return await super().add_event(event_data)
+
+    async def add_fact(self, fact):
+        self.writes += 1
+        self._check()
+        return await super().add_fact(fact)
+
+
+def test_degraded_facade_serves_reads_and_rejects_writes(monkeypatch, clock):
+    monkeypatch.setattr("bot.utils.config.Config.DB_BREAKER_FAILURES", 1)
+    monkeypatch.setattr("bot.utils.config.Config.EVENT_CACHE_TTL", 60)
+
+    async def scenario():
+        backend = FlakyBackend()
+        database = Database()
+        await database.connect(backend)
+        tomorrow = start_of_today() + timedelta(days=1)
+        await database.add_event({"guild_id": 1, "title": "Kickoff", "date": tomorrow})
+        assert [e["title"] for e in await database.get_events(1)] == ["Kickoff"]
+
+        backend.down = True
+        # Expire the board, so the next read goes to storage and trips the breaker
+        database.events_cache.board(1).ttl = 0
+        assert [e["title"] for e in await database.get_events(1)] == ["Kickoff"]
+        assert database.degraded
+
+        writes = backend.writes
+        with pytest.raises(StorageUnavailable):
+            await database.add_event({"guild_id": 1, "title": "Retro", "date": tomorrow})
+        with pytest.raises(StorageUnavailable):
+            await database.add_fact("Rotate your keys.")
+        # Refused by the breaker, not by the backend
+        assert backend.writes == writes
+
+    asyncio.run(scenario())
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from benchmarks.fakes import FakeBot, FakeInteraction
+from bot.cogs.events import Events
+from bot.utils.database import db
+from bot.utils.dates import event_date_from_text, make_event_date
+from bot.utils.storage import MemoryBackend
+
+# (day, month, year): valid, a past year, a day February doesn't have, a 31st in a 30-day month
+DATES = [(25, 12, 2030), (1, 2, 2023), (29, 2, 2031), (31, 4, 2030), (29, 2, 2032)]
+
+
+def is_error(embed):
+    return embed["title"].startswith("❌")
+
+
+def run_commands(day, month, year):
+    """Run /sm_addevent with the date's parts and /sm_modifyevent with it typed out."""
+    async def scenario():
+        await db.connect(MemoryBackend())
+        cog = Events.__new__(Events)
+        cog.bot = FakeBot()
+        added = FakeInteraction()
+        await Events.add_event.callback(cog, added, "Kickoff", day, month, year, "First meeting")
+        modified = FakeInteraction(guild=added.guild)
+        await db.add_event({"guild_id": added.guild_id, "title": "Retro", "date": datetime(2030, 1, 1), "description": "-"})
+        await Events.modify_event.callback(cog, modified, "Retro", new_date=f"{day:02d}/{month:02d}/{year}")
+        events = {e["title"]: e for e in await db.get_events(added.guild_id)}
+        return added.sent[-1], modified.sent[-1], events
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("day, month, year", DATES)
+def test_add_and_modify_accept_and_refuse_the_same_dates(day, month, year):
+    added, modified, events = run_commands(day, month, year)
+    assert is_error(added) == is_error(modified)
+    if not is_error(added):
+        assert events["Kickoff"]["date"] == events["Retro"]["date"] == datetime(year, month, day)
+
+
+def test_typed_dates_need_every_part():
+    for text in ("25/12", "December 2030", "2030"):
+        with pytest.raises(ValueError):
+            event_date_from_text(text)
+
+
+def test_typed_dates_are_stored_at_midnight():
+    assert event_date_from_text("2030-12-25T18:30") == make_event_date(25, 12, 2030)
+    assert event_date_from_text("Dec 25 2030") == datetime(2030, 12, 25)
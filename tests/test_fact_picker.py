@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from bot.utils.fact_picker import FactPicker
+
+
+@pytest.fixture(autouse=True)
+def seeded():
+    random.seed(1234)
+
+
+def picker_with(ids):
+    picker = FactPicker(ttl=3600)
+    picker.sync(ids)
+    return picker
+
+
+def test_every_fact_is_shown_once_before_any_repeats():
+    ids = list(range(20))
+    picker = picker_with(ids)
+    for _ in range(3):
+        rotation = [picker.pick(1) for _ in ids]
+        assert sorted(rotation) == ids
+
+
+def test_guilds_have_separate_rotations():
+    ids = list(range(10))
+    picker = picker_with(ids)
+    first = [picker.pick(1) for _ in range(5)]
+    # Guild 2 still sees every fact before a repeat
+    assert sorted(picker.pick(2) for _ in ids) == ids
+    rest = [picker.pick(1) for _ in range(5)]
+    assert sorted(first + rest) == ids
+
+
+def test_a_fact_added_mid_rotation_joins_it():
+    ids = list(range(10))
+    picker = picker_with(ids)
+    seen = [picker.pick(1) for _ in range(4)]
+    picker.add("new")
+    seen += [picker.pick(1) for _ in range(7)]
+    assert sorted(seen, key=str) == sorted([*ids, "new"], key=str)
+    # The next rotation includes it too
+    assert "new" in [picker.pick(1) for _ in range(11)]
+
+
+def test_a_removed_fact_is_never_picked():
+    ids = list(range(10))
+    picker = picker_with(ids)
+    seen = [picker.pick(1) for _ in range(3)]
+    removed = next(i for i in ids if i not in seen)
+    picker.discard(removed)
+    seen += [picker.pick(1) for _ in range(6)]
+    # The rotation ends early instead of repeating or returning the removed ID
+    assert sorted(seen) == [i for i in ids if i != removed]
+    assert removed not in [picker.pick(1) for _ in range(50)]
+
+
+def test_removing_most_facts_compacts_the_pool():
+    ids = list(range(10))
+    picker = picker_with(ids)
+    picker.pick(1)
+    for fact_id in ids[:8]:
+        picker.discard(fact_id)
+    assert len(picker) == 2
+    assert set(picker.pick(1) for _ in range(20)) == {8, 9}
+
+
+def test_sync_refills_from_storage_and_keeps_rotations():
+    picker = picker_with([1, 2, 3, 4])
+    seen = [picker.pick(1), picker.pick(1)]
+    version = picker.version
+    picker.sync([1, 2, 3, 4, 5])
+    assert picker.version != version
+    seen += [picker.pick(1) for _ in range(3)]
+    assert sorted(seen) == [1, 2, 3, 4, 5]
+
+
+def test_empty_pool_picks_nothing():
+    picker = picker_with([])
+    assert picker.pick(1) is None
+    picker.add(7)
+    assert picker.pick(1) == 7
+    picker.discard(7)
+    assert picker.pick(1) is None
@@ -0,0 +1,103 @@
+import asyncio
+
+import discord
+
+from benchmarks.fakes import FakeInteraction, FakeUser
+from bot.utils.pagination import KeysetPaginator
+
+ITEMS = list(range(12))
+PAGE_SIZE = 5
+
+
+class Pages:
+    """Keyset source over ITEMS that records each query's cursor."""
+
+    def __init__(self):
+        self.starts = []
+
+    async def fetch(self, after, limit):
+        self.starts.append(after)
+        return [i for i in ITEMS if after is None or i > after][:limit]
+
+
+def render(items, page):
+    return discord.Embed(title=f"Page {page + 1}", description=",".join(map(str, items)))
+
+
+def run(scenario):
+    async def main():
+        pages = Pages()
+        owner = FakeUser()
+        view = KeysetPaginator(pages.fetch, lambda i: i, render, PAGE_SIZE, owner.id, timeout=None)
+        assert await view.load_first_page()
+        opened = FakeInteraction(user=owner)
+        await view.send(opened)
+        await scenario(view, pages, owner, opened)
+    asyncio.run(main())
+
+
+async def click(view, button, user):
+    interaction = FakeInteraction(user=user)
+    if await view.interaction_check(interaction):
+        await button.callback(interaction)
+    return interaction
+
+
+def test_cursor_moves_forward_and_back():
+    async def scenario(view, pages, owner, opened):
+        assert view.items == [0, 1, 2, 3, 4] and view.previous_page.disabled
+        await click(view, view.next_page, owner)
+        await click(view, view.next_page, owner)
+        assert view.items == [10, 11] and view.next_page.disabled and not view.previous_page.disabled
+        back = await click(view, view.previous_page, owner)
+        assert view.items == [5, 6, 7, 8, 9]
+        assert back.sent[-1]["title"] == "Page 2"
+        await click(view, view.previous_page, owner)
+        assert view.items == [0, 1, 2, 3, 4] and view.previous_page.disabled
+        # Going back re-runs the query from the cursor that page started at
+        assert pages.starts == [None, 4, 9, 4, None]
+
+    run(scenario)
+
+
+def test_other_users_cannot_turn_pages():
+    async def scenario(view, pages, owner, opened):
+        stranger = await click(view, view.next_page, FakeUser("stranger"))
+        assert view.page == 0 and pages.starts == [None]
+        assert "Only the player" in stranger.sent[-1]
+
+    run(scenario)
+
+
+def test_clicks_after_the_view_finished_are_rejected():
+    async def scenario(view, pages, owner, opened):
+        view.stop()
+        late = await click(view, view.next_page, owner)
+        assert view.page == 0 and "expired" in late.sent[-1]
+
+    run(scenario)
+
+
+def test_buttons_are_disabled_on_timeout():
+    async def scenario(view, pages, owner, opened):
+        edits = []
+
+        async def record(**kwargs):
+            edits.append(kwargs)
+        opened.edit = record
+        await view.on_timeout()
+        assert all(item.disabled for item in view.children)
+        assert edits == [{"view": view}]
+
+    run(scenario)
+
+
+def test_a_single_page_gets_no_buttons():
+    async def main():
+        view = KeysetPaginator(Pages().fetch, lambda i: i, render, 20, 1, timeout=None)
+        await view.load_first_page()
+        interaction = FakeInteraction()
+        await view.send(interaction)
+        assert view.is_finished() and view._message is None
+
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import pytest
+
+from bot.utils.ratelimit import CommandRateLimiter, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_burst_is_allowed_then_refused_with_retry_after():
+    bucket = TokenBucket(3, 30)
+    for _ in range(3):
+        assert bucket.retry_after("u", 0.0) == 0
+        bucket.take("u", 0.0)
+    # One token comes back every 10 seconds
+    assert bucket.retry_after("u", 0.0) == pytest.approx(10)
+    assert bucket.retry_after("u", 4.0) == pytest.approx(6)
+
+
+def test_tokens_refill_over_the_period():
+    bucket = TokenBucket(3, 30)
+    for _ in range(3):
+        bucket.take("u", 0.0)
+    assert bucket.retry_after("u", 10.0) == 0
+    bucket.take("u", 10.0)
+    assert bucket.retry_after("u", 10.0) == pytest.approx(10)
+    # After a whole idle period the full burst is available again
+    for _ in range(3):
+        assert bucket.retry_after("u", 40.0) == 0
+        bucket.take("u", 40.0)
+
+
+def test_keys_have_separate_buckets():
+    bucket = TokenBucket(1, 10)
+    bucket.take("a", 0.0)
+    assert bucket.retry_after("a", 0.0) > 0
+    assert bucket.retry_after("b", 0.0) == 0
+
+
+def test_idle_buckets_are_pruned():
+    bucket = TokenBucket(2, 10)
+    bucket.take("a", 0.0)
+    bucket.take("b", 5.0)
+    assert len(bucket) == 2
+    # "a" is full again at 5s, "b" not until 10s
+    assert bucket.evict_idle(6.0) == 1
+    assert len(bucket) == 1
+    # take() sweeps on its own once a period has passed
+    bucket.take("c", 20.0)
+    assert len(bucket) == 1
+
+
+def test_limiter_refuses_without_taking_the_other_token():
+    clock = Clock()
+    limiter = CommandRateLimiter({"sm_fact": (1, 10)}, {"sm_fact": (2, 10)}, clock=clock)
+    assert limiter.acquire("sm_fact", 1, 99) == (0.0, None)
+    wait, scope = limiter.acquire("sm_fact", 1, 99)
+    assert scope == "user" and wait == pytest.approx(10)
+    # The refused call didn't use the guild's second token
+    assert limiter.acquire("sm_fact", 2, 99) == (0.0, None)
+    assert limiter.acquire("sm_fact", 3, 99)[1] == "guild"
+    # Commands without a limit are never throttled
+    assert limiter.acquire("sm_help", 1, 99) == (0.0, None)
+    clock.now += 10
+    assert limiter.acquire("sm_fact", 1, 99) == (0.0, None)
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from bot.utils.database import Database
+from bot.utils.dates import start_of_today
+from bot.utils.reminders import ReminderHeap
+from bot.utils.storage import MemoryBackend
+
+START = datetime(2030, 1, 1, 12, 0, 0)
+
+
+def event(event_id, date, guild_id=1):
+    return {"_id": event_id, "title": f"Event {event_id}", "date": date, "guild_id": guild_id}
+
+
+def two_events_due_a_second_apart():
+    heap = ReminderHeap([1])
+    # With a one-hour offset, due at START + 1h and one second later
+    first, second = event(1, START + timedelta(hours=2)), event(2, START + timedelta(hours=2, seconds=1))
+    heap.load([first, second], now=START)
+    return heap
+
+
+def test_reminder_due_right_after_a_pop_is_kept():
+    heap = two_events_due_a_second_apart()
+    popped = heap.pop_due(START)
+    assert popped == []
+
+    due_first = START + timedelta(hours=1)
+    assert [r.event["_id"] for r in heap.pop_due(due_first)] == [1]
+    # The second reminder comes due while the first batch is being sent
+    assert len(heap) == 1
+    assert [r.event["_id"] for r in heap.pop_due(due_first + timedelta(seconds=1))] == [2]
+    assert len(heap) == 0
+
+
+def test_restore_puts_popped_reminders_back():
+    heap = two_events_due_a_second_apart()
+    popped = heap.pop_due(START + timedelta(hours=2))
+    assert len(popped) == 2 and len(heap) == 0
+
+    heap.restore(popped)
+    assert len(heap) == 2
+    assert heap.next_due() == START + timedelta(hours=1)
+    assert [r.event["_id"] for r in heap.pop_due(START + timedelta(hours=2))] == [1, 2]
+
+
+def test_restore_skips_events_edited_or_removed_since_the_pop():
+    heap = two_events_due_a_second_apart()
+    popped = heap.pop_due(START + timedelta(hours=2))
+
+    heap.schedule(event(1, START + timedelta(days=1)), now=START + timedelta(hours=2))
+    heap.cancel(2)
+    heap.restore(popped)
+
+    # Only event 1's rescheduled reminder is left, not the restored old one
+    assert len(heap) == 1
+    assert heap.next_due() == START + timedelta(days=1) - timedelta(hours=1)
+
+
+def test_per_event_state_is_dropped_once_reminders_are_done():
+    heap = two_events_due_a_second_apart()
+    heap.schedule(event(3, START + timedelta(days=2)), now=START)
+    heap.cancel(3)
+    heap.pop_due(START + timedelta(hours=2))
+    # The last batch can still be restored; the one before it is forgotten
+    heap.pop_due(START + timedelta(hours=3))
+    assert heap._generations == {} and heap._popped == {}
+
+
+def test_restore_skips_events_of_a_cleared_guild():
+    heap = ReminderHeap([1])
+    heap.load([event(1, START + timedelta(hours=2)), event(2, START + timedelta(hours=2), guild_id=2)], now=START)
+    popped = heap.pop_due(START + timedelta(hours=2))
+
+    heap.cancel_guild(1)
+    heap.restore(popped)
+    assert [r.event["_id"] for r in heap.pop_due(START + timedelta(hours=2))] == [2]
+
+
+
+def test_database_loads_only_kept_events():
+    async def scenario():
+        database = Database()
+        await database.connect(MemoryBackend())
+        tomorrow = start_of_today() + timedelta(days=2)
+        for guild_id in (1, 2):
+            await database.add_event({"guild_id": guild_id, "title": "Kickoff", "date": tomorrow, "description": "-"})
+        events = await database.load_reminders(keep=lambda e: e["guild_id"] == 2)
+        assert [e["guild_id"] for e in events] == [2]
+        assert len(database.reminders) == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,127 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from bot.utils.database import Database
+from bot.utils.dates import start_of_today
+from bot.utils.single_flight import SingleFlight
+from bot.utils.storage import MemoryBackend
+
+
+class SlowQuery:
+    """A query that counts its runs and finishes when released."""
+
+    def __init__(self, result=None, error=None):
+        self.runs = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.runs += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def start(flights, key, query, callers):
+    tasks = [asyncio.ensure_future(flights.do(key, query)) for _ in range(callers)]
+    # Let every caller reach the flight before it lands
+    await asyncio.sleep(0)
+    return tasks
+
+
+def test_concurrent_identical_calls_share_one_query():
+    async def scenario():
+        flights = SingleFlight()
+        query = SlowQuery(result=[1, 2, 3])
+        tasks = await start(flights, ("get_events", 1), query, 5)
+        assert len(flights) == 1
+        query.release.set()
+        results = await asyncio.gather(*tasks)
+        assert query.runs == 1
+        assert results == [[1, 2, 3]] * 5
+        assert flights.coalesced == {"get_events": 4}
+
+    asyncio.run(scenario())
+
+
+def test_different_keys_do_not_share():
+    async def scenario():
+        flights = SingleFlight()
+        query = SlowQuery(result=1)
+        tasks = [*await start(flights, ("count", 1), query, 1), *await start(flights, ("count", 2), query, 1)]
+        query.release.set()
+        await asyncio.gather(*tasks)
+        assert query.runs == 2
+
+    asyncio.run(scenario())
+
+
+def test_exception_reaches_every_waiter_and_key_is_released():
+    async def scenario():
+        flights = SingleFlight()
+        failing = SlowQuery(error=ConnectionError("down"))
+        tasks = await start(flights, ("load_board", 1), failing, 3)
+        failing.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert failing.runs == 1
+        assert len(flights) == 0
+
+        # The next call runs a fresh query instead of seeing the failure
+        retry = SlowQuery(result="ok")
+        retry.release.set()
+        assert await flights.do(("load_board", 1), retry) == "ok"
+        assert retry.runs == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_leader_hands_the_query_to_a_waiter():
+    async def scenario():
+        flights = SingleFlight()
+        query = SlowQuery(result="ok")
+        leader, follower = await start(flights, ("count",), query, 2)
+        leader.cancel()
+        await asyncio.sleep(0)
+        query.release.set()
+        assert await follower == "ok"
+        assert query.runs == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(flights) == 0
+
+    asyncio.run(scenario())
+
+
+class SlowEventsBackend(MemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def get_events(self, guild_id, since, limit):
+        await self.release.wait()
+        return await super().get_events(guild_id, since, limit)
+
+
+def test_coalesced_get_events_callers_get_their_own_list(monkeypatch):
+    monkeypatch.setattr("bot.utils.config.Config.EVENT_CACHE_TTL", 0)
+
+    async def scenario():
+        backend = SlowEventsBackend()
+        database = Database()
+        await database.connect(backend)
+        await backend.add_event({"guild_id": 1, "title": "Kickoff", "date": start_of_today() + timedelta(days=1)})
+        first, second = [asyncio.ensure_future(database.get_events(1)) for _ in range(2)]
+        await asyncio.sleep(0)
+        backend.release.set()
+        first, second = await first, await second
+        assert database.flights.coalesced == {"get_events": 1}
+        assert first == second and first is not second
+        first.clear()
+        assert len(second) == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,56 @@
+from bot.utils.title_index import TitleIndex
+
+TITLES = ["CTF Finals", "Web CTF Workshop", "ctf qualifiers", "Crypto Night", "Intro to CTFs"]
+
+
+def loaded(titles=TITLES, ttl=300):
+    index = TitleIndex(ttl)
+    index.load(titles)
+    return index
+
+
+def test_prefix_matches_ignore_case_and_spacing():
+    index = loaded()
+    assert index.search("CTF") == ["CTF Finals", "ctf qualifiers", "Intro to CTFs", "Web CTF Workshop"]
+    assert index.search("  CTF   f") == ["CTF Finals"]
+    assert index.search("") == sorted(TITLES, key=str.casefold)
+
+
+def test_prefix_matches_rank_before_substring_matches():
+    index = loaded()
+    # Both "Intro to CTFs" and "Web CTF Workshop" only contain "ctf"
+    assert index.search("ctf")[:2] == ["CTF Finals", "ctf qualifiers"]
+    assert index.search("night") == ["Crypto Night"]
+    assert index.search("workshop") == ["Web CTF Workshop"]
+    assert index.search("zzz") == []
+
+
+def test_limit_counts_both_kinds_of_match():
+    index = loaded()
+    assert index.search("ctf", limit=1) == ["CTF Finals"]
+    assert index.search("ctf", limit=3) == ["CTF Finals", "ctf qualifiers", "Intro to CTFs"]
+
+
+def test_writes_keep_the_index_current():
+    index = loaded()
+    index.add("CTF Afterparty")
+    assert index.search("ctf a") == ["CTF Afterparty"]
+    # Removed the way storage matches titles: case and spacing don't matter
+    index.remove("  ctf   FINALS ")
+    assert "CTF Finals" not in index.search("ctf")
+    index.clear()
+    assert index.search("") == [] and index.loaded
+
+
+def test_writes_before_the_first_load_are_ignored():
+    index = TitleIndex(300)
+    index.add("CTF Finals")
+    assert not index.loaded and len(index) == 0
+    index.load(["Crypto Night"])
+    assert index.search("") == ["Crypto Night"]
+
+
+def test_index_goes_stale_after_its_ttl():
+    assert TitleIndex(300).is_stale()
+    assert not loaded(ttl=300).is_stale()
+    assert loaded(ttl=0).is_stale()